@@ -0,0 +1,227 @@
+"""
+Numba kernels for the technical indicators used by FeatureEngineer.
+
+Each kernel reproduces the pandas_ta indicator of the same name (values and
+warm-up NaNs) as produced by the original pipeline, so models trained on the
+pandas_ta feature set keep receiving identical inputs. All kernels take
+contiguous float64 arrays and return float64 arrays of the same length.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _ewm_mean(x, alpha, min_periods):
+    """
+    Adjusted exponentially weighted mean, identical to
+    `pd.Series(x).ewm(alpha=alpha, min_periods=min_periods).mean()`.
+    This is pandas_ta's `rma` when alpha = 1 / length.
+    """
+    n = x.shape[0]
+    out = np.empty(n)
+    decay = 1.0 - alpha
+    weighted = np.nan
+    old_wt = 1.0
+    nobs = 0
+    for i in range(n):
+        cur = x[i]
+        is_obs = cur == cur
+        if is_obs:
+            nobs += 1
+        if weighted == weighted:
+            old_wt *= decay
+            if is_obs:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + cur) / (old_wt + 1.0)
+                old_wt += 1.0
+        elif is_obs:
+            weighted = cur
+        out[i] = weighted if nobs >= min_periods else np.nan
+    return out
+
+
+@njit(cache=True)
+def _wilder_mean(x, length):
+    """
+    Wilder's smoothing (alpha = 1 / length) seeded with the simple mean of the
+    first `length` valid values, as TA-Lib computes RSI and ATR.
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    first = 0
+    while first < n and x[first] != x[first]:
+        first += 1
+    start = first + length - 1
+    if start >= n:
+        return out
+    seed = 0.0
+    for i in range(first, start + 1):
+        seed += x[i]
+    out[start] = seed / length
+    for i in range(start + 1, n):
+        out[i] = (out[i - 1] * (length - 1) + x[i]) / length
+    return out
+
+
+@njit(cache=True)
+def _seeded_ema(x, length, start):
+    """
+    EMA (alpha = 2 / (length + 1)) seeded at index `start` with the simple
+    mean of the `length` values ending there; NaN before the seed.
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    if start >= n or start - length + 1 < 0:
+        return out
+    seed = 0.0
+    for i in range(start - length + 1, start + 1):
+        seed += x[i]
+    out[start] = seed / length
+    alpha = 2.0 / (length + 1.0)
+    for i in range(start + 1, n):
+        out[i] = alpha * x[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+
+@njit(cache=True)
+def ema(close, length):
+    """Exponential moving average seeded with the SMA of the first `length` closes -> EMA_{length}."""
+    return _seeded_ema(close, length, length - 1)
+
+
+@njit(cache=True)
+def rsi_wilder(close, length):
+    """Relative Strength Index with Wilder smoothing -> RSI_{length}."""
+    n = close.shape[0]
+    gains = np.full(n, np.nan)
+    losses = np.full(n, np.nan)
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        gains[i] = change if change > 0.0 else 0.0
+        losses[i] = -change if change < 0.0 else 0.0
+    avg_gain = _wilder_mean(gains, length)
+    avg_loss = _wilder_mean(losses, length)
+    return 100.0 * avg_gain / (avg_gain + avg_loss)
+
+
+@njit(cache=True)
+def macd(close, fast, slow, signal):
+    """
+    MACD line, histogram and signal line -> MACD_, MACDh_, MACDs_{fast}_{slow}_{signal}.
+    Both EMAs are seeded on the bar where the slow EMA first becomes valid.
+    """
+    start = slow - 1
+    line = _seeded_ema(close, fast, start) - _seeded_ema(close, slow, start)
+    signal_line = _seeded_ema(line, signal, start + signal - 1)
+    return line, line - signal_line, signal_line
+
+
+@njit(cache=True)
+def bbands(close, length, std):
+    """
+    Bollinger Bands (population std) -> BBL_, BBM_, BBU_, BBB_, BBP_{length}_{std}.
+    Window sums are updated in O(1) per bar; values are shifted by the first
+    close to keep the sum-of-squares well conditioned.
+    """
+    n = close.shape[0]
+    lower = np.full(n, np.nan)
+    mid = np.full(n, np.nan)
+    upper = np.full(n, np.nan)
+    bandwidth = np.full(n, np.nan)
+    percent = np.full(n, np.nan)
+    if n < length:
+        return lower, mid, upper, bandwidth, percent
+    shift = close[0]
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        v = close[i] - shift
+        s += v
+        s2 += v * v
+        if i >= length:
+            old = close[i - length] - shift
+            s -= old
+            s2 -= old * old
+        if i >= length - 1:
+            mean = s / length
+            var = s2 / length - mean * mean
+            dev = std * np.sqrt(var) if var > 0.0 else 0.0
+            mid[i] = mean + shift
+            lower[i] = mid[i] - dev
+            upper[i] = mid[i] + dev
+            width = upper[i] - lower[i]
+            if width == 0.0:
+                width = np.finfo(np.float64).eps
+            bandwidth[i] = 100.0 * width / mid[i]
+            percent[i] = (close[i] - lower[i]) / width
+    return lower, mid, upper, bandwidth, percent
+
+
+@njit(cache=True)
+def atr_adx(high, low, close, length):
+    """
+    Fused ATR and ADX -> ATRr_{length}, ADX_{length}, DMP_{length}, DMN_{length}.
+    True range and directional movement are computed in a single pass and the
+    smoothed ATR is shared by both indicators.
+    """
+    n = close.shape[0]
+    true_range = np.full(n, np.nan)
+    plus_dm = np.full(n, np.nan)
+    minus_dm = np.full(n, np.nan)
+    for i in range(1, n):
+        prev_close = close[i - 1]
+        true_range[i] = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+        up = high[i] - high[i - 1]
+        down = low[i - 1] - low[i]
+        plus_dm[i] = up if (up > down and up > 0.0) else 0.0
+        minus_dm[i] = down if (down > up and down > 0.0) else 0.0
+
+    atr = _wilder_mean(true_range, length)
+    # The directional movement lines use pandas' adjusted rma, as pandas_ta does
+    alpha = 1.0 / length
+    dmp = 100.0 * _ewm_mean(plus_dm, alpha, length) / atr
+    dmn = 100.0 * _ewm_mean(minus_dm, alpha, length) / atr
+    dx = 100.0 * np.abs(dmp - dmn) / (dmp + dmn)
+    adx = _ewm_mean(dx, alpha, length)
+    return atr, adx, dmp, dmn
+
+
+@njit(cache=True)
+def running_mean(x, window):
+    """Rolling mean over `window` bars, updated with a running sum in O(n)."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    s = 0.0
+    for i in range(n):
+        s += x[i]
+        if i >= window:
+            s -= x[i - window]
+        if i >= window - 1:
+            out[i] = s / window
+    return out
+
+
+@njit(cache=True)
+def running_std(x, window, ddof=1):
+    """
+    Rolling standard deviation over `window` bars using Welford's update with
+    one value entering and one leaving the window per step.
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        if i < window:
+            delta = x[i] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x[i] - mean)
+        else:
+            old = x[i - window]
+            delta = x[i] - old
+            old_mean = mean
+            mean += delta / window
+            m2 += delta * (x[i] - mean + old - old_mean)
+        if i >= window - 1:
+            out[i] = np.sqrt(m2 / (window - ddof)) if m2 > 0.0 else 0.0
+    return out
@@ -1,29 +1,57 @@
 import sys
 from pathlib import Path
-# Add project root to Python path for relative imports
-sys.path.append(str(Path(__file__).resolve().parent.parent))
+# Add project root to Python path for relative imports when run as a script;
+# imported as part of the package, the root is already importable
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
 
+import hashlib
+import os
 import pandas as pd
-import pandas_ta as ta
 import numpy as np
-from typing import List
+from typing import List, Optional
 
 from data.data_storage import DataStorage
+from ai_models._ta_kernels import rsi_wilder, macd, bbands, atr_adx, running_mean, running_std
+
+# Feature frames kept in a cache directory; the least recently used are deleted beyond this
+FEATURE_CACHE_MAX_FILES = 32
 
 class FeatureEngineer:
     """
     A class to generate a rich set of features from processed market data.
     """
-    def __init__(self, target_shift_periods: int = 5, target_threshold: float = 0.0):
+    # Bump whenever the generated feature set changes so cached frames are not reused
+    feature_set_version = 2
+
+    def __init__(self,
+                 target_shift_periods: int = 5,
+                 target_threshold: float = 0.0,
+                 cache_dir: Optional[Path] = None):
         """
         Initializes the FeatureEngineer.
 
         Args:
             target_shift_periods (int): How many periods into the future to look for the target.
             target_threshold (float): The return threshold to classify as a '1' (up).
+            cache_dir (Optional[Path]): If given, generated feature frames are cached here as
+                                        Parquet files keyed by a hash of the input data; the
+                                        FEATURE_CACHE_MAX_FILES most recently used are kept.
         """
         self.target_shift_periods = target_shift_periods
         self.target_threshold = target_threshold
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _cache_key(self, df: pd.DataFrame) -> str:
+        """Hashes the input bars and feature settings into a cache file key."""
+        key = hashlib.blake2b(digest_size=16)
+        key.update(f"{self.feature_set_version}|{self.target_shift_periods}|{self.target_threshold}".encode())
+        key.update(df.index.values.tobytes())
+        for col in ['open', 'high', 'low', 'close', 'volume']:
+            key.update(df[col].to_numpy().tobytes())
+        return key.hexdigest()
 
     def generate_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -38,38 +66,102 @@ class FeatureEngineer:
         # Ensure data is sorted by time
         df = df.sort_index()
 
-        # 1. Generate Technical Indicators using pandas_ta
-        df.ta.rsi(length=14, append=True)
-        df.ta.macd(fast=12, slow=26, signal=9, append=True)
-        df.ta.bbands(length=20, std=2, append=True)
-        df.ta.atr(length=14, append=True)
-        df.ta.adx(length=14, append=True)
+        # Identical input bars always produce identical features, so reuse a cached frame
+        cache_file = None
+        if self.cache_dir is not None:
+            cache_file = self.cache_dir / f"{self._cache_key(df)}.parquet"
+            if cache_file.exists():
+                os.utime(cache_file) # Marks the entry as recently used for pruning
+                return pd.read_parquet(cache_file)
+
+        close = df['close'].to_numpy(np.float64)
+        high = df['high'].to_numpy(np.float64)
+        low = df['low'].to_numpy(np.float64)
+        volume = df['volume'].to_numpy(np.float64)
+
+        # Indicator columns keep pandas_ta's names so existing models still line up.
+        indicator_cols = [
+            'RSI_14',
+            'MACD_12_26_9', 'MACDh_12_26_9', 'MACDs_12_26_9',
+            'BBL_20_2.0', 'BBM_20_2.0', 'BBU_20_2.0', 'BBB_20_2.0', 'BBP_20_2.0',
+            'ATRr_14', 'ADX_14', 'DMP_14', 'DMN_14',
+        ]
+        lags = [1, 3, 5, 10, 21]
+        windows = [5, 10, 20]
+        feature_cols = (indicator_cols
+                        + [f'return_lag_{lag}' for lag in lags]
+                        + [f'{stat}_{window}' for window in windows
+                           for stat in ('rolling_mean', 'rolling_std', 'rolling_vol_mean')])
+
+        # All derived features are written into one preallocated float32 block
+        # and wrapped in a single DataFrame, instead of being appended column by
+        # column. The kernels still compute in float64.
+        features = np.empty((len(df), len(feature_cols)), dtype=np.float32)
+
+        # 1. Generate Technical Indicators with the numba kernels
+        indicators = (
+            rsi_wilder(close, 14),
+            *macd(close, 12, 26, 9),
+            *bbands(close, 20, 2.0),
+            *atr_adx(high, low, close, 14),
+        )
+        for col, values in enumerate(indicators):
+            features[:, col] = values
+        col = len(indicators)
 
         # 2. Generate Lagged Returns
-        for lag in [1, 3, 5, 10, 21]:
-            df[f'return_lag_{lag}'] = df['close'].pct_change(periods=lag)
+        for lag in lags:
+            features[:lag, col] = np.nan
+            features[lag:, col] = close[lag:] / close[:-lag] - 1.0
+            col += 1
 
         # 3. Generate Rolling Statistics
-        for window in [5, 10, 20]:
-            df[f'rolling_mean_{window}'] = df['close'].rolling(window=window).mean()
-            df[f'rolling_std_{window}'] = df['close'].rolling(window=window).std()
-            df[f'rolling_vol_mean_{window}'] = df['volume'].rolling(window=window).mean()
+        # Each series is a single O(n) running-sum pass, independent of the window size.
+        for window in windows:
+            features[:, col] = running_mean(close, window)
+            features[:, col + 1] = running_std(close, window)
+            features[:, col + 2] = running_mean(volume, window)
+            col += 3
+
+        df = pd.concat([df, pd.DataFrame(features, index=df.index, columns=feature_cols)], axis=1)
 
         # 4. Generate Time-Based Features
-        df['day_of_week'] = df.index.dayofweek
-        df['month_of_year'] = df.index.month
+        # Both fit in int8 (0-6 and 1-12), an eighth of the default int64
+        df['day_of_week'] = np.asarray(df.index.dayofweek, dtype=np.int8)
+        df['month_of_year'] = np.asarray(df.index.month, dtype=np.int8)
 
         # 5. Create the Target Variable
-        # The target is the future return, shifted back to the current row.
-        future_returns = df['close'].pct_change(self.target_shift_periods).shift(-self.target_shift_periods)
-        df['target'] = (future_returns > self.target_threshold).astype(int)
+        # The target is the future return, shifted back to the current row:
+        # close[i + k] / close[i] - 1, NaN (so 0) for the last k rows.
+        n, k = len(close), self.target_shift_periods
+        future_returns = np.full(n, np.nan)
+        if k < n:
+            future_returns[:n - k] = close[k:] / close[:n - k] - 1.0
+        df['target'] = (future_returns > self.target_threshold).astype(np.int8)
 
         # Clean up the DataFrame
         # Drop rows with NaN values created by indicators and lags
         df = df.dropna()
 
+        if cache_file is not None:
+            df.to_parquet(cache_file, compression='zstd', use_dictionary=False)
+            self._prune_cache()
         return df
 
+    def _prune_cache(self):
+        """Deletes the least recently used cached frames beyond FEATURE_CACHE_MAX_FILES."""
+        with os.scandir(self.cache_dir) as entries:
+            cached = [(entry.stat().st_mtime_ns, entry.path) for entry in entries
+                      if entry.is_file() and entry.name.endswith('.parquet')]
+        if len(cached) <= FEATURE_CACHE_MAX_FILES:
+            return
+        cached.sort()
+        for _, path in cached[:len(cached) - FEATURE_CACHE_MAX_FILES]:
+            try:
+                os.remove(path)
+            except FileNotFoundError: # Already pruned by another process
+                pass
+
 # Example usage for direct execution and testing
 if __name__ == "__main__":
     print("--- Running Feature Engineering ---")
@@ -105,6 +197,6 @@ if __name__ == "__main__":
     features_path.mkdir(exist_ok=True)
     safe_symbol = symbol.replace('/', '_')
     features_file = features_path / f"{safe_symbol}_{interval}_features.parquet"
-    feature_df.to_parquet(features_file)
+    feature_df.to_parquet(features_file, compression='zstd', use_dictionary=False)
     
     print(f"\n✅ Successfully generated and saved feature data to: {features_file}")
\ No newline at end of file
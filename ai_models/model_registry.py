@@ -1,73 +1,295 @@
 import sys
 from pathlib import Path
-# Add project root to Python path for relative imports
-sys.path.append(str(Path(__file__).resolve().parent.parent))
+# Add project root to Python path for relative imports when run as a script;
+# imported as part of the package, the root is already importable
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 
+import os
+import time
+import bisect
 import joblib
+import numpy as np
+import orjson
 from pathlib import Path
-from typing import Dict, Any, Tuple
-import json
+from typing import Dict, Any, List, Optional, Tuple
+from contextlib import contextmanager
 from datetime import datetime
+import lightgbm as lgb
+from xgboost import XGBClassifier
+from lightgbm import LGBMClassifier
+
+try:
+    import fcntl
+except ImportError: # Windows: index writes stay atomic but are not locked across processes
+    fcntl = None
+
+# File suffix used by each serializer; boosters are stored in their native formats
+MODEL_SUFFIXES = {
+    'xgboost_ubj': '.ubj',
+    'lightgbm_txt': '.txt',
+    'joblib': '.joblib',
+}
+METADATA_SUFFIX = '_metadata.json'
+INDEX_FILENAME = '_index.json'
+LOCK_FILENAME = '_index.lock'
+# Headline metrics copied into the index so versions can be compared without opening metadata files
+INDEX_METRICS = ('accuracy', 'precision', 'recall', 'training_date')
+
+@contextmanager
+def _index_lock(lock_path: Path, exclusive: bool):
+    """Holds an advisory lock on the registry index while the block runs (no-op without fcntl)."""
+    with open(lock_path, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+
+def _parse_file_stem(stem: str) -> Optional[Tuple[str, int]]:
+    """
+    Splits a registry file stem into (safe_model_name, timestamp_ns). Handles both
+    {name}_{timestamp_ns} and the older {name}_{YYYYmmdd}_{HHMMSS} naming.
+    """
+    head, _, stamp = stem.rpartition('_')
+    if not head or not stamp.isdigit():
+        return None
+    if len(stamp) == 6:
+        name, _, day = head.rpartition('_')
+        try:
+            saved_at = datetime.strptime(day + stamp, "%Y%m%d%H%M%S")
+        except ValueError:
+            return None
+        return name, int(saved_at.timestamp()) * 1_000_000_000
+    return head, int(stamp)
+
+class LightGBMBoosterModel:
+    """
+    Minimal classifier interface around a LightGBM Booster loaded from its
+    native text format, exposing the predict/predict_proba calls used by strategies
+    and the fitted attributes of LGBMClassifier they read (classes_, n_features_in_).
+    """
+    def __init__(self, booster: lgb.Booster):
+        self.booster_ = booster
+        # The native format keeps no class labels; the registry's classifiers are trained
+        # on labels 0..n-1. A binary objective has one tree per iteration for two classes.
+        n_classes = booster.num_model_per_iteration()
+        self.classes_ = np.arange(n_classes if n_classes > 1 else 2)
+        self.n_features_in_ = booster.num_feature()
+
+    def predict_proba(self, X) -> np.ndarray:
+        probabilities = self.booster_.predict(X)
+        if probabilities.ndim == 1: # Binary objective returns P(class 1) only
+            probabilities = np.column_stack([1.0 - probabilities, probabilities])
+        return probabilities
+
+    def predict(self, X) -> np.ndarray:
+        return self.predict_proba(X).argmax(axis=1)
 
 class ModelRegistry:
     """
     Manages saving and loading of trained machine learning models and their metadata.
+
+    Saved versions are tracked in a sidecar index file (`_index.json`) mapping each
+    model name to its versions ordered by save time, so lookups never scan the
+    registry directory. Index updates are serialized with a file lock for
+    processes training in parallel.
     """
-    def __init__(self, registry_path: str = "ai_models/registry/saved_models"):
+    def __init__(self, registry_path: Optional[str] = None):
         """
         Initializes the ModelRegistry.
+
+        Args:
+            registry_path (Optional[str]): Directory holding the models; defaults to
+                                           ai_models/saved_models next to this file.
         """
-        # Note: The path is relative to this file's location
-        self.registry_path = Path(__file__).parent / "saved_models"
+        if registry_path is None:
+            self.registry_path = Path(__file__).parent / "saved_models"
+        else:
+            self.registry_path = Path(registry_path)
         self.registry_path.mkdir(parents=True, exist_ok=True)
+        self._index: Dict[str, List[Dict[str, Any]]] = {}
+        self._index_mtime_ns = None
+        self._refresh_index()
+
+    @property
+    def _index_path(self) -> Path:
+        return self.registry_path / INDEX_FILENAME
 
-    def save_model(self, model: Any, model_name: str, metrics: Dict[str, Any]):
+    @property
+    def _lock_path(self) -> Path:
+        return self.registry_path / LOCK_FILENAME
+
+    def _scan_registry(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Builds the index from the files on disk with a single directory scan.
+        Only needed for registries written before the index existed.
+        """
+        model_suffixes = set(MODEL_SUFFIXES.values())
+        model_files, metadata_files = [], set()
+        with os.scandir(self.registry_path) as entries:
+            for entry in entries:
+                if entry.name.endswith(METADATA_SUFFIX):
+                    metadata_files.add(entry.name)
+                elif os.path.splitext(entry.name)[1] in model_suffixes:
+                    model_files.append(entry.name)
+
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        for model_file in model_files:
+            stem = os.path.splitext(model_file)[0]
+            parsed = _parse_file_stem(stem)
+            if parsed is None:
+                continue
+            safe_model_name, timestamp_ns = parsed
+            metadata_file = stem + METADATA_SUFFIX
+            metrics = {}
+            if metadata_file in metadata_files:
+                with open(self.registry_path / metadata_file, 'rb') as f:
+                    metrics = orjson.loads(f.read()).get('metrics', {})
+            else:
+                metadata_file = None
+            index.setdefault(safe_model_name, []).append({
+                'timestamp_ns': timestamp_ns,
+                'model_file': model_file,
+                'metadata_file': metadata_file,
+                'metrics': {key: metrics[key] for key in INDEX_METRICS if key in metrics},
+            })
+        for versions in index.values():
+            versions.sort(key=lambda version: version['timestamp_ns'])
+        return index
+
+    def _read_index(self) -> Dict[str, List[Dict[str, Any]]]:
+        with open(self._index_path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    def _write_index(self, index: Dict[str, List[Dict[str, Any]]]):
+        """Atomically replaces the index file. Callers must hold the exclusive lock."""
+        tmp_path = self._index_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(index, option=orjson.OPT_SERIALIZE_NUMPY))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._index_path)
+
+    def _refresh_index(self):
+        """Reloads the index if it changed on disk, creating it on first use."""
+        try:
+            mtime_ns = os.stat(self._index_path).st_mtime_ns
+        except FileNotFoundError:
+            with _index_lock(self._lock_path, exclusive=True):
+                if not self._index_path.exists():
+                    self._write_index(self._scan_registry())
+            mtime_ns = os.stat(self._index_path).st_mtime_ns
+        if mtime_ns != self._index_mtime_ns:
+            with _index_lock(self._lock_path, exclusive=False):
+                self._index = self._read_index()
+            self._index_mtime_ns = mtime_ns
+
+    def metadata_paths(self, name_prefix: str = "") -> List[Path]:
+        """Returns the metadata files of all saved models whose name starts with name_prefix."""
+        self._refresh_index()
+        return [self.registry_path / version['metadata_file']
+                for safe_model_name, versions in self._index.items()
+                if safe_model_name.startswith(name_prefix)
+                for version in versions
+                if version['metadata_file'] is not None]
+
+    def save_model(self,
+                   model: Any,
+                   model_name: str,
+                   metrics: Dict[str, Any],
+                   timestamp_ns: Optional[int] = None):
         """
         Saves a trained model and its metadata to the registry.
+        XGBoost and LightGBM models are stored in their native formats (UBJSON and
+        text respectively); any other model is pickled with joblib.
+
+        Args:
+            timestamp_ns (Optional[int]): Version timestamp in nanoseconds. Pass the same
+                                          value for models trained together so they share
+                                          one version; defaults to the current time.
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Nanosecond timestamps keep versions saved within the same second distinct
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
         safe_model_name = model_name.replace('/', '_')
         
         # Save the model object
-        model_filename = f"{safe_model_name}_{timestamp}.joblib"
+        if isinstance(model, XGBClassifier):
+            serializer = 'xgboost_ubj'
+        elif isinstance(model, LGBMClassifier):
+            serializer = 'lightgbm_txt'
+        else:
+            serializer = 'joblib'
+        model_filename = f"{safe_model_name}_{timestamp_ns}{MODEL_SUFFIXES[serializer]}"
         model_filepath = self.registry_path / model_filename
-        joblib.dump(model, model_filepath)
+        if serializer == 'xgboost_ubj':
+            model.save_model(model_filepath)
+        elif serializer == 'lightgbm_txt':
+            model.booster_.save_model(str(model_filepath))
+        else:
+            joblib.dump(model, model_filepath)
         
         # Save the metadata
         metadata = {
             'model_name': model_name,
-            'saved_at': timestamp,
+            'saved_at': datetime.fromtimestamp(timestamp_ns / 1e9).strftime("%Y%m%d_%H%M%S"),
             'metrics': metrics,
-            'model_filepath': str(model_filepath)
+            'model_filepath': str(model_filepath),
+            'serializer': serializer
         }
-        metadata_filename = f"{safe_model_name}_{timestamp}_metadata.json"
+        metadata_filename = f"{safe_model_name}_{timestamp_ns}{METADATA_SUFFIX}"
         metadata_filepath = self.registry_path / metadata_filename
-        with open(metadata_filepath, 'w') as f:
-            json.dump(metadata, f, indent=2)
-            
+        with open(metadata_filepath, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
+        # Record the version in the index; re-read under the lock so concurrent saves are kept
+        self._refresh_index()
+        version = {
+            'timestamp_ns': timestamp_ns,
+            'model_file': model_filename,
+            'metadata_file': metadata_filename,
+            'metrics': {key: metrics[key] for key in INDEX_METRICS if key in metrics},
+        }
+        with _index_lock(self._lock_path, exclusive=True):
+            index = self._read_index()
+            bisect.insort(index.setdefault(safe_model_name, []), version,
+                          key=lambda entry: entry['timestamp_ns'])
+            self._write_index(index)
+            self._index = index
+            self._index_mtime_ns = os.stat(self._index_path).st_mtime_ns
         print(f"Saved model '{model_name}' to: {model_filepath}")
 
+    def _load_model_file(self, model_path: Path) -> Any:
+        """Reconstructs a model from a registry file based on its serializer suffix."""
+        if model_path.suffix == MODEL_SUFFIXES['xgboost_ubj']:
+            model = XGBClassifier()
+            model.load_model(model_path)
+            return model
+        if model_path.suffix == MODEL_SUFFIXES['lightgbm_txt']:
+            return LightGBMBoosterModel(lgb.Booster(model_file=str(model_path)))
+        return joblib.load(model_path)
+
     def load_latest_model(self, model_name: str) -> Tuple[Any, Dict]:
         """
         Loads the most recent version of a model from the registry.
         """
         safe_model_name = model_name.replace('/', '_')
-        model_files = sorted(self.registry_path.glob(f"{safe_model_name}_*.joblib"), reverse=True)
+        self._refresh_index()
+        versions = self._index.get(safe_model_name)
         
-        if not model_files:
+        if not versions:
             print(f"No model found for name '{model_name}' in registry.")
             return None, None
             
-        latest_model_path = model_files[0]
-        model = joblib.load(latest_model_path)
+        latest = versions[-1]
+        latest_model_path = self.registry_path / latest['model_file']
+        model = self._load_model_file(latest_model_path)
         
         # Load corresponding metadata
-        metadata_path = latest_model_path.with_suffix('.json').with_name(latest_model_path.stem + '_metadata.json')
         metadata = {}
-        if metadata_path.exists():
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
+        if latest['metadata_file'] is not None:
+            with open(self.registry_path / latest['metadata_file'], 'rb') as f:
+                metadata = orjson.loads(f.read())
                 
         print(f"Loaded model '{model_name}' from: {latest_model_path}")
         return model, metadata
@@ -96,5 +318,5 @@ if __name__ == '__main__':
     assert loaded_model is not None, "Failed to load model."
     assert metadata['metrics']['accuracy'] == 0.98, "Metadata mismatch."
     print("\nLoaded Model Metadata:")
-    print(json.dumps(metadata, indent=2))
+    print(orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode())
     print("\n✅ Model Registry test successful!")
\ No newline at end of file
@@ -1,13 +1,19 @@
 import sys
 from pathlib import Path
-# Add project root to Python path for relative imports
-sys.path.append(str(Path(__file__).resolve().parent.parent))
+# Add project root to Python path for relative imports when run as a script;
+# imported as part of the package, the root is already importable
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 
+import os
+import time
 import pandas as pd
+import numpy as np
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
 from datetime import datetime
+from joblib import Parallel, delayed
 
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, precision_score, recall_score
@@ -16,6 +22,11 @@ from lightgbm import LGBMClassifier
 from sklearn.ensemble import RandomForestClassifier
 
 from ai_models.model_registry import ModelRegistry
+from data.data_storage import read_parquet_frame
+
+def _fit_model(model: Any, X_train: pd.DataFrame, y_train: pd.Series) -> Any:
+    """Fits a single model; runs in a joblib worker and returns the fitted copy."""
+    return model.fit(X_train, y_train)
 
 class ModelTrainer:
     """
@@ -24,7 +35,7 @@ class ModelTrainer:
     def __init__(self, registry: ModelRegistry):
         self.registry = registry
         self.models = {
-            'xgb': XGBClassifier(use_label_encoder=False, eval_metric='logloss'),
+            'xgb': XGBClassifier(use_label_encoder=False, eval_metric='logloss', tree_method='hist'),
             'lgbm': LGBMClassifier(),
             'random_forest': RandomForestClassifier()
         }
@@ -36,20 +47,32 @@ class ModelTrainer:
         feature_file = features_path / f"{safe_symbol}_{interval}_features.parquet"
         if not feature_file.exists():
             raise FileNotFoundError(f"Feature file not found: {feature_file}")
-        return pd.read_parquet(feature_file)
+        return read_parquet_frame(feature_file)
 
     def train_and_evaluate(self, 
                            symbol: str, 
                            interval: str, 
                            model_types: List[str] = ['xgb', 'lgbm'],
-                           test_size: float = 0.2) -> Dict[str, Dict]:
+                           test_size: float = 0.2,
+                           feature_df: Optional[pd.DataFrame] = None) -> Dict[str, Dict]:
         """
         Trains multiple models and returns their performance metrics.
+
+        Args:
+            feature_df (Optional[pd.DataFrame]): Already engineered features, e.g. straight
+                                                 from FeatureEngineer. If None, the saved
+                                                 feature file for symbol/interval is loaded.
         """
         # 1. Load data and define features (X) and target (y)
-        feature_df = self._load_feature_data(symbol, interval)
-        X = feature_df.drop(columns=['target'])
-        y = feature_df['target']
+        # Boosters work in float32 internally, so hand them float32 directly.
+        # The features are laid out once as a single C-contiguous block; the train/test
+        # splits are row views of it, so every model reads the same memory without copying.
+        if feature_df is None:
+            feature_df = self._load_feature_data(symbol, interval)
+        feature_cols = feature_df.columns.drop('target')
+        X = pd.DataFrame(np.ascontiguousarray(feature_df[feature_cols].to_numpy(np.float32)),
+                         index=feature_df.index, columns=feature_cols)
+        y = feature_df['target'].astype(np.int8, copy=False)
 
         # 2. Perform time-series split (no shuffling)
         X_train, X_test, y_train, y_test = train_test_split(
@@ -57,33 +80,50 @@ class ModelTrainer:
         )
         print(f"Data split: {len(X_train)} training samples, {len(y_test)} testing samples.")
 
-        # 3. Train each model
-        all_metrics = {}
+        # 3. Train the models in parallel, one worker process per model
+        to_train = []
         for model_type in model_types:
-            print(f"\n--- Training model: {model_type} ---")
-            model = self.models.get(model_type)
-            if model is None:
+            if model_type not in self.models:
                 print(f"Warning: Unknown model type '{model_type}'. Skipping.")
                 continue
+            to_train.append(model_type)
+        if not to_train:
+            return {}
+
+        # Split the cores between the workers so their thread pools don't oversubscribe
+        n_threads = max(1, (os.cpu_count() or 1) // len(to_train))
+        for model_type in to_train:
+            self.models[model_type].set_params(n_jobs=n_threads)
+
+        print(f"\n--- Training models: {', '.join(to_train)} ---")
+        fitted_models = Parallel(n_jobs=len(to_train), backend='loky')(
+            delayed(_fit_model)(self.models[model_type], X_train, y_train) for model_type in to_train
+        )
+
+        # All models of one batch share the training date and registry version
+        safe_symbol = symbol.replace('/', '_')
+        feature_names = list(X.columns)
+        training_date = datetime.now()
+        timestamp_ns = time.time_ns()
+        all_metrics = {}
+        for model_type, model in zip(to_train, fitted_models):
+            self.models[model_type] = model
 
-            # Train the model
-            model.fit(X_train, y_train)
-            
             # Evaluate the model
             y_pred = model.predict(X_test)
             metrics = {
                 'accuracy': accuracy_score(y_test, y_pred),
                 'precision': precision_score(y_test, y_pred),
                 'recall': recall_score(y_test, y_pred),
-                'training_date': datetime.now().isoformat(),
+                'training_date': training_date.isoformat(),
                 'train_size': len(X_train),
                 'test_size': len(X_test),
-                'features_used': list(X.columns)
+                'features_used': feature_names
             }
             
             # Save the trained model to the registry
-            model_name = f"{symbol.replace('/', '_')}_{interval}_{model_type}"
-            self.registry.save_model(model, model_name, metrics)
+            model_name = f"{safe_symbol}_{interval}_{model_type}"
+            self.registry.save_model(model, model_name, metrics, timestamp_ns=timestamp_ns)
             all_metrics[model_name] = metrics
             
         return all_metrics
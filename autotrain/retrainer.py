@@ -1,11 +1,10 @@
-import sys
-from pathlib import Path
-
-# Add project root to Python path for relative imports
-sys.path.append(str(Path(__file__).resolve().parent.parent))
-
-import json
+import asyncio
+import orjson
+import pandas as pd
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
+from typing import List, Optional
 from pathlib import Path
 import sys
 # Adjust sys.path to allow imports from the project root
@@ -40,12 +39,13 @@ class AutoRetrainer:
         self.data_adapter = YahooFinanceAdapter() # Assuming Yahoo Finance for data source in retraining
         self.data_processor = DataProcessor()
         self.data_storage = DataStorage()
-        self.feature_engineer = FeatureEngineer()
         self.model_registry = ModelRegistry()
         self.model_trainer = ModelTrainer(self.model_registry)
         
         # Path to where feature-engineered data is saved
         self.features_data_path = project_root_path / "data" / "features"
+        # Scheduled re-runs over unchanged bars reuse the cached features
+        self.feature_engineer = FeatureEngineer(cache_dir=self.features_data_path / "_cache")
         self.logger = get_logger("error") # Use the error logger for retraining events
     def get_model_metadata(self, symbol: str, interval: str) -> list:
         """
@@ -53,14 +53,14 @@ class AutoRetrainer:
         This helps in determining the last training date and historical performance.
         """
         safe_symbol = symbol.replace('/', '_') # Sanitize symbol for filename
-        # Get all metadata files for this symbol-interval combination
-        model_files = self.model_registry.registry_path.glob(f"{safe_symbol}_{interval}_*_metadata.json")
+        # Get all metadata files for this symbol-interval combination from the registry index
+        model_files = self.model_registry.metadata_paths(f"{safe_symbol}_{interval}_")
         metadata_list = []
         for file in model_files:
             try:
-                with open(file, 'r') as f:
-                    metadata_list.append(json.load(f))
-            except json.JSONDecodeError as e:
+                with open(file, 'rb') as f:
+                    metadata_list.append(orjson.loads(f.read()))
+            except orjson.JSONDecodeError as e:
                 self.logger.error(f"Error decoding JSON from metadata file {file}: {e}")
         return metadata_list
     def check_retraining_trigger(self, 
@@ -90,60 +90,85 @@ class AutoRetrainer:
             return True
             
         return False
-    def run_retraining_pipeline(self, symbol: str, interval: str):
+    async def _prepare_features(self, symbol: str, interval: str) -> Optional[pd.DataFrame]:
         """
-        Executes the full data fetching, feature engineering, and model training pipeline.
-        This updates the models in the registry with fresh data.
+        Fetches, processes and feature-engineers fresh data for one symbol, saving the
+        processed bars. Blocking network, CPU and disk work runs in
+        worker threads so several symbols can be prepared concurrently.
+        Returns None if a step produced no data.
+        """
+        # 1. Fetch latest raw data from the adapter
+        print(f"Step 1: Fetching latest data for {symbol}...")
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=365 * 2) # Fetch 2 years of historical data for retraining
+        raw_data = await asyncio.to_thread(
+            self.data_adapter.fetch_historical_data, symbol, start_date, end_date, interval
+        )
+        if raw_data.empty:
+            print("Failed to fetch data or no new data available. Aborting retraining.")
+            self.logger.warning(f"No new raw data for {symbol} {interval}. Retraining aborted.")
+            return None
+        self.logger.info(f"Fetched {len(raw_data)} rows of raw data for {symbol}.")
+        # 2. Process (clean and normalize) the raw data
+        print(f"Step 2: Processing data for {symbol}...")
+        processed_data, processing_metrics = await asyncio.to_thread(
+            self.data_processor.process_data, raw_data, symbol
+        )
+        if processed_data.empty:
+            print("Processing resulted in empty data. Aborting retraining.")
+            self.logger.error(f"Processed data for {symbol} {interval} is empty. Retraining aborted.")
+            return None
+        self.logger.info(f"Processed data for {symbol}. Final rows: {len(processed_data)}. Metrics: {processing_metrics}")
+        
+        # 3. Save the processed data to the data storage while
+        # 4. features are engineered from it (neither modifies processed_data)
+        print(f"Step 3/4: Saving processed data and engineering features for {symbol}...")
+        _, feature_df = await asyncio.gather(
+            asyncio.to_thread(self.data_storage.save_data, processed_data, symbol, interval),
+            asyncio.to_thread(self.feature_engineer.generate_features, processed_data),
+        )
+        self.logger.info(f"Saved processed data for {symbol}.")
+        if feature_df.empty:
+            print("Feature engineering resulted in empty data. Aborting retraining.")
+            self.logger.error(f"Feature-engineered data for {symbol} {interval} is empty. Retraining aborted.")
+            return None
+        self.logger.info(f"Engineered {len(feature_df.columns)} features for {symbol}.")
+        return feature_df
+    def _save_features(self, feature_df: pd.DataFrame, symbol: str, interval: str):
+        """Saves the new feature set (overwrites old one)."""
+        self.features_data_path.mkdir(parents=True, exist_ok=True)
+        features_file = self.features_data_path / f"{symbol.replace('/', '_')}_{interval}_features.parquet"
+        feature_df.to_parquet(features_file, compression='zstd', use_dictionary=False)
+        self.logger.info(f"Saved {len(feature_df.columns)} features for {symbol} to {features_file}.")
+    async def run_retraining_pipeline_async(self, symbol: str, interval: str,
+                                            training_executor: Optional[Executor] = None):
+        """
+        Coroutine version of `run_retraining_pipeline`. Data preparation for
+        concurrently running pipelines overlaps; pass them one single-worker
+        `training_executor` to queue their model trainings, since each training run
+        already uses every core. Without one, the training runs in its own worker thread.
         """
         print(f"\n--- Starting Retraining Pipeline for {symbol} {interval} ---")
         self.logger.info(f"Initiating full retraining pipeline for {symbol} {interval}.")
         
         try:
-            # 1. Fetch latest raw data from the adapter
-            print("Step 1: Fetching latest data...")
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=365 * 2) # Fetch 2 years of historical data for retraining
-            raw_data = self.data_adapter.fetch_historical_data(symbol, start_date, end_date, interval)
-            if raw_data.empty:
-                print("Failed to fetch data or no new data available. Aborting retraining.")
-                self.logger.warning(f"No new raw data for {symbol} {interval}. Retraining aborted.")
-                return
-            self.logger.info(f"Fetched {len(raw_data)} rows of raw data for {symbol}.")
-            # 2. Process (clean and normalize) the raw data
-            print("Step 2: Processing data...")
-            processed_data, processing_metrics = self.data_processor.process_data(raw_data, symbol)
-            if processed_data.empty:
-                print("Processing resulted in empty data. Aborting retraining.")
-                self.logger.error(f"Processed data for {symbol} {interval} is empty. Retraining aborted.")
-                return
-            self.logger.info(f"Processed data for {symbol}. Final rows: {len(processed_data)}. Metrics: {processing_metrics}")
-            
-            # 3. Save the processed data to the data storage
-            # (Optional, but good practice to keep processed data up-to-date)
-            self.data_storage.save_data(processed_data, symbol, interval)
-            self.logger.info(f"Saved processed data for {symbol}.")
-            
-            # 4. Engineer features from the processed data
-            print("Step 4: Engineering features...")
-            feature_df = self.feature_engineer.generate_features(processed_data)
-            if feature_df.empty:
-                print("Feature engineering resulted in empty data. Aborting retraining.")
-                self.logger.error(f"Feature-engineered data for {symbol} {interval} is empty. Retraining aborted.")
+            feature_df = await self._prepare_features(symbol, interval)
+            if feature_df is None:
                 return
-            
-            # Save the new feature set (overwrites old one)
-            self.features_data_path.mkdir(parents=True, exist_ok=True)
-            features_file = self.features_data_path / f"{symbol.replace('/', '_')}_{interval}_features.parquet"
-            feature_df.to_parquet(features_file)
-            self.logger.info(f"Engineered and saved {len(feature_df.columns)} features for {symbol}.")
-            # 5. Train new models using the updated features
-            print("Step 5: Training new models...")
+            # 5. Train new models on the in-memory features while they are persisted
+            print(f"Step 5: Training new models for {symbol}...")
             # 'xgb' and 'lgbm' are typically good general-purpose models
-            trained_model_metrics = self.model_trainer.train_and_evaluate(
-                symbol=symbol, interval=interval, model_types=['xgb', 'lgbm']
+            _, trained_model_metrics = await asyncio.gather(
+                asyncio.to_thread(self._save_features, feature_df, symbol, interval),
+                asyncio.get_running_loop().run_in_executor(
+                    training_executor,
+                    partial(self.model_trainer.train_and_evaluate,
+                            symbol=symbol, interval=interval, model_types=['xgb', 'lgbm'],
+                            feature_df=feature_df)
+                ),
             )
             
-            print("\n--- Retraining Pipeline Complete ---")
+            print(f"\n--- Retraining Pipeline Complete for {symbol} {interval} ---")
             self.logger.info(f"Retraining pipeline for {symbol} {interval} successfully completed.")
             print("New models have been trained and saved to the registry.")
             print("Summary of new model performance:")
@@ -152,6 +177,24 @@ class AutoRetrainer:
         except Exception as e:
             self.logger.exception(f"An unexpected error occurred during the retraining pipeline for {symbol} {interval}: {e}")
             print(f"An error occurred during retraining. Check the logs for details.")
+    def run_retraining_pipeline(self, symbol: str, interval: str):
+        """
+        Executes the full data fetching, feature engineering, and model training pipeline.
+        This updates the models in the registry with fresh data.
+        """
+        asyncio.run(self.run_retraining_pipeline_async(symbol, interval))
+    def run_retraining_pipelines(self, symbols: List[str], interval: str):
+        """
+        Retrains models for several symbols, fetching and preparing their data
+        concurrently so the total time is dominated by the slowest fetch rather than
+        the sum of all of them. Trainings run one at a time on a worker that is shut
+        down once every pipeline has finished.
+        """
+        async def run_all(training_executor: Executor):
+            await asyncio.gather(*(self.run_retraining_pipeline_async(symbol, interval, training_executor)
+                                   for symbol in symbols))
+        with ThreadPoolExecutor(max_workers=1) as training_executor:
+            asyncio.run(run_all(training_executor))
 # Example usage for direct execution and testing of the AutoRetrainer
 if __name__ == "__main__":
     print("--- Testing AutoRetrainer Module ---")
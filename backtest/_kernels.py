@@ -0,0 +1,110 @@
+"""
+Numba kernels for the Backtester.
+
+The trade simulation is a sequential state machine (cash and position carry
+from bar to bar), so it cannot be vectorized with NumPy; it is compiled instead.
+Where Numba is not installed the same functions run as plain Python loops.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def simulate_portfolio(price, signal_code, initial_capital, commission, slippage, risk_per_trade):
+    """
+    Steps a long-only portfolio through the bars.
+
+    Args:
+        price: float64 close prices.
+        signal_code: int8 signals per bar; 1 = BUY, -1 = SELL, 0 = none.
+        initial_capital: Starting cash.
+        commission: Fixed commission per trade.
+        slippage: Fractional slippage applied against each fill.
+        risk_per_trade: Fraction of cash spent on each buy.
+
+    Returns:
+        holdings, cash, total: float64 arrays with the value of the position,
+        the cash balance and their sum after each bar.
+    """
+    n = price.shape[0]
+    holdings = np.empty(n)
+    cash_values = np.empty(n)
+    total = np.empty(n)
+    cash = initial_capital
+    position = 0.0
+    for i in range(n):
+        code = signal_code[i]
+        if code == 1 and cash > 0:
+            # Risk fixed fraction of cash per trade, buying at the slipped price
+            buy_price = price[i] * (1 + slippage)
+            quantity_to_buy = (cash * risk_per_trade) / buy_price
+            cash -= quantity_to_buy * buy_price
+            cash -= commission
+            position += quantity_to_buy
+        elif code == -1 and position > 0:
+            # Sell entire position at the slipped price
+            cash += position * (price[i] * (1 - slippage))
+            cash -= commission
+            position = 0.0
+        holdings[i] = position * price[i]
+        cash_values[i] = cash
+        total[i] = cash + holdings[i]
+    return holdings, cash_values, total
+
+
+# NumPy's error model makes a zero equity divide to inf/NaN, as in pandas, instead of raising
+@njit(cache=True, error_model='numpy')
+def equity_stats(total):
+    """
+    Drawdown and return statistics of an equity curve in a single pass.
+
+    Per-bar returns are total[i] / total[i - 1] - 1, with 0 for the first bar,
+    as `total.pct_change().fillna(0)`.
+
+    Returns:
+        max_drawdown: Most negative (total - running max) / running max.
+        mean_return: Mean of the returns.
+        volatility: Sample standard deviation (ddof=1) of the returns.
+        downside_volatility: Sample standard deviation of the negative returns;
+                             NaN with fewer than two of them.
+    """
+    n = total.shape[0]
+    running_max = total[0]
+    max_drawdown = 0.0
+    # Welford accumulators for all returns and for the negative returns
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    down_count = 0
+    down_mean = 0.0
+    down_m2 = 0.0
+    for i in range(n):
+        value = total[i]
+        if value > running_max:
+            running_max = value
+        drawdown = (value - running_max) / running_max
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+
+        r = value / total[i - 1] - 1.0 if i > 0 else 0.0
+        count += 1
+        delta = r - mean
+        mean += delta / count
+        m2 += delta * (r - mean)
+        if r < 0.0:
+            down_count += 1
+            delta = r - down_mean
+            down_mean += delta / down_count
+            down_m2 += delta * (r - down_mean)
+
+    volatility = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+    downside_volatility = np.sqrt(down_m2 / (down_count - 1)) if down_count > 1 else np.nan
+    return max_drawdown, mean, volatility, downside_volatility
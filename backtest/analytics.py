@@ -1,61 +1,100 @@
+import sys
+from pathlib import Path
+
+# Add project root to Python path for relative imports when run as a script;
+# imported as part of the package, the root is already importable
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+
 import pandas as pd
 import numpy as np
+import matplotlib
+# Reports are only ever saved to files, so skip GUI backend initialization
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-from pathlib import Path
 from typing import Dict
 
+from backtest.metrics import compute_metrics
+
+# Portfolio history columns used by the metrics and plots (besides the timestamp index)
+ANALYTICS_COLUMNS = ['price', 'signal', 'total']
+
 class Analytics:
     """
-    Analyzes the results of a backtest from a portfolio history CSV file.
+    Analyzes the results of a backtest from a portfolio history Parquet (or legacy CSV) file.
     """
     def __init__(self, results_path: Path):
         """
         Initializes the Analytics engine.
 
         Args:
-            results_path (Path): The path to the backtest results CSV file.
+            results_path (Path): The path to the backtest results .parquet or .csv file.
         """
         if not results_path.exists():
             raise FileNotFoundError(f"Results file not found: {results_path}")
         
         self.results_path = results_path
-        self.portfolio_history = pd.read_csv(results_path, index_col='timestamp', parse_dates=True)
+        # Only the columns the metrics and plots use are read
+        if results_path.suffix == '.parquet':
+            self.portfolio_history = pd.read_parquet(results_path, engine='pyarrow', columns=ANALYTICS_COLUMNS)
+        else:
+            # Legacy CSV results: the Arrow reader tokenizes and parses timestamps in C++
+            history = pd.read_csv(results_path, engine='pyarrow', usecols=['timestamp'] + ANALYTICS_COLUMNS)
+            history['timestamp'] = pd.to_datetime(history['timestamp'], utc=True, cache=True).astype('datetime64[ns, UTC]')
+            self.portfolio_history = history.set_index('timestamp')
+        # Shrink the columns that are only plotted or counted; 'total' stays float64
+        # because the return-based metrics need its full precision
+        self.portfolio_history = self.portfolio_history.astype({'price': np.float32, 'signal': 'category'}, copy=False)
         self.metrics = {}
         self.report_name = results_path.stem # e.g., "ema_crossover_AAPL_1d"
+        # Derived arrays, computed on first use and shared by the metrics and the plots
+        self._equity = None
+        self._drawdown = None
+
+    def _equity_values(self) -> np.ndarray:
+        """The 'total' column as a float64 array."""
+        if self._equity is None:
+            self._equity = self.portfolio_history['total'].to_numpy(dtype=np.float64)
+        return self._equity
+
+    def _drawdown_values(self) -> np.ndarray:
+        """Drawdown from the running maximum at each bar, as a fraction."""
+        if self._drawdown is None:
+            equity = self._equity_values()
+            rolling_max = np.maximum.accumulate(equity)
+            self._drawdown = (equity - rolling_max) / rolling_max
+        return self._drawdown
 
     def calculate_all_metrics(self) -> Dict:
         """Calculates a comprehensive set of performance metrics."""
         if self.portfolio_history.empty:
             return {}
 
-        # Basic returns
-        total_return = (self.portfolio_history['total'].iloc[-1] / self.portfolio_history['total'].iloc[0]) - 1
+        # Returns, drawdown, volatility and downside volatility in one pass over the equity curve
+        stats = compute_metrics(self._equity_values())
+        total_return = stats['total_return']
+        max_drawdown = stats['max_drawdown']
+        volatility = stats['volatility']
+        downside_volatility = stats['downside_volatility']
         
         # Time-based calculations
         days = (self.portfolio_history.index[-1] - self.portfolio_history.index[0]).days
         annualized_return = (1 + total_return) ** (365.25 / days) - 1 if days > 0 else 0
 
-        # Drawdown
-        rolling_max = self.portfolio_history['total'].cummax()
-        drawdown = (self.portfolio_history['total'] - rolling_max) / rolling_max
-        max_drawdown = drawdown.min()
-        
         # Volatility and Sharpe Ratio
-        self.portfolio_history['returns'] = self.portfolio_history['total'].pct_change().fillna(0)
-        annualized_volatility = self.portfolio_history['returns'].std() * np.sqrt(252) # Assuming daily data
+        annualized_volatility = volatility * np.sqrt(252) # Assuming daily data
         sharpe_ratio = annualized_return / annualized_volatility if annualized_volatility > 0 else 0
 
         # Sortino Ratio (vs. downside volatility)
-        downside_returns = self.portfolio_history['returns'][self.portfolio_history['returns'] < 0]
-        downside_volatility = downside_returns.std() * np.sqrt(252)
+        downside_volatility = downside_volatility * np.sqrt(252)
         sortino_ratio = annualized_return / downside_volatility if downside_volatility > 0 else 0
         
         # Calmar Ratio
         calmar_ratio = annualized_return / abs(max_drawdown) if max_drawdown != 0 else 0
 
         # Trade analysis
-        trades = self.portfolio_history[self.portfolio_history['signal'].isin(['BUY', 'SELL'])]
-        num_trades = len(trades[trades['signal'] == 'BUY']) # Count buy signals as trades
+        signal = self.portfolio_history['signal'].to_numpy()
+        num_trades = int(np.count_nonzero(signal == 'BUY')) # Count buy signals as trades
         
         self.metrics = {
             'total_return': total_return,
@@ -75,11 +114,13 @@ class Analytics:
         fig, ax = plt.subplots(figsize=(14, 7))
 
         # Plot strategy equity
-        ax.plot(self.portfolio_history.index, self.portfolio_history['total'], label='Strategy Equity', color='royalblue')
+        equity = self._equity_values()
+        ax.plot(self.portfolio_history.index, equity, label='Strategy Equity', color='royalblue', rasterized=True)
 
         # Plot buy-and-hold benchmark
-        buy_hold_equity = self.portfolio_history['price'] / self.portfolio_history['price'].iloc[0] * self.portfolio_history['total'].iloc[0]
-        ax.plot(self.portfolio_history.index, buy_hold_equity, label='Buy & Hold', color='gray', linestyle='--')
+        price = self.portfolio_history['price'].to_numpy(dtype=np.float64)
+        buy_hold_equity = price / price[0] * equity[0]
+        ax.plot(self.portfolio_history.index, buy_hold_equity, label='Buy & Hold', color='gray', linestyle='--', rasterized=True)
 
         ax.set_title(f'Equity Curve: {self.report_name}')
         ax.set_xlabel('Date')
@@ -88,20 +129,20 @@ class Analytics:
         ax.grid(True)
         
         plot_path = self.results_path.parent / f"{self.report_name}_equity.png"
-        fig.savefig(plot_path)
+        fig.savefig(plot_path, dpi=100, bbox_inches='tight')
         plt.close(fig)
         print(f"Saved equity curve plot to: {plot_path}")
 
     def plot_drawdown(self):
         """Generates and saves a plot of the portfolio's drawdown over time."""
-        rolling_max = self.portfolio_history['total'].cummax()
-        drawdown = (self.portfolio_history['total'] - rolling_max) / rolling_max
+        drawdown_pct = self._drawdown_values() * 100
+        dates = self.portfolio_history.index
 
         plt.style.use('seaborn-v0_8-darkgrid')
         fig, ax = plt.subplots(figsize=(14, 7))
         
-        ax.fill_between(drawdown.index, drawdown * 100, 0, color='red', alpha=0.3)
-        ax.plot(drawdown.index, drawdown * 100, color='red', linewidth=1)
+        ax.fill_between(dates, drawdown_pct, 0, color='red', alpha=0.3, rasterized=True)
+        ax.plot(dates, drawdown_pct, color='red', linewidth=1, rasterized=True)
         
         ax.set_title(f'Drawdown Curve: {self.report_name}')
         ax.set_xlabel('Date')
@@ -109,7 +150,7 @@ class Analytics:
         ax.grid(True)
 
         plot_path = self.results_path.parent / f"{self.report_name}_drawdown.png"
-        fig.savefig(plot_path)
+        fig.savefig(plot_path, dpi=100, bbox_inches='tight')
         plt.close(fig)
         print(f"Saved drawdown plot to: {plot_path}")
 
@@ -133,7 +174,7 @@ class Analytics:
 # Example usage for direct execution and testing
 if __name__ == "__main__":
     # This script assumes you have already run `backtest/engine.py`
-    # and have .csv files in your `backtest/results` directory.
+    # and have result files in your `backtest/results` directory.
     
     results_dir = Path(__file__).parent / "results"
     if not results_dir.exists() or not any(results_dir.iterdir()):
@@ -141,9 +182,11 @@ if __name__ == "__main__":
     else:
         # Find the first CSV file and generate a report for it
         #first_result_file = next(results_dir.glob('*.csv'), None)
-        first_result_file = results_dir / "ema_crossover_AAPL_1d.csv"
+        first_result_file = results_dir / "ema_crossover_AAPL_1d.parquet"
+        if not first_result_file.exists():
+            first_result_file = first_result_file.with_suffix('.csv')
         if first_result_file:
             analytics_engine = Analytics(first_result_file)
             analytics_engine.generate_report()
         else:
-            print("No .csv files found in the results directory.")
\ No newline at end of file
+            print("No result files found in the results directory.")
\ No newline at end of file
@@ -1,18 +1,22 @@
 import sys
 from pathlib import Path
 
-# Add project root to Python path for relative imports
-sys.path.append(str(Path(__file__).resolve().parent.parent))
+# Add project root to Python path for relative imports when run as a script;
+# imported as part of the package, the root is already importable
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Tuple
 from datetime import datetime
 
 from utils.config_loader import config as global_config
 from data.data_storage import DataStorage
 from strategies import get_strategy_class
 from strategies.base_strategy import StrategyConfig
+from backtest._kernels import simulate_portfolio
+from backtest.metrics import compute_metrics, period_returns
 
 class Backtester:
     """
@@ -37,7 +41,7 @@ class Backtester:
         self.risk_per_trade = risk_per_trade
         self.data_storage = DataStorage()
 
-        # Create directory to save backtest CSV results
+        # Create directory to save backtest results
         self.results_dir = Path(__file__).parent / "results"
         self.results_dir.mkdir(exist_ok=True)
 
@@ -72,90 +76,69 @@ class Backtester:
 
         strategy_config = StrategyConfig(name=strategy_name, params=strategy_config_dict['params'])
         strategy = get_strategy_class(strategy_name)(strategy_config, symbol)
-        signals = strategy.generate_signals(data)
 
-        # If no signals, skip simulation
-        if not signals:
+        # Simulate portfolio performance, consuming the signals as the strategy yields them
+        portfolio_history = self._simulate_trades(data, strategy.stream_signals(data))
+
+        # If no signals, skip the evaluation
+        if portfolio_history.empty:
             print(f"No signals generated for {strategy_name}. Skipping backtest.")
             return pd.DataFrame(), {}
 
-        # Simulate portfolio performance with generated signals
-        portfolio_history = self._simulate_trades(data, signals)
-
         # Evaluate performance metrics for the portfolio
         performance_metrics = self._calculate_performance(portfolio_history)
 
-        # Save portfolio history to CSV for review
-        results_file = self.results_dir / f"{strategy_name}_{symbol}_{interval}.csv"
-        portfolio_history.to_csv(results_file)
+        # Save portfolio history to Parquet for review (no datetime/float re-parsing on load)
+        results_file = self.results_dir / f"{strategy_name}_{symbol}_{interval}.parquet"
+        portfolio_history.to_parquet(results_file, engine='pyarrow', compression='zstd')
         print(f"Saved detailed backtest results to: {results_file}")
 
         return portfolio_history, performance_metrics
 
-    def _simulate_trades(self, data: pd.DataFrame, signals: List) -> pd.DataFrame:
+    def _simulate_trades(self, data: pd.DataFrame, signals: Iterable) -> pd.DataFrame:
         """
         Simulate trades based on generated signals.
 
         Args:
             data: OHLCV DataFrame indexed by timestamp.
-            signals: List of Signal objects (must have to_dict() method or accessible attributes).
+            signals: Iterable of Signal objects (timestamp and signal_type attributes), e.g.
+                     a strategy's stream_signals generator; it is consumed once.
 
         Returns:
-            portfolio: DataFrame with portfolio holdings, cash and total values over time.
+            portfolio: DataFrame with portfolio holdings, cash and total values over time;
+                       empty if there are no signals.
         """
-        # Convert signal objects to dicts for DataFrame conversion;
-        # fallback to manual attribute extraction if no to_dict() available.
-        try:
-            signals_df = pd.DataFrame([s.to_dict() for s in signals]).set_index('timestamp')
-        except AttributeError:
-            signals_df = pd.DataFrame({
-                'timestamp': [s.timestamp for s in signals],
-                'signal_type': [s.signal_type for s in signals],
-                'price': [getattr(s, 'price', None) for s in signals]
-            }).set_index('timestamp')
-
-        # Create an empty portfolio DataFrame aligned with price data index
-        portfolio = pd.DataFrame(index=data.index)
-        portfolio['price'] = data['close']
-        portfolio['signal'] = signals_df['signal_type']
-        # Left join signals to the main portfolio DataFrame to align on the index
-        #portfolio = portfolio.join(signals_df['signal_type'])
-
-        cash = self.initial_capital
-        position = 0.0  # Number of shares/units held
-
-        # Initialize portfolio columns
-        portfolio['holdings'] = 0.0  # Value of holdings = position * price
-        portfolio['cash'] = self.initial_capital  # Cash available
-        portfolio['total'] = self.initial_capital  # Total portfolio value (cash + holdings)
-
-        for i in range(len(portfolio)):
-            signal = portfolio['signal'].iloc[i]
-            #signal = portfolio['signal_type'].iloc[i]
-            price = portfolio['price'].iloc[i]
-
-            # Adjust prices for slippage on buys/sells
-            buy_price = price * (1 + self.slippage)
-            sell_price = price * (1 - self.slippage)
-
-            if signal == 'BUY' and cash > 0:
-                # Risk fixed fraction of cash per trade
-                trade_value = cash * self.risk_per_trade
-                quantity_to_buy = trade_value / buy_price
-                cash -= quantity_to_buy * buy_price
-                cash -= self.commission
-                position += quantity_to_buy
-
-            elif signal == 'SELL' and position > 0:
-                # Sell entire position
-                cash += position * sell_price
-                cash -= self.commission
-                position = 0.0
-
-            # Update portfolio values for current timestamp
-            portfolio.iloc[i, portfolio.columns.get_loc('holdings')] = position * price
-            portfolio.iloc[i, portfolio.columns.get_loc('cash')] = cash
-            portfolio.iloc[i, portfolio.columns.get_loc('total')] = cash + (position * price)
+        # Collect the signal columns in one pass over the signals
+        timestamps, signal_types = [], []
+        for s in signals:
+            timestamps.append(s.timestamp)
+            signal_types.append(s.signal_type)
+        signals_df = pd.DataFrame({'signal_type': signal_types},
+                                  index=pd.DatetimeIndex(timestamps, name='timestamp'))
+        if signals_df.empty:
+            return pd.DataFrame()
+
+        # Align signals to the price data index (bars without a signal get NaN)
+        price = data['close'].to_numpy(dtype=np.float64)
+        signal = signals_df['signal_type'].reindex(data.index).to_numpy(dtype=object)
+
+        # Encode signals once (BUY = 1, SELL = -1, anything else = 0) and step the
+        # portfolio in the compiled kernel
+        signal_code = np.select([signal == 'BUY', signal == 'SELL'], [1, -1], 0).astype(np.int8)
+
+        holdings, cash, total = simulate_portfolio(
+            price, signal_code, float(self.initial_capital), float(self.commission),
+            float(self.slippage), float(self.risk_per_trade)
+        )
+
+        # Build the portfolio frame once from the finished arrays
+        portfolio = pd.DataFrame({
+            'price': price,
+            'signal': signal,
+            'holdings': holdings,  # Value of holdings = position * price
+            'cash': cash,  # Cash available
+            'total': total,  # Total portfolio value (cash + holdings)
+        }, index=data.index, copy=False)
 
         return portfolio
 
@@ -172,23 +155,20 @@ class Backtester:
         if portfolio.empty:
             return {}
 
-        # Total return over the backtest period
-        total_return = (portfolio['total'].iloc[-1] / portfolio['total'].iloc[0]) - 1
+        total = portfolio['total'].to_numpy(dtype=np.float64)
 
-        # Maximum drawdown calculation
-        rolling_max = portfolio['total'].cummax()
-        drawdown = (portfolio['total'] - rolling_max) / rolling_max
-        max_drawdown = drawdown.min()
+        # Total return, maximum drawdown and the return statistics for the Sharpe ratio in one pass
+        stats = compute_metrics(total)
+        annualized_return = stats['mean_return'] * 252  # trading days per year
+        annualized_volatility = stats['volatility'] * np.sqrt(252)
 
-        # Daily returns and annualized statistics for Sharpe ratio
-        portfolio['returns'] = portfolio['total'].pct_change().fillna(0)
-        annualized_return = portfolio['returns'].mean() * 252  # trading days per year
-        annualized_volatility = portfolio['returns'].std() * np.sqrt(252)
+        # Per-bar returns are kept with the saved portfolio history
+        portfolio['returns'] = period_returns(total)
         sharpe_ratio = annualized_return / annualized_volatility if annualized_volatility > 0 else 0
 
         return {
-            'total_return': total_return,
-            'max_drawdown': max_drawdown,
+            'total_return': stats['total_return'],
+            'max_drawdown': stats['max_drawdown'],
             'sharpe_ratio': sharpe_ratio,
             'annualized_return': annualized_return,
             'annualized_volatility': annualized_volatility
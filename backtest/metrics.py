@@ -0,0 +1,40 @@
+"""
+Equity-curve metrics shared by the Backtester and Analytics.
+
+Both derive their reports from the same single pass over the equity curve,
+so drawdown, volatility and total return have one definition.
+"""
+import numpy as np
+from typing import Dict
+
+from backtest._kernels import equity_stats
+
+
+def period_returns(total: np.ndarray) -> np.ndarray:
+    """Per-bar returns of an equity curve, 0 for the first bar (as pct_change().fillna(0))."""
+    returns = np.empty_like(total)
+    returns[0] = 0.0
+    np.divide(total[1:], total[:-1], out=returns[1:])
+    returns[1:] -= 1.0
+    return returns
+
+
+def compute_metrics(total: np.ndarray) -> Dict:
+    """
+    Computes the base statistics of an equity curve.
+
+    Args:
+        total: float64 portfolio values, one per bar.
+
+    Returns:
+        Dictionary with total_return, max_drawdown, mean_return, volatility and
+        downside_volatility (per-bar, not annualized).
+    """
+    max_drawdown, mean_return, volatility, downside_volatility = equity_stats(total)
+    return {
+        'total_return': total[-1] / total[0] - 1,
+        'max_drawdown': max_drawdown,
+        'mean_return': mean_return,
+        'volatility': volatility,
+        'downside_volatility': downside_volatility,
+    }
@@ -1,11 +1,31 @@
-import pandas as pd
+from pathlib import Path
+import pyarrow.dataset as ds
+import pyarrow.csv as pcsv
 
-# Adjust the path if needed
-parquet_path = "data/processed/1d/AAPL.parquet"
-csv_path = "data/processed/1d/AAPL.csv"
+# Adjust the symbol and interval if needed
+symbol, interval = "AAPL", "1d"
+interval_dir = Path("data/processed") / interval
+csv_path = interval_dir / f"{symbol}.csv"
 
-# Load and convert
-df = pd.read_parquet(parquet_path)
-df.to_csv(csv_path)
+# Read the year-partitioned dataset, or the single file written by older versions
+dataset_dir = interval_dir / f"symbol={symbol}"
+if dataset_dir.exists():
+    dataset = ds.dataset(dataset_dir, format="parquet", partitioning="hive")
+else:
+    dataset = ds.dataset(interval_dir / f"{symbol}.parquet", format="parquet")
 
-print(f"✅ Converted '{parquet_path}' to '{csv_path}'")
+# Write the pandas index column(s) (e.g. 'timestamp') first, as DataFrame.to_csv does;
+# the 'year' partition key is not part of the data
+index_columns = [c for c in (dataset.schema.pandas_metadata or {}).get('index_columns', []) if isinstance(c, str)]
+columns = index_columns + [c for c in dataset.schema.names if c not in index_columns and c != 'year']
+
+# Stream one record batch at a time so memory stays flat however large the history is
+writer = None
+for batch in dataset.to_batches(columns=columns):
+    if writer is None:
+        writer = pcsv.CSVWriter(csv_path, batch.schema)
+    writer.write_batch(batch)
+if writer is not None:
+    writer.close()
+
+print(f"✅ Converted {symbol} ({interval}) data to '{csv_path}'")
@@ -0,0 +1,116 @@
+"""
+Numba kernels for the DataProcessor cleaning steps.
+
+Each kernel reproduces the pandas operation it replaces, so processed data is
+unchanged; they work on contiguous float64 arrays in one pass each.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def ffill(values, limit=-1):
+    """
+    Forward-fills NaNs down each column of a 2-D array, identical to
+    `pd.DataFrame(values).ffill(limit=limit)`; a negative limit fills without bound.
+
+    Returns:
+        filled_values: float64 copy of the array with the NaNs filled.
+        filled: Number of NaNs replaced by a value.
+    """
+    n, m = values.shape
+    out = values.copy()
+    last = np.full(m, np.nan)
+    run = np.zeros(m, dtype=np.int64)
+    filled = 0
+    for i in range(n):
+        for j in range(m):
+            value = out[i, j]
+            if np.isnan(value):
+                run[j] += 1
+                if (limit < 0 or run[j] <= limit) and not np.isnan(last[j]):
+                    out[i, j] = last[j]
+                    filled += 1
+            else:
+                last[j] = value
+                run[j] = 0
+    return out, filled
+
+
+@njit(cache=True)
+def invalid_rows(open_, high, low, close, volume):
+    """
+    Flags rows with high < low, a non-positive price or a negative volume
+    (NaNs never count as invalid, as with pandas comparisons).
+
+    Returns:
+        mask: Boolean array, True for rows to remove.
+        invalid_hl, negative_prices, negative_volume: Row counts per check.
+    """
+    n = close.shape[0]
+    mask = np.empty(n, dtype=np.bool_)
+    invalid_hl = 0
+    negative_prices = 0
+    negative_volume = 0
+    for i in range(n):
+        bad_hl = high[i] < low[i]
+        bad_price = (open_[i] <= 0) | (high[i] <= 0) | (low[i] <= 0) | (close[i] <= 0)
+        bad_volume = volume[i] < 0
+        invalid_hl += bad_hl
+        negative_prices += bad_price
+        negative_volume += bad_volume
+        mask[i] = bad_hl | bad_price | bad_volume
+    return mask, invalid_hl, negative_prices, negative_volume
+
+
+@njit(cache=True)
+def cap_volume_spikes(volume, window, min_periods, threshold):
+    """
+    Caps each volume above `threshold` times its rolling mean (over `window` bars
+    including itself, NaNs skipped, at least `min_periods` values) at that limit.
+    The mean is always taken over the original volumes, as
+    `volume.rolling(window, min_periods=min_periods).mean()`.
+
+    Returns:
+        capped: float64 copy of the volumes with the spikes capped.
+        corrected: Number of capped bars.
+    """
+    n = volume.shape[0]
+    capped = volume.copy()
+    s = 0.0
+    count = 0
+    corrected = 0
+    for i in range(n):
+        value = volume[i]
+        if not np.isnan(value):
+            s += value
+            count += 1
+        if i >= window:
+            old = volume[i - window]
+            if not np.isnan(old):
+                s -= old
+                count -= 1
+        if count >= min_periods and count > 0:
+            mean = s / count
+            if mean > 0 and value > mean * threshold:
+                capped[i] = mean * threshold
+                corrected += 1
+    return capped, corrected
+
+
+@njit(cache=True)
+def carry_last_valid(values, mask):
+    """
+    Replaces, in place, each row of a 2-D array flagged in `mask` with the last
+    unflagged row before it (rows flagged before any unflagged row become NaN),
+    as setting the flagged rows to NaN and forward-filling would.
+    """
+    n, m = values.shape
+    last = np.full(m, np.nan)
+    for i in range(n):
+        if mask[i]:
+            for j in range(m):
+                values[i, j] = last[j]
+        else:
+            for j in range(m):
+                last[j] = values[i, j]
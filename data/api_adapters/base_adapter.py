@@ -53,7 +53,7 @@ class BaseAPIAdapter(ABC):
         Subclasses should call this after fetching data.
         """
         # Convert column names to lowercase for consistency
-        df.columns = [col.lower() for col in df.columns]
+        df.columns = df.columns.str.lower()
         # Rename common variations to our standard names
         column_mapping = {
             'date': 'timestamp',
@@ -68,7 +68,18 @@ class BaseAPIAdapter(ABC):
         df = df.rename(columns=column_mapping)
         # Ensure 'timestamp' is datetime and set as index if not already
         if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
+            # Skip per-value format inference when the dtype already says what the values are
+            timestamps = df['timestamp']
+            if pd.api.types.is_integer_dtype(timestamps):
+                # Integer timestamps are epoch milliseconds (CCXT's native format)
+                df['timestamp'] = pd.to_datetime(timestamps, unit='ms', utc=True)
+            elif pd.api.types.is_datetime64_any_dtype(timestamps):
+                if timestamps.dt.tz is None:
+                    df['timestamp'] = timestamps.dt.tz_localize('UTC')
+                else:
+                    df['timestamp'] = timestamps.dt.tz_convert('UTC')
+            else:
+                df['timestamp'] = pd.to_datetime(timestamps, utc=True, cache=True)
             df = df.set_index('timestamp')
         elif isinstance(df.index, pd.DatetimeIndex):
             df.index.name = 'timestamp'
@@ -1,11 +1,23 @@
 import ccxt
+import ccxt.async_support as ccxt_async
+import asyncio
+import json
+import os
+import time
+import numpy as np
 import pandas as pd
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import List, Dict
 from data.api_adapters.base_adapter import BaseAPIAdapter
 from utils.logger_setup import get_logger
 from utils.config_loader import config # To get API keys
 logger = get_logger("error")
+# Exchange symbol lists are cached on disk and reused across runs for this long
+SYMBOLS_CACHE_DIR = Path(__file__).resolve().parent.parent / "cache"
+SYMBOLS_CACHE_TTL_SECONDS = 24 * 3600
+# Maximum number of OHLCV page requests in flight during a historical fetch
+OHLCV_FETCH_CONCURRENCY = 5
 class CCXTAdapter(BaseAPIAdapter):
     """
     Data adapter for cryptocurrency exchanges using the CCXT library.
@@ -16,28 +28,31 @@ class CCXTAdapter(BaseAPIAdapter):
         self.exchange_id = exchange_id
         self.exchange = self._initialize_exchange()
         self.symbols_cache: List[str] = []
+        self.symbols_cache_path = SYMBOLS_CACHE_DIR / f"ccxt_{exchange_id}_symbols.json"
+    def _exchange_config(self) -> Dict:
+        """Builds the CCXT exchange options, including API keys from config."""
+        api_keys = config.get('api_keys', {})
+        
+        # CCXT expects specific key names, adjust based on exchange
+        # Example for Binance:
+        if self.exchange_id == 'binance':
+            api_key = api_keys.get('binance_api_key')
+            api_secret = api_keys.get('binance_api_secret')
+            if not api_key or not api_secret:
+                logger.warning(f"Binance API keys not found in config. Trading functions may be limited.")
+                return {'enableRateLimit': True} # Public access only
+            return {
+                'apiKey': api_key,
+                'secret': api_secret,
+                'enableRateLimit': True, # Enable CCXT's rate limit management
+            }
+        # Add more exchange-specific key handling here if needed
+        return {'enableRateLimit': True} # Default for other exchanges
     def _initialize_exchange(self):
         """Initializes the CCXT exchange object with API keys from config."""
         try:
             exchange_class = getattr(ccxt, self.exchange_id)
-            api_keys = config.get('api_keys', {})
-            
-            # CCXT expects specific key names, adjust based on exchange
-            # Example for Binance:
-            if self.exchange_id == 'binance':
-                api_key = api_keys.get('binance_api_key')
-                api_secret = api_keys.get('binance_api_secret')
-                if not api_key or not api_secret:
-                    logger.warning(f"Binance API keys not found in config. Trading functions may be limited.")
-                    return exchange_class({'enableRateLimit': True}) # Public access only
-                return exchange_class({
-                    'apiKey': api_key,
-                    'secret': api_secret,
-                    'enableRateLimit': True, # Enable CCXT's rate limit management
-                })
-            # Add more exchange-specific key handling here if needed
-            else:
-                return exchange_class({'enableRateLimit': True}) # Default for other exchanges
+            return exchange_class(self._exchange_config())
         except AttributeError:
             logger.error(f"CCXT exchange '{self.exchange_id}' not found.")
             raise
@@ -58,51 +73,104 @@ class CCXTAdapter(BaseAPIAdapter):
             interval (str): Candlestick interval (e.g., '1m', '5m', '1h', '1d').
         Returns:
             pd.DataFrame: Standardized DataFrame or empty DataFrame on error/no data.
+        Raises:
+            RuntimeError: If called from a running event loop (e.g. async code or a notebook).
+                          The requests run in their own loop via asyncio.run, so from async
+                          code call it in a worker thread with asyncio.to_thread.
         """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass # No loop running in this thread, so asyncio.run can start one
+        else:
+            raise RuntimeError(
+                "CCXTAdapter.fetch_historical_data cannot be called from a running event loop; "
+                "call it in a worker thread, e.g. `await asyncio.to_thread(adapter.fetch_historical_data, ...)`."
+            )
         if not self.exchange:
             return pd.DataFrame()
         # Convert datetime to milliseconds timestamp for CCXT
         since = int(start_date.timestamp() * 1000)
-        
-        all_ohlcv = []
-        limit = 1000 # Max number of candles per request for most exchanges
-        while True:
-            try:
-                # fetch_ohlcv returns: [timestamp, open, high, low, close, volume]
-                ohlcv = self.exchange.fetch_ohlcv(symbol, interval, since, limit)
-                if not ohlcv:
-                    break
-                all_ohlcv.extend(ohlcv)
-                
-                # Update 'since' to the timestamp of the last fetched candle + 1 interval
-                # This ensures we don't refetch the last candle and continue from there
-                last_timestamp = ohlcv[-1][0]
-                since = last_timestamp + self.exchange.parse_timeframe(interval) * 1000
-                
-                # Stop if we've fetched beyond the end_date
-                if last_timestamp >= int(end_date.timestamp() * 1000):
-                    break
-                
-            except ccxt.NetworkError as e:
-                logger.error(f"Network error fetching historical data from {self.name} for {symbol}: {e}")
-                break
-            except ccxt.ExchangeError as e:
-                logger.error(f"Exchange error fetching historical data from {self.name} for {symbol}: {e}")
-                break
-            except Exception as e:
-                logger.error(f"Unexpected error fetching historical data from {self.name} for {symbol}: {e}")
-                break
-        if not all_ohlcv:
+        until = int(end_date.timestamp() * 1000)
+        ohlcv = asyncio.run(self._fetch_historical_async(symbol, since, until, interval))
+        if len(ohlcv) == 0:
             logger.warning(f"No historical data found for {symbol} from {self.name} for {start_date} to {end_date}")
             return pd.DataFrame()
-        df = pd.DataFrame(all_ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-        # Convert timestamp from milliseconds to datetime
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True)
+        # Build the frame from typed columns; timestamps stay integer milliseconds
+        # and are converted to datetime by _standardize_dataframe
+        df = pd.DataFrame({
+            'timestamp': ohlcv[:, 0].astype(np.int64),
+            'open': ohlcv[:, 1],
+            'high': ohlcv[:, 2],
+            'low': ohlcv[:, 3],
+            'close': ohlcv[:, 4],
+            'volume': ohlcv[:, 5],
+        }, copy=False)
         
         # Filter out data beyond end_date if any were fetched due to batching
-        df = df[df['timestamp'] <= end_date]
+        df = df[df['timestamp'] <= until]
         df = self._standardize_dataframe(df)
         return df
+    async def _fetch_historical_async(self,
+                                      symbol: str,
+                                      since: int,
+                                      until: int,
+                                      interval: str,
+                                      limit: int = 1000,
+                                      concurrency: int = OHLCV_FETCH_CONCURRENCY) -> np.ndarray:
+        """
+        Fetches the OHLCV candles between two millisecond timestamps with concurrent requests.
+        The range is split up front into windows of `limit` candles, so the windows have no
+        dependency on each other. Exchanges that cap a request below `limit` return a short
+        page, so each window keeps requesting from its last candle until it is covered. At most
+        `concurrency` requests are in flight at once, on top of CCXT's own rate limiting.
+        If a window fails, only the candles before it are returned.
+        Returns a float64 array of [timestamp, open, high, low, close, volume] rows.
+        """
+        exchange = getattr(ccxt_async, self.exchange_id)(self._exchange_config())
+        semaphore = asyncio.Semaphore(concurrency)
+        timeframe_ms = exchange.parse_timeframe(interval) * 1000
+        window_ms = timeframe_ms * limit
+        async def fetch_window(window_since: int) -> List[List]:
+            window_until = min(window_since + window_ms - timeframe_ms, until)
+            candles = []
+            cursor = window_since
+            while cursor <= window_until:
+                # Only ask for the candles left in this window
+                page_limit = (window_until - cursor) // timeframe_ms + 1
+                async with semaphore:
+                    # fetch_ohlcv returns: [timestamp, open, high, low, close, volume]
+                    page = await exchange.fetch_ohlcv(symbol, interval, cursor, page_limit)
+                # Drop candles past the window, which the next window fetches itself
+                page = [candle for candle in page if candle[0] <= window_until]
+                if not page:
+                    break
+                candles.extend(page)
+                cursor = page[-1][0] + timeframe_ms
+            return candles
+        try:
+            batches = await asyncio.gather(
+                *(fetch_window(window_since) for window_since in range(since, until + 1, window_ms)),
+                return_exceptions=True
+            )
+        finally:
+            await exchange.close()
+        arrays = []
+        for batch in batches:
+            if isinstance(batch, ccxt.NetworkError):
+                logger.error(f"Network error fetching historical data from {self.name} for {symbol}: {batch}")
+                break
+            if isinstance(batch, ccxt.ExchangeError):
+                logger.error(f"Exchange error fetching historical data from {self.name} for {symbol}: {batch}")
+                break
+            if isinstance(batch, Exception):
+                logger.error(f"Unexpected error fetching historical data from {self.name} for {symbol}: {batch}")
+                break
+            if batch:
+                arrays.append(np.asarray(batch, dtype=np.float64))
+        if not arrays:
+            return np.empty((0, 6))
+        return np.concatenate(arrays)
     def fetch_realtime_data(self, symbol: str) -> pd.DataFrame:
         """
         Fetches the latest ticker information (current price, volume) from a CCXT exchange.
@@ -138,18 +206,43 @@ class CCXTAdapter(BaseAPIAdapter):
         except Exception as e:
             logger.error(f"Unexpected error fetching real-time data from {self.name} for {symbol}: {e}")
             return pd.DataFrame()
+    def _load_symbols_from_disk(self) -> List[str]:
+        """Returns the symbols cached on disk by an earlier run, or [] if missing or expired."""
+        try:
+            age = time.time() - self.symbols_cache_path.stat().st_mtime
+            if age >= SYMBOLS_CACHE_TTL_SECONDS:
+                return []
+            with open(self.symbols_cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+    def _save_symbols_to_disk(self, symbols: List[str]):
+        """Atomically writes the symbol list to the on-disk cache."""
+        try:
+            self.symbols_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.symbols_cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(symbols, f)
+            os.replace(tmp_path, self.symbols_cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write symbol cache for {self.name} to {self.symbols_cache_path}: {e}")
     def get_available_symbols(self) -> List[str]:
         """
         Fetches a list of available trading symbols (markets) from the exchange.
-        Caches the result after the first fetch.
+        Caches the result in memory and on disk, so later runs skip `load_markets`
+        until the disk cache is older than SYMBOLS_CACHE_TTL_SECONDS.
         """
         if not self.symbols_cache:
+            self.symbols_cache = self._load_symbols_from_disk()
+            if self.symbols_cache:
+                return self.symbols_cache
             if not self.exchange:
                 return []
             try:
                 markets = self.exchange.load_markets()
                 self.symbols_cache = list(markets.keys())
                 logger.info(f"Loaded {len(self.symbols_cache)} symbols for {self.name}.")
+                self._save_symbols_to_disk(self.symbols_cache)
             except ccxt.NetworkError as e:
                 logger.error(f"Network error fetching symbols from {self.name}: {e}")
             except ccxt.ExchangeError as e:
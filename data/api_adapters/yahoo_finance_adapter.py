@@ -1,10 +1,23 @@
 import yfinance as yf
+import numpy as np
 import pandas as pd
+import time
 from datetime import datetime, timezone  
-from typing import List
+from typing import List, Dict, Tuple
 from data.api_adapters.base_adapter import BaseAPIAdapter
 from utils.logger_setup import get_logger
 logger = get_logger("error") # Use the error logger for issues
+# Ticker.info results are reused for this long before they are fetched again
+TICKER_INFO_TTL_SECONDS = 5.0
+# Standard OHLCV columns of a realtime row and the Ticker.info keys they are read from
+REALTIME_INFO_FIELDS = {
+    'open': 'open',
+    'high': 'dayHigh',
+    'low': 'dayLow',
+    'close': 'currentPrice',
+    'volume': 'volume',
+}
+REALTIME_ROW_DTYPE = np.dtype([(column, np.float64) for column in REALTIME_INFO_FIELDS])
 class YahooFinanceAdapter(BaseAPIAdapter):
     """
     Data adapter for Yahoo Finance using the yfinance library.
@@ -13,6 +26,24 @@ class YahooFinanceAdapter(BaseAPIAdapter):
     def __init__(self):
         super().__init__("Yahoo Finance")
         self.symbols_cache = {} # Simple cache for available symbols
+        self._ticker_cache: Dict[str, yf.Ticker] = {}
+        self._info_cache: Dict[str, Tuple[float, Dict]] = {} # symbol -> (monotonic fetch time, info)
+    def _get_ticker_info(self, symbol: str) -> Dict:
+        """
+        Returns `Ticker.info` for a symbol, reusing the Ticker object across calls and
+        the info dict for TICKER_INFO_TTL_SECONDS (each fresh fetch costs several requests).
+        """
+        cached = self._info_cache.get(symbol)
+        now = time.monotonic()
+        if cached and now - cached[0] < TICKER_INFO_TTL_SECONDS:
+            return cached[1]
+        ticker = self._ticker_cache.get(symbol)
+        if ticker is None:
+            ticker = self._ticker_cache[symbol] = yf.Ticker(symbol)
+        info = ticker.info
+        if info:
+            self._info_cache[symbol] = (now, info)
+        return info
     def fetch_historical_data(self, 
                               symbol: str, 
                               start_date: datetime, 
@@ -32,14 +63,11 @@ class YahooFinanceAdapter(BaseAPIAdapter):
         try:
             # yfinance expects dates as strings or datetime objects
             # It handles timezone conversion internally, but we'll standardize to UTC later
-            df = yf.download(symbol, start=start_date, end=end_date, interval=interval, progress=False, auto_adjust=False)
+            # multi_level_index=False returns flat OHLCV columns for the single ticker
+            df = yf.download(symbol, start=start_date, end=end_date, interval=interval, progress=False,
+                             auto_adjust=False, multi_level_index=False)
             #print(f"Raw Yahoo Finance data for {symbol}:\n{df.head()}")
             
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = df.columns.get_level_values(0)
-
-
-            
             if df.empty:
                 logger.warning(f"No historical data found for {symbol} from {self.name} for {start_date} to {end_date}")
                 return pd.DataFrame()
@@ -50,33 +78,66 @@ class YahooFinanceAdapter(BaseAPIAdapter):
         except Exception as e:
             logger.error(f"Error fetching historical data from {self.name} for {symbol}: {e}")
             return pd.DataFrame()
+    def fetch_historical_data_batch(self,
+                                    symbols: List[str],
+                                    start_date: datetime,
+                                    end_date: datetime,
+                                    interval: str = '1d') -> Dict[str, pd.DataFrame]:
+        """
+        Fetches historical OHLCV data for several symbols with a single multi-symbol
+        `yf.download` request instead of one request per symbol.
+        Args:
+            symbols (List[str]): The stock ticker symbols.
+            start_date (datetime): The start date.
+            end_date (datetime): The end date.
+            interval (str): Data interval (e.g., '1d', '1wk', '1mo').
+        Returns:
+            Dict[str, pd.DataFrame]: Standardized DataFrame per symbol; empty for symbols
+                                     with no data or when the request fails.
+        """
+        results = {symbol: pd.DataFrame() for symbol in symbols}
+        if not symbols:
+            return results
+        try:
+            df = yf.download(" ".join(symbols), start=start_date, end=end_date, interval=interval,
+                             group_by='ticker', threads=True, progress=False, auto_adjust=False)
+        except Exception as e:
+            logger.error(f"Error fetching historical data from {self.name} for {symbols}: {e}")
+            return results
+        for symbol in symbols:
+            # Columns are grouped as (ticker, field); symbols that failed are missing or all-NaN
+            if symbol not in df.columns.get_level_values(0):
+                logger.warning(f"No historical data found for {symbol} from {self.name} for {start_date} to {end_date}")
+                continue
+            symbol_df = df[symbol].dropna(how='all')
+            if symbol_df.empty:
+                logger.warning(f"No historical data found for {symbol} from {self.name} for {start_date} to {end_date}")
+                continue
+            try:
+                results[symbol] = self._standardize_dataframe(symbol_df)
+            except Exception as e:
+                logger.error(f"Error standardizing historical data from {self.name} for {symbol}: {e}")
+        return results
     def fetch_realtime_data(self, symbol: str) -> pd.DataFrame:
         """
         Fetches the latest real-time data (current price) from Yahoo Finance.
         Note: yfinance's real-time capabilities are limited to current price/info.
         """
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            info = self._get_ticker_info(symbol)
             
             if not info:
                 logger.warning(f"No real-time info found for {symbol} from {self.name}")
                 return pd.DataFrame()
-            # Construct a DataFrame for consistency
-            current_time = datetime.now().astimezone(datetime.now().astimezone().tzinfo) # Local timezone
-            current_time_utc = current_time.astimezone(timezone.utc) # Convert to UTC
-            
-            data = {
-                'timestamp': [current_time_utc],
-                'open': [info.get('open')],
-                'high': [info.get('dayHigh')],
-                'low': [info.get('dayLow')],
-                'close': [info.get('currentPrice')],
-                'volume': [info.get('volume')]
-            }
-            df = pd.DataFrame(data).set_index('timestamp')
-            df = self._standardize_dataframe(df)
-            return df
+            # Construct a standardized one-row DataFrame for consistency, from a typed
+            # record (missing fields become NaN) so pandas has no dtypes to infer
+            current_time_utc = datetime.now(timezone.utc)
+            row = np.empty(1, dtype=REALTIME_ROW_DTYPE)
+            for column, key in REALTIME_INFO_FIELDS.items():
+                value = info.get(key)
+                row[column] = np.nan if value is None else value
+            index = pd.DatetimeIndex([current_time_utc], name='timestamp')
+            return pd.DataFrame(row, index=index)
         except Exception as e:
             logger.error(f"Error fetching real-time data from {self.name} for {symbol}: {e}")
             return pd.DataFrame()
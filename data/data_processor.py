@@ -2,9 +2,13 @@ import pandas as pd
 import numpy as np
 from typing import Tuple, Dict
 from utils.logger_setup import get_logger
+from data._kernels import ffill, invalid_rows, cap_volume_spikes, carry_last_valid
 
 logger = get_logger("error")
 
+PRICE_COLUMNS = ['open', 'high', 'low', 'close']
+OHLCV_COLUMNS = PRICE_COLUMNS + ['volume']
+
 class DataProcessor:
     """
     A class to standardize, clean, and validate market data from various sources.
@@ -27,96 +31,128 @@ class DataProcessor:
             return df, quality_metrics
 
         try:
-            df.columns = [col.lower() for col in df.columns]
+            # Adapter output is already lowercase; only relabel when it is not
+            lower_columns = df.columns.str.lower()
+            if not lower_columns.equals(df.columns):
+                df.columns = lower_columns
             df.index.name = 'timestamp'
 
-            df, missing_info = self._handle_missing_data(df, symbol)
+            # Clean a single float64 copy of the OHLCV columns and rebuild the frame once
+            values = df[OHLCV_COLUMNS].to_numpy(dtype=np.float64, copy=True)
+            index = df.index
+
+            values, index, missing_info = self._handle_missing_data(values, index, symbol)
             quality_metrics['missing_values_filled'] = missing_info['filled']
             quality_metrics['invalid_rows_removed'] += missing_info['dropped']
 
-            df, validation_info = self._validate_data(df, symbol)
+            values, index, validation_info = self._validate_data(values, index, symbol)
             quality_metrics['invalid_rows_removed'] += validation_info['removed']
 
-            df, outlier_info = self._handle_outliers(df, symbol)
+            values, outlier_info = self._handle_outliers(values, symbol)
             quality_metrics['outliers_corrected'] = outlier_info['corrected']
 
+            df = self._rebuild_frame(df, values, index, outlier_info['rewritten'])
+
             if df.empty:
                 logger.error(f"All rows were removed during processing for {symbol}.")
                 return df, quality_metrics
 
             quality_metrics['final_rows'] = len(df)
-            logger.info(f"Successfully processed data for {symbol}. "
-                        f"Initial rows: {quality_metrics['initial_rows']}, "
-                        f"Final rows: {quality_metrics['final_rows']}")
+            logger.info("Successfully processed data for %s. Initial rows: %d, Final rows: %d",
+                        symbol, quality_metrics['initial_rows'], quality_metrics['final_rows'])
             return df, quality_metrics
         except Exception as e:
             logger.exception(f"Unexpected error processing data for {symbol}: {e}")
             return pd.DataFrame(), quality_metrics
 
-    def _handle_missing_data(self, df: pd.DataFrame, symbol: str) -> Tuple[pd.DataFrame, Dict]:
+    def _rebuild_frame(self, df: pd.DataFrame, values: np.ndarray, index: pd.Index, rewritten: set) -> pd.DataFrame:
+        """
+        Builds the processed DataFrame from the cleaned array. Integer columns keep their
+        dtype unless outlier handling rewrote them, as when cleaning the frame in place.
+        """
+        out = pd.DataFrame(values, index=index, columns=OHLCV_COLUMNS)
+        keep_dtypes = {col: df[col].dtype for col in OHLCV_COLUMNS
+                       if col not in rewritten and not pd.api.types.is_float_dtype(df[col])}
+        if keep_dtypes:
+            out = out.astype(keep_dtypes)
+        return out
+
+    def _handle_missing_data(self, values: np.ndarray, index: pd.Index, symbol: str) -> Tuple[np.ndarray, pd.Index, Dict]:
         stats = {'filled': 0, 'dropped': 0}
-        if df.empty: return df, stats
-
-        initial_missing = df.isna().sum().sum()
-        df[['open', 'high', 'low', 'close']] = df[['open', 'high', 'low', 'close']].ffill(limit=2)
-        df['volume'] = df['volume'].fillna(0)
-
-        stats['filled'] = initial_missing - df.isna().sum().sum()
-
-        initial_rows = len(df)
-        df = df.dropna(subset=['open', 'high', 'low', 'close'])
-        stats['dropped'] = initial_rows - len(df)
+        if not len(values): return values, index, stats
+
+        # Forward-fill prices in one compiled pass; the fill count comes from the kernel
+        values[:, :4], stats['filled'] = ffill(values[:, :4], 2)
+        volume = values[:, 4]
+        missing_volume = np.isnan(volume)
+        num_missing_volume = int(np.count_nonzero(missing_volume))
+        if num_missing_volume:
+            stats['filled'] += num_missing_volume
+            volume[missing_volume] = 0.0
+
+        missing_prices = np.isnan(values[:, :4]).any(axis=1)
+        stats['dropped'] = int(np.count_nonzero(missing_prices))
+        if stats['dropped']:
+            values, index = values[~missing_prices], index[~missing_prices]
 
         if stats['filled'] > 0 or stats['dropped'] > 0:
             logger.warning(f"Handled missing data for {symbol}: Filled={stats['filled']}, Dropped={stats['dropped']}")
 
-        return df, stats
+        return values, index, stats
 
-    def _validate_data(self, df: pd.DataFrame, symbol: str) -> Tuple[pd.DataFrame, Dict]:
+    def _validate_data(self, values: np.ndarray, index: pd.Index, symbol: str) -> Tuple[np.ndarray, pd.Index, Dict]:
         stats = {'removed': 0}
-        if df.empty: return df, stats
-
-        invalid_hl = df['high'] < df['low']
-        negative_prices = (df[['open', 'high', 'low', 'close']] <= 0).any(axis=1)
-        negative_volume = df['volume'] < 0
+        if not len(values): return values, index, stats
 
-        invalid_rows_mask = invalid_hl | negative_prices | negative_volume
+        # All three checks and their counts in one pass over the columns
+        invalid_rows_mask, invalid_hl, negative_prices, negative_volume = invalid_rows(
+            *(values[:, i] for i in range(5))
+        )
 
-        if invalid_rows_mask.any():
-            num_removed = invalid_rows_mask.sum()
+        num_removed = int(np.count_nonzero(invalid_rows_mask))
+        if num_removed:
             stats['removed'] = num_removed
             logger.warning(f"Removing {num_removed} invalid rows for {symbol} "
-                           f"(H<L: {invalid_hl.sum()}, NegPrice: {negative_prices.sum()}, NegVol: {negative_volume.sum()})")
-            df = df[~invalid_rows_mask]
-
-        return df, stats
-
-    def _handle_outliers(self, df: pd.DataFrame, symbol: str) -> Tuple[pd.DataFrame, Dict]:
-        stats = {'corrected': 0}
-        if df.empty or df.shape[0] < 5:
-            logger.info(f"Skipping outlier detection for {symbol} due to insufficient data ({df.shape[0]} rows).")
-            return df, stats
-
-        # Price Outliers
-        price_change = df['close'].pct_change().abs()
+                           f"(H<L: {invalid_hl}, NegPrice: {negative_prices}, NegVol: {negative_volume})")
+            values, index = values[~invalid_rows_mask], index[~invalid_rows_mask]
+
+        return values, index, stats
+
+    def _handle_outliers(self, values: np.ndarray, symbol: str) -> Tuple[np.ndarray, Dict]:
+        # 'rewritten' names the columns given new values, for _rebuild_frame
+        stats = {'corrected': 0, 'rewritten': set()}
+        if len(values) < 5:
+            logger.info(f"Skipping outlier detection for {symbol} due to insufficient data ({len(values)} rows).")
+            return values, stats
+
+        # Price Outliers: absolute bar-to-bar change (as pct_change().abs()), in one buffer
+        close = values[:, 3]
+        price_change = np.empty_like(close)
+        price_change[0] = 0.0
+        np.divide(close[1:], close[:-1], out=price_change[1:])
+        price_change[1:] -= 1.0
+        np.abs(price_change, out=price_change)
         price_outliers = price_change > self.price_change_threshold
 
-        if price_outliers.any():
-            num_corrected = price_outliers.sum()
+        num_corrected = int(np.count_nonzero(price_outliers))
+        if num_corrected:
             stats['corrected'] += num_corrected
+            stats['rewritten'].update(PRICE_COLUMNS)
             logger.warning(f"Correcting {num_corrected} price outliers for {symbol}.")
-            df.loc[price_outliers, ['open', 'high', 'low', 'close']] = np.nan
-            df[['open', 'high', 'low', 'close']] = df[['open', 'high', 'low', 'close']].ffill()
+            # Carry the last good bar over each outlier bar in one pass (no NaN round-trip)
+            carry_last_valid(values[:, :4], price_outliers)
 
         # Volume Outliers
-        window_size = min(20, len(df))
-        rolling_vol = df['volume'].rolling(window=window_size, min_periods=3).mean()
-        volume_outliers = (df['volume'] > rolling_vol * self.volume_spike_threshold) & (rolling_vol > 0)
+        window_size = min(20, len(values))
+        # Rolling mean, spike test and capping fused into one pass
+        capped_volume, num_corrected = cap_volume_spikes(
+            values[:, 4], window_size, 3, self.volume_spike_threshold
+        )
 
-        if volume_outliers.any():
-            num_corrected = volume_outliers.sum()
+        if num_corrected:
             stats['corrected'] += num_corrected
+            stats['rewritten'].add('volume')
             logger.warning(f"Capping {num_corrected} volume outliers for {symbol}.")
-            df.loc[volume_outliers, 'volume'] = rolling_vol[volume_outliers] * self.volume_spike_threshold
+            values[:, 4] = capped_volume
 
-        return df, stats
+        return values, stats
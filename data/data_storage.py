@@ -1,12 +1,38 @@
 import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from utils.logger_setup import get_logger
 
 # Initialize a logger for error and info messages in this module
 logger = get_logger("error")
 
+def read_parquet_frame(file_path: Path,
+                       columns: Optional[List[str]] = None,
+                       filters: Optional[List[Tuple]] = None) -> pd.DataFrame:
+    """
+    Read a Parquet file (or a hive-partitioned directory of them) into a DataFrame
+    through PyArrow, optionally only some columns.
+
+    The file is memory-mapped rather than read into a buffer, columns are converted
+    one block each instead of being consolidated, and Arrow buffers are released as
+    they are converted, so the read avoids intermediate copies.
+
+    Args:
+        file_path: Parquet file or dataset directory to read.
+        columns: Columns to read; the stored index is always restored. All if None.
+        filters: Row predicates such as [('timestamp', '>=', start)], applied while
+                 reading; row groups whose statistics exclude them are skipped.
+
+    Returns:
+        DataFrame with the stored index.
+    """
+    table = pq.read_table(file_path, columns=columns, filters=filters, use_threads=True,
+                          use_pandas_metadata=True, memory_map=True)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
 class DataStorage:
     """
     Handles saving and loading of processed market data as Parquet files.
@@ -23,6 +49,8 @@ class DataStorage:
         # Create base_path relative to the project root directory
         self.base_path = Path(__file__).parent.parent / base_path
         self.base_path.mkdir(parents=True, exist_ok=True)
+        # Interval folders already created by this instance, to skip repeated mkdir calls
+        self._ensured_dirs = set()
         logger.info(f"DataStorage initialized. Storage path: {self.base_path}")
 
     def _get_file_path(self, symbol: str, interval: str) -> Path:
@@ -41,12 +69,46 @@ class DataStorage:
 
         # Folder per interval (e.g., data/processed/1d)
         interval_path = self.base_path / interval
-        interval_path.mkdir(exist_ok=True)
+        if interval_path not in self._ensured_dirs:
+            interval_path.mkdir(exist_ok=True)
+            self._ensured_dirs.add(interval_path)
         return interval_path / f"{safe_symbol}.parquet"
 
+    def _get_dataset_path(self, symbol: str, interval: str) -> Path:
+        """
+        Create the standard directory of the year-partitioned dataset for a symbol and interval.
+
+        Args:
+            symbol: trading instrument symbol, e.g., 'AAPL' or 'BTC/USDT'
+            interval: data frequency, e.g., '1d', '1h'
+
+        Returns:
+            pathlib.Path of the hive-style dataset directory,
+            e.g. data/processed/1d/symbol=AAPL (holding year=2024/part-0.parquet, ...).
+        """
+        safe_symbol = symbol.replace('/', '_').replace('\\', '_')
+        return self.base_path / interval / f"symbol={safe_symbol}"
+
+    def _write_partitions(self, df: pd.DataFrame, dataset_path: Path):
+        """
+        Merge rows into the yearly partition files of a dataset, rewriting only the
+        years that `df` touches. Rows of `df` replace stored rows with the same timestamp.
+        """
+        for year, year_df in df.groupby(df.index.year, sort=False):
+            part_path = dataset_path / f"year={year}" / "part-0.parquet"
+            if part_path.exists():
+                existing = read_parquet_frame(part_path)
+                year_df = pd.concat([existing[~existing.index.isin(year_df.index)], year_df]).sort_index()
+            part_path.parent.mkdir(parents=True, exist_ok=True)
+            # Save as Parquet with fast zstd compression: smaller than Snappy on OHLCV
+            # columns at a similar write speed, so loads read fewer bytes from disk
+            year_df.to_parquet(part_path, engine='pyarrow', compression='zstd', compression_level=1,
+                               use_dictionary=True, data_page_size=1 << 20)
+
     def save_data(self, df: pd.DataFrame, symbol: str, interval: str):
         """
-        Save a DataFrame of processed data as a compressed Parquet file.
+        Save a DataFrame of processed data into the symbol's year-partitioned Parquet dataset.
+        New bars are merged in, so an update only rewrites the years it covers.
 
         Args:
             df: DataFrame with datetime index and OHLCV columns.
@@ -57,19 +119,49 @@ class DataStorage:
             logger.warning(f"Attempted to save empty DataFrame for {symbol} at {interval}. Skipping.")
             return
 
-        file_path = self._get_file_path(symbol, interval)
+        dataset_path = self._get_dataset_path(symbol, interval)
         try:
-            # Save using efficient Parquet format with Snappy compression
-            df.to_parquet(file_path, engine='pyarrow', compression='snappy')
-            logger.info(f"Successfully saved {len(df)} rows for {symbol} ({interval}) to {file_path}")
+            # Seed a new dataset with the single-file history from older versions. The old
+            # file is left in place; load_data reads the dataset once it exists
+            legacy_path = self._get_file_path(symbol, interval)
+            if not dataset_path.exists() and legacy_path.exists():
+                self._write_partitions(read_parquet_frame(legacy_path), dataset_path)
+            self._write_partitions(df, dataset_path)
+            logger.info("Successfully saved %d rows for %s (%s) to %s", len(df), symbol, interval, dataset_path)
         except Exception as e:
-            logger.exception(f"Failed to save data for {symbol} to {file_path}: {e}")
+            logger.exception(f"Failed to save data for {symbol} to {dataset_path}: {e}")
+
+    def _date_filters(self, file_path: Path, start_date, end_date) -> Optional[List[Tuple]]:
+        """
+        Builds Parquet read filters on the stored 'timestamp' column (and the 'year'
+        partition key of a dataset directory) for a date range.
+
+        Returns:
+            List of filter tuples, or None if there is no range or no 'timestamp' column.
+        """
+        if not start_date and not end_date:
+            return None
+        schema = ds.dataset(file_path, format='parquet', partitioning='hive').schema
+        if 'timestamp' not in schema.names:
+            return None
+        # Timestamps stored without a timezone are UTC; compare like with like
+        tz_naive = getattr(schema.field('timestamp').type, 'tz', None) is None
+        filters = []
+        for op, bound in (('>=', start_date), ('<=', end_date)):
+            if bound:
+                bound = pd.Timestamp(bound).tz_convert("UTC")
+                filters.append(('timestamp', op, bound.tz_localize(None) if tz_naive else bound))
+                # Whole year partitions outside the range are never opened
+                if 'year' in schema.names:
+                    filters.append(('year', op, bound.year))
+        return filters
 
     def load_data(self,
                   symbol: str,
                   interval: str,
                   start_date: Optional[datetime] = None,
-                  end_date: Optional[datetime] = None) -> pd.DataFrame:
+                  end_date: Optional[datetime] = None,
+                  columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Load stored data optionally sliced between start_date and end_date.
 
@@ -78,35 +170,49 @@ class DataStorage:
             interval: Data frequency.
             start_date: Start of date filter (inclusive).
             end_date: End of date filter (inclusive).
+            columns: Only read these columns (e.g. ['close']). All columns if None.
 
         Returns:
             DataFrame with filtered data or empty if file missing/error.
         """
-        file_path = self._get_file_path(symbol, interval)
+        # Prefer the year-partitioned dataset; fall back to a single file from older versions
+        file_path = self._get_dataset_path(symbol, interval)
+        if not file_path.exists():
+            file_path = self._get_file_path(symbol, interval)
         if not file_path.exists():
             logger.warning(f"Data file not found for {symbol} ({interval}) at {file_path}")
             return pd.DataFrame()
 
         try:
-            # Read Parquet file into DataFrame
-            df = pd.read_parquet(file_path, engine='pyarrow')
-
-            # Make sure index is datetime and timezone aware (UTC)
-            df.index = pd.to_datetime(df.index, utc=True)
-
-            # Ensure start_date and end_date are also timezone-aware before filtering
-            if start_date:
-                if getattr(start_date, 'tzinfo', None) is None:
-                    start_date = pd.Timestamp(start_date).tz_localize("UTC")
-                df = df[df.index >= start_date]
-
-            if end_date:
-                if getattr(end_date, 'tzinfo', None) is None:
-                    end_date = pd.Timestamp(end_date).tz_localize("UTC")
-                df = df[df.index <= end_date]
-
-            logger.info(f"Returning {len(df)} rows after date slicing for {symbol} at {interval}.")
-            print(f"[DataStorage] Loaded {len(df)} rows for {symbol} between {start_date} and {end_date} from {file_path}")
+            # Ensure start_date and end_date are timezone-aware (UTC) before filtering
+            if start_date and getattr(start_date, 'tzinfo', None) is None:
+                start_date = pd.Timestamp(start_date).tz_localize("UTC")
+            if end_date and getattr(end_date, 'tzinfo', None) is None:
+                end_date = pd.Timestamp(end_date).tz_localize("UTC")
+
+            # Read Parquet file into DataFrame, only decoding the rows in the date range
+            df = read_parquet_frame(file_path, columns, self._date_filters(file_path, start_date, end_date))
+            if file_path.is_dir():
+                # Drop the partition key
+                df = df.drop(columns='year', errors='ignore')
+
+            # Make sure index is datetime and timezone aware (UTC); stored timestamps are
+            # normally already tz-aware, and converting those only relabels the index
+            if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
+                df.index = df.index.tz_convert('UTC')
+            else:
+                df.index = pd.to_datetime(df.index, utc=True)
+
+            # Files without a 'timestamp' column could not be filtered while reading; with
+            # the index in order, the range is two binary searches and a slice
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+            first = df.index.searchsorted(start_date, side='left') if start_date else 0
+            last = df.index.searchsorted(end_date, side='right') if end_date else len(df)
+            df = df.iloc[first:last]
+
+            # Lazy %-formatting: nothing is formatted unless INFO records are emitted
+            logger.info("Returning %d rows after date slicing for %s at %s.", len(df), symbol, interval)
             return df
 
         except Exception as e:
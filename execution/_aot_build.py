@@ -0,0 +1,36 @@
+"""
+Ahead-of-time build of the execution kernels.
+
+Compiles simulate_signals from execution/_kernels.py into the native extension
+execution/_aot_kernels, which PaperTrader imports in preference to the JIT
+version so that even the first run after an install skips Numba compilation.
+Re-run this script after changing the kernel; without the extension the
+@njit(cache=True) kernel is used as before.
+
+Usage:
+    python execution/_aot_build.py
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path for relative imports when run as a script;
+# imported as part of the package, the root is already importable
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from numba.pycc import CC
+
+from execution._kernels import simulate_signals
+
+cc = CC('_aot_kernels')
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+# (price, signal_code, symbol_id, cash, sizes, entry_prices, commission, slippage, risk_per_trade)
+cc.export(
+    'simulate_signals',
+    'Tuple((i1[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:]))(f8[:], i1[:], i8[:], f8, f8[:], f8[:], f8, f8, f8)'
+)(simulate_signals.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built {cc.name} in {cc.output_dir}")
@@ -0,0 +1,152 @@
+"""
+Numba kernels for the PaperTrader.
+
+Signals are processed in order against shared cash, so the simulation is a
+sequential loop; it is compiled instead of run signal by signal in Python.
+Independent signal streams share nothing, so those run in parallel.
+Where Numba is not installed the same functions run as plain Python loops.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Per-signal outcomes reported by simulate_signals
+STATUS_NONE = 0
+STATUS_EXECUTED = 1
+STATUS_INSUFFICIENT_CASH = 2
+STATUS_NO_POSITION = 3
+
+
+@njit(cache=True)
+def simulate_signals(price, signal_code, symbol_id, cash, sizes, entry_prices,
+                     commission, slippage, risk_per_trade):
+    """
+    Executes a stream of signals against a long-only multi-symbol portfolio.
+
+    Args:
+        price: float64 signal prices.
+        signal_code: int8 signal per entry; 1 = BUY, -1 = SELL, 0 = none.
+        symbol_id: int64 index of each signal's symbol into sizes/entry_prices.
+        cash: Starting cash.
+        sizes, entry_prices: float64 position state per symbol; left unchanged.
+        commission: Fixed commission per trade.
+        slippage: Fractional slippage applied against each fill.
+        risk_per_trade: Fraction of cash committed on each BUY.
+
+    Returns:
+        status: int8 outcome per signal (one of the STATUS_* codes).
+        exec_price, quantity, cash_change: float64 fill details per signal.
+        cash_after, size_after, entry_after: float64 cash and the signal's
+            position once it is applied (a closed position has size 0).
+    """
+    n = price.shape[0]
+    sizes = sizes.copy()
+    entry_prices = entry_prices.copy()
+    status = np.zeros(n, dtype=np.int8)
+    exec_price = np.empty(n)
+    quantity = np.zeros(n)
+    cash_change = np.zeros(n)
+    cash_after = np.empty(n)
+    size_after = np.empty(n)
+    entry_after = np.empty(n)
+    # Fill-price multipliers are loop invariants
+    buy_mult = 1 + slippage
+    sell_mult = 1 - slippage
+
+    for i in range(n):
+        code = signal_code[i]
+        k = symbol_id[i]
+        if code == 1:
+            fill = price[i] * buy_mult
+            trade_value = cash * risk_per_trade
+            qty = trade_value / fill
+            if cash >= (qty * fill) + commission:
+                delta = - (qty * fill) - commission
+            else:
+                status[i] = STATUS_INSUFFICIENT_CASH
+                qty = 0.0
+                delta = 0.0
+        elif code == -1:
+            fill = price[i] * sell_mult
+            if sizes[k] > 0:
+                qty = -sizes[k]
+                delta = (sizes[k] * fill) - commission
+            else:
+                status[i] = STATUS_NO_POSITION
+                qty = 0.0
+                delta = 0.0
+        else:
+            fill = price[i]
+            qty = 0.0
+            delta = 0.0
+
+        if qty != 0.0:
+            status[i] = STATUS_EXECUTED
+            cash += delta
+            new_size = sizes[k] + qty
+            if new_size > 1e-6:
+                # Average the entry price when adding to an open position
+                if sizes[k] > 0 and qty > 0:
+                    entry_prices[k] = ((sizes[k] * entry_prices[k]) + (qty * fill)) / new_size
+                else:
+                    entry_prices[k] = fill
+                sizes[k] = new_size
+            else:
+                sizes[k] = 0.0
+                entry_prices[k] = 0.0
+
+        exec_price[i] = fill
+        quantity[i] = abs(qty)
+        cash_change[i] = delta
+        cash_after[i] = cash
+        size_after[i] = sizes[k]
+        entry_after[i] = entry_prices[k]
+
+    return status, exec_price, quantity, cash_change, cash_after, size_after, entry_after
+
+
+@njit(parallel=True, cache=True)
+def simulate_batches(price, signal_code, symbol_id, offsets, cash, sizes, entry_prices,
+                     commission, slippage, risk_per_trade):
+    """
+    Runs independent signal streams, each from the same starting cash and
+    positions, in parallel; stream b is entries offsets[b]:offsets[b + 1] of
+    the signal arrays (see simulate_signals for the other arguments).
+
+    Returns:
+        final_cash: float64 cash at the end of each stream.
+        final_sizes, final_entry_prices: (n_streams, n_symbols) float64 positions
+            at the end of each stream.
+    """
+    n_batches = offsets.shape[0] - 1
+    final_cash = np.empty(n_batches)
+    final_sizes = np.empty((n_batches, sizes.shape[0]))
+    final_entry_prices = np.empty((n_batches, sizes.shape[0]))
+    for b in prange(n_batches):
+        lo = offsets[b]
+        hi = offsets[b + 1]
+        ids = symbol_id[lo:hi]
+        status, exec_price, quantity, cash_change, cash_after, size_after, entry_after = simulate_signals(
+            price[lo:hi], signal_code[lo:hi], ids, cash, sizes, entry_prices,
+            commission, slippage, risk_per_trade
+        )
+        final_sizes[b] = sizes
+        final_entry_prices[b] = entry_prices
+        final_cash[b] = cash
+        # Each signal's post-trade position, replayed in order, leaves the final state
+        for i in range(hi - lo):
+            final_sizes[b, ids[i]] = size_after[i]
+            final_entry_prices[b, ids[i]] = entry_after[i]
+        if hi > lo:
+            final_cash[b] = cash_after[hi - lo - 1]
+    return final_cash, final_sizes, final_entry_prices
@@ -1,11 +1,16 @@
 import sys
 from pathlib import Path
 
-# Add project root to Python path for relative imports
-sys.path.append(str(Path(__file__).resolve().parent.parent))
+# Add project root to Python path for relative imports when run as a script;
+# imported as part of the package, the root is already importable
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
 
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 import alpaca_trade_api as tradeapi
 from alpaca_trade_api.rest import URL  # Correct import for URL
 from utils.data_structures import Signal  # Import our Signal dataclass
@@ -13,6 +18,13 @@ from utils.logger_setup import get_logger  # Import our logging utility
 from execution.risk_manager import RiskManager  # Import our RiskManager
 from dataclasses import asdict
 
+# Account details are reused for this long, so a burst of signals costs one account request
+ACCOUNT_CACHE_TTL_SECONDS = 0.5
+# Maximum number of orders submitted at once by LiveTrader.process_signals
+MAX_ORDER_WORKERS = 16
+# Streamed prices older than this (e.g. a quiet symbol or a dropped stream) are replaced by a REST lookup
+STREAMED_PRICE_MAX_AGE_SECONDS = 5.0
+
 # --- Abstract Broker Interface ---
 class BaseLiveAdapter(ABC):
     """
@@ -71,13 +83,17 @@ class AlpacaAdapter(BaseLiveAdapter):
     A concrete implementation of BaseLiveAdapter for the Alpaca Trading API.
     Uses alpaca-trade-api library.
     """
-    def __init__(self, api_key: str, api_secret: str, paper: bool = True):
+    def __init__(self, api_key: str, api_secret: str, paper: bool = True,
+                 stream_symbols: Optional[List[str]] = None):
         """
         Initializes the AlpacaAdapter.
         Args:
             api_key (str): Alpaca API Key ID.
             api_secret (str): Alpaca API Secret Key.
             paper (bool): If True, connects to the Alpaca paper trading environment; otherwise, live.
+            stream_symbols (Optional[List[str]]): Symbols whose trades are streamed over Alpaca's
+                WebSocket in a background thread, so `get_latest_price` serves them from memory
+                instead of a REST request per call. No stream is opened if None.
         """
         super().__init__("Alpaca")
         
@@ -93,6 +109,26 @@ class AlpacaAdapter(BaseLiveAdapter):
             print(f"Error connecting to Alpaca: {e}")
             raise  # Re-raise the exception to indicate connection failure
 
+        # Last account details and the monotonic time they were fetched
+        self._account: Dict[str, Any] = {}
+        self._account_fetched_at = float('-inf')
+
+        # Last streamed trade price per symbol and the monotonic time it was received
+        self._last_price: Dict[str, Tuple[float, float]] = {}
+        if stream_symbols:
+            self._start_trade_stream(api_key, api_secret, base_url, stream_symbols)
+
+    def _start_trade_stream(self, api_key: str, api_secret: str, base_url: URL, symbols: List[str]):
+        """Subscribes to trade updates for `symbols` and runs the stream in a daemon thread."""
+        stream = tradeapi.Stream(key_id=api_key, secret_key=api_secret, base_url=base_url)
+
+        async def on_trade(trade):
+            self._last_price[trade.symbol] = (trade.price, time.monotonic())
+
+        stream.subscribe_trades(on_trade, *symbols)
+        threading.Thread(target=stream.run, name="alpaca-trade-stream", daemon=True).start()
+        print(f"Streaming Alpaca trades for: {', '.join(symbols)}")
+
     def place_order(self, symbol: str, order_type: str, quantity: float, side: str) -> Dict[str, Any]:
         """Places a trade order with Alpaca."""
         try:
@@ -108,6 +144,8 @@ class AlpacaAdapter(BaseLiveAdapter):
                 time_in_force='gtc'  # Good 'til canceled
             )
             print(f"Placed {side.upper()} order for {qty} of {symbol} via Alpaca.")
+            # The order changes cash and equity; refetch them on the next lookup
+            self._account_fetched_at = float('-inf')
             return order._raw  # Return the raw dictionary response from Alpaca
         except Exception as e:
             print(f"Error placing order with Alpaca for {symbol}: {e}")
@@ -123,16 +161,30 @@ class AlpacaAdapter(BaseLiveAdapter):
             return []
 
     def get_account_balance(self) -> Dict[str, Any]:
-        """Retrieves account balance and equity information from Alpaca."""
+        """
+        Retrieves account balance and equity information from Alpaca.
+        Results are reused for ACCOUNT_CACHE_TTL_SECONDS and refetched after an order.
+        """
+        if time.monotonic() - self._account_fetched_at < ACCOUNT_CACHE_TTL_SECONDS:
+            return self._account
         try:
             account = self.api.get_account()
-            return account._raw  # Convert Alpaca object to dictionary
+            self._account = account._raw  # Convert Alpaca object to dictionary
+            self._account_fetched_at = time.monotonic()
+            return self._account
         except Exception as e:
             print(f"Error getting account balance from Alpaca: {e}")
             return {}
 
     def get_latest_price(self, symbol: str) -> float:
-        """Gets the latest market price for a symbol from Alpaca."""
+        """
+        Gets the latest market price for a symbol from Alpaca: the last streamed trade
+        if the symbol is streamed and traded within STREAMED_PRICE_MAX_AGE_SECONDS,
+        otherwise the latest trade over REST.
+        """
+        price, received_at = self._last_price.get(symbol, (0.0, float('-inf')))
+        if price and time.monotonic() - received_at < STREAMED_PRICE_MAX_AGE_SECONDS:
+            return price
         try:
             # Use the data_v2 client for market data (latest trade)
             trade = self.api.get_latest_trade(symbol)
@@ -158,28 +210,11 @@ class LiveTrader:
         self.risk_manager = risk_manager
         self.trade_logger = get_logger("trade")  # Get the dedicated trade logger
 
-    def process_signal(self, signal: Signal):
+    def _size_order(self, signal: Signal, portfolio_value: float, cash_balance: float) -> float:
         """
-        Processes a single trading signal. This is the main entry point for a signal
-        to potentially trigger a live trade.
+        Determines the order quantity for a signal using the RiskManager.
+        Returns 0 (and logs the skip) if the quantity is below the minimum tradable size.
         """
-        print(f"\n--- Processing Signal: {signal.signal_type} for {signal.symbol} at {signal.price} ---")
-        
-        # 1. Fetch current account status for risk checks
-        account_info = self.adapter.get_account_balance()
-        portfolio_value = float(account_info.get('equity', 0))
-        cash_balance = float(account_info.get('cash', 0))
-
-        # 2. Check system-wide circuit breakers
-        if self.risk_manager.check_circuit_breakers(portfolio_value):
-            print("Trading halted by circuit breaker. No order placed.")
-            self.trade_logger.warning(
-                "Trade skipped due to circuit breaker.",
-                extra={"extra_data": asdict(signal)}
-            )
-            return
-        
-        # 3. Determine position size using RiskManager
         # For a real system, the stop_loss_price would be dynamically determined (e.g., from strategy, ATR)
         # For this example, we'll use a simplified dynamic stop-loss or use price directly
         stop_loss_price = signal.price * 0.98 if signal.signal_type == 'BUY' else signal.price * 1.02  # Example 2% SL
@@ -194,14 +229,16 @@ class LiveTrader:
         
         # Ensure quantity is positive and meets minimum trade requirements (e.g., 1 share)
         if quantity < 1:  # Assuming integer shares for simplicity with Alpaca
-            print(f"Calculated quantity ({quantity:.2f}) is too small or zero. Skipping trade.")
+            print(f"Calculated quantity ({quantity:.2f}) for {signal.symbol} is too small or zero. Skipping trade.")
             self.trade_logger.info(
                 "Trade skipped: calculated quantity too small.",
                 extra={"extra_data": asdict(signal)}
             )
-            return
-        
-        # 4. Place the order via the adapter
+            return 0.0
+        return quantity
+
+    def _place_order(self, signal: Signal, quantity: float) -> Dict[str, Any]:
+        """Places a market order for a sized signal and logs the confirmation."""
         order_confirmation = self.adapter.place_order(
             symbol=signal.symbol,
             order_type='market',  # We'll use market orders for simplicity
@@ -209,7 +246,7 @@ class LiveTrader:
             side=signal.signal_type.lower()  # 'buy' or 'sell'
         )
         
-        # 5. Log the live trade attempt and confirmation
+        # Log the live trade attempt and confirmation
         self.trade_logger.info(
             "Live trade order placed",
             extra={
@@ -219,7 +256,83 @@ class LiveTrader:
                 }
             }
         )
-        print(f"Order placed. Confirmation: {order_confirmation.get('status', order_confirmation.get('error', 'UNKNOWN'))}")
+        print(f"Order placed for {signal.symbol}. Confirmation: {order_confirmation.get('status', order_confirmation.get('error', 'UNKNOWN'))}")
+        return order_confirmation
+
+    def _account_snapshot(self, signals: List[Signal]) -> Optional[Tuple[float, float]]:
+        """
+        Fetches equity and cash for risk checks. Returns None (and logs the skipped
+        signals) if a circuit breaker halts trading.
+        """
+        account_info = self.adapter.get_account_balance()
+        portfolio_value = float(account_info.get('equity', 0))
+        cash_balance = float(account_info.get('cash', 0))
+
+        if self.risk_manager.check_circuit_breakers(portfolio_value):
+            print("Trading halted by circuit breaker. No order placed.")
+            for signal in signals:
+                self.trade_logger.warning(
+                    "Trade skipped due to circuit breaker.",
+                    extra={"extra_data": asdict(signal)}
+                )
+            return None
+        return portfolio_value, cash_balance
+
+    def process_signal(self, signal: Signal):
+        """
+        Processes a single trading signal. This is the main entry point for a signal
+        to potentially trigger a live trade.
+        """
+        print(f"\n--- Processing Signal: {signal.signal_type} for {signal.symbol} at {signal.price} ---")
+        
+        # 1. Fetch current account status and check system-wide circuit breakers
+        snapshot = self._account_snapshot([signal])
+        if snapshot is None:
+            return
+        portfolio_value, cash_balance = snapshot
+        
+        # 2. Determine position size using RiskManager
+        quantity = self._size_order(signal, portfolio_value, cash_balance)
+        if not quantity:
+            return
+        
+        # 3. Place the order via the adapter and log it
+        self._place_order(signal, quantity)
+
+    def process_signals(self, signals: List[Signal]) -> List[Dict[str, Any]]:
+        """
+        Processes a batch of signals against one account snapshot and places their
+        orders concurrently, so the batch waits on roughly one broker round-trip
+        rather than one per signal.
+        Args:
+            signals (List[Signal]): Signals to act on, sized in the given order.
+        Returns:
+            List[Dict[str, Any]]: Order confirmations (or error details) for the orders placed.
+        """
+        if not signals:
+            return []
+        print(f"\n--- Processing {len(signals)} Signals ---")
+
+        snapshot = self._account_snapshot(signals)
+        if snapshot is None:
+            return []
+        portfolio_value, cash_balance = snapshot
+
+        # Size serially (RiskManager is not shared across threads); buys sized earlier
+        # in the batch reduce the cash available to later ones
+        orders = []
+        for signal in signals:
+            quantity = self._size_order(signal, portfolio_value, cash_balance)
+            if quantity:
+                orders.append((signal, quantity))
+                if signal.signal_type == 'BUY':
+                    cash_balance -= quantity * signal.price
+        if not orders:
+            return []
+
+        # Order placement is bound by network round-trips, so overlap the requests
+        with ThreadPoolExecutor(max_workers=min(MAX_ORDER_WORKERS, len(orders))) as executor:
+            return list(executor.map(lambda order: self._place_order(*order), orders))
 
 # Example usage for direct execution and testing
 if __name__ == "__main__":
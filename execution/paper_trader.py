@@ -1,12 +1,27 @@
 import sys
 from pathlib import Path
 
-# Add project root to Python path for relative imports
-sys.path.append(str(Path(__file__).resolve().parent.parent))
+# Add project root to Python path for relative imports when run as a script;
+# imported as part of the package, the root is already importable
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-from typing import List, Dict, Tuple
+import numpy as np
+from typing import List, Dict
 from utils.data_structures import Signal # Import our Signal dataclass
 from utils.logger_setup import get_logger # Import our logging utility
+from execution._kernels import simulate_batches, STATUS_INSUFFICIENT_CASH, STATUS_NO_POSITION
+try:
+    # Native build from execution/_aot_build.py: no JIT compilation on first use
+    from execution._aot_kernels import simulate_signals
+except ImportError:
+    from execution._kernels import simulate_signals
+
+# Initial number of symbol slots in the position arrays (grown as needed)
+POSITION_CAPACITY = 16
+# Signal types as the integer codes the simulation kernel branches on
+SIGNAL_CODES = {'BUY': 1, 'SELL': -1}
+
 class PaperTrader:
     """
     Simulates trade execution and manages a virtual portfolio.
@@ -17,7 +32,8 @@ class PaperTrader:
                  initial_capital: float, 
                  commission: float, 
                  slippage: float, 
-                 risk_per_trade: float):
+                 risk_per_trade: float,
+                 verbose: bool = False):
         """
         Initializes the PaperTrader with starting capital and cost parameters.
         Args:
@@ -25,128 +41,122 @@ class PaperTrader:
             commission (float): The fixed commission cost per trade.
             slippage (float): The percentage of price slippage to apply (e.g., 0.001 for 0.1%).
             risk_per_trade (float): The fraction of available cash to risk per BUY trade for position sizing.
+            verbose (bool): Print a banner and the portfolio status after every executed trade during run().
         """
         self.initial_capital = initial_capital
         self.cash = initial_capital
         self.commission = commission
         self.slippage = slippage
         self.risk_per_trade = risk_per_trade
-        # Portfolio: {'SYMBOL': {'size': float, 'entry_price': float}}
-        self.portfolio: Dict[str, Dict] = {}
+        self.verbose = verbose
+        # Positions as parallel arrays indexed by interned symbol; a closed position has size 0
+        self._symbol_to_idx: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._sizes = np.zeros(POSITION_CAPACITY, dtype=np.float64)
+        self._entry_prices = np.zeros_like(self._sizes)
         self.trade_logger = get_logger("trade") # Get the dedicated trade logger
-    def _execute_trade(self, 
-                       signal: Signal, 
-                       current_price: float) -> Tuple[float, float, float]:
-        """
-        Simulates the execution of a single trade, returning changes to cash and position.
-        Args:
-            signal (Signal): The trading signal to execute (BUY/SELL).
-            current_price (float): The current market price at which the signal was generated.
-        Returns:
-            Tuple[float, float, float]: 
-                - The change in cash balance.
-                - The change in position size for the symbol.
-                - The actual execution price after accounting for slippage.
-        """
-        # 1. Calculate execution price with slippage
-        if signal.signal_type == 'BUY':
-            execution_price = current_price * (1 + self.slippage)
-        elif signal.signal_type == 'SELL':
-            execution_price = current_price * (1 - self.slippage)
-        else:
-            return 0.0, 0.0, current_price # No changes for 'HOLD' signals
-        # 2. Determine trade size and calculate changes
-        position_for_symbol = self.portfolio.get(signal.symbol, {'size': 0})
-        cash_change = 0.0
-        position_change = 0.0
-        if signal.signal_type == 'BUY':
-            # Fixed fractional position sizing based on risk_per_trade
-            trade_value = self.cash * self.risk_per_trade
-            quantity = trade_value / execution_price
-            
-            # Ensure we have enough cash for the trade plus commission
-            if self.cash >= (quantity * execution_price) + self.commission:
-                cash_change = - (quantity * execution_price) - self.commission
-                position_change = quantity
-            else:
-                self.trade_logger.warning(f"Insufficient cash for BUY signal for {signal.symbol}. Skipping.")
-                return 0.0, 0.0, execution_price # Trade not executed
-        
-        elif signal.signal_type == 'SELL':
-            # If there's an open position, sell the entire quantity
-            if position_for_symbol['size'] > 0:
-                quantity = position_for_symbol['size']
-                cash_change = (quantity * execution_price) - self.commission
-                position_change = -quantity
-            else:
-                self.trade_logger.warning(f"No open position for {signal.symbol} to SELL. Skipping.")
-                return 0.0, 0.0, execution_price # No position to sell
-        return cash_change, position_change, execution_price
+    @property
+    def portfolio(self) -> Dict[str, Dict]:
+        """Open positions as {'SYMBOL': {'size': float, 'entry_price': float}}."""
+        return {self._symbols[i]: {'size': float(self._sizes[i]), 'entry_price': float(self._entry_prices[i])}
+                for i in np.flatnonzero(self._sizes[:len(self._symbols)] > 0).tolist()}
+
+    def _intern(self, symbol: str) -> int:
+        """Returns the position index of a symbol, assigning the next free one to a new symbol."""
+        idx = self._symbol_to_idx.setdefault(symbol, len(self._symbol_to_idx))
+        if idx == len(self._symbols):
+            self._symbols.append(symbol)
+            if idx == len(self._sizes):
+                # Double the capacity; new slots start as closed positions
+                self._sizes = np.concatenate([self._sizes, np.zeros_like(self._sizes)])
+                self._entry_prices = np.concatenate([self._entry_prices, np.zeros_like(self._entry_prices)])
+        return idx
+
     def run(self, signals: List[Signal]):
         """
         Runs the paper trading simulation by processing a list of signals.
+        The signals are executed in one compiled pass; trades are then logged in order.
         """
-        print("--- Starting Paper Trading Simulation ---")
-        
-        for signal in signals:
-            # In a real live trading system, `current_price` would be fetched from a live data feed.
-            # For this paper trading simulation, we use the `price` from the `Signal` object.
-            current_price = signal.price
-            
-            cash_delta, position_delta, exec_price = self._execute_trade(signal, current_price)
-            
+        if self.verbose:
+            print("--- Starting Paper Trading Simulation ---")
+        if not signals:
+            return
+
+        ids = np.fromiter((self._intern(s.symbol) for s in signals), dtype=np.int64, count=len(signals))
+        # In a real live trading system, the price would be fetched from a live data feed.
+        # For this paper trading simulation, we use the `price` from the `Signal` object.
+        prices = np.fromiter((s.price for s in signals), dtype=np.float64, count=len(signals))
+        codes = np.fromiter((SIGNAL_CODES.get(s.signal_type, 0) for s in signals), dtype=np.int8, count=len(signals))
+
+        status, exec_price, quantity, cash_change, cash_after, size_after, entry_after = simulate_signals(
+            prices, codes, ids, self.cash, self._sizes, self._entry_prices, self.commission, self.slippage, self.risk_per_trade
+        )
+
+        for i in np.flatnonzero(status).tolist():
+            signal = signals[i]
+            if status[i] == STATUS_INSUFFICIENT_CASH:
+                self.trade_logger.warning(f"Insufficient cash for BUY signal for {signal.symbol}. Skipping.")
+                continue
+            if status[i] == STATUS_NO_POSITION:
+                self.trade_logger.warning(f"No open position for {signal.symbol} to SELL. Skipping.")
+                continue
+
             # Only update portfolio and log if a trade actually occurred
-            if position_delta != 0.0:
-                self.cash += cash_delta
-                
-                # Update the specific position in the portfolio
-                current_position = self.portfolio.get(signal.symbol, {'size': 0, 'entry_price': 0})
-                new_size = current_position['size'] + position_delta
-                
-                if new_size > 1e-6: # Position still open or increased
-                    # Calculate new average entry price if adding to position
-                    if current_position['size'] > 0 and position_delta > 0:
-                        total_value = (current_position['size'] * current_position['entry_price']) + (position_delta * exec_price)
-                        new_entry_price = total_value / new_size
-                    else: # New position or fully reversed position
-                        new_entry_price = exec_price
-                    
-                    self.portfolio[signal.symbol] = {
-                        'size': new_size,
-                        'entry_price': new_entry_price
-                    }
-                else: # Position closed (or became negligibly small)
-                    if signal.symbol in self.portfolio:
-                        del self.portfolio[signal.symbol]
-                # Log the trade details to the structured trade log
-                self.trade_logger.info("Paper trade executed", extra={
-                    "extra_data": {
-                        "timestamp": signal.timestamp.isoformat(),
-                        "symbol": signal.symbol,
-                        "action": signal.signal_type,
-                        "quantity": abs(position_delta),
-                        "price": exec_price,
-                        "cash_change": cash_delta,
-                        "current_cash": self.cash
-                    }
-                })
+            self.cash = float(cash_after[i])
+            self._sizes[ids[i]] = size_after[i]
+            self._entry_prices[ids[i]] = entry_after[i]
+            # Log the trade details to the structured trade log
+            self.trade_logger.info("Paper trade executed", extra={
+                "extra_data": {
+                    "timestamp": signal.timestamp.isoformat(),
+                    "symbol": signal.symbol,
+                    "action": signal.signal_type,
+                    "quantity": float(quantity[i]),
+                    "price": float(exec_price[i]),
+                    "cash_change": float(cash_change[i]),
+                    "current_cash": self.cash
+                }
+            })
+            if self.verbose:
                 self.print_status() # Print status after each trade for clarity
+    def run_multi(self, signal_batches: List[List[Signal]]) -> List[float]:
+        """
+        Simulates independent signal streams (e.g. one per strategy or parameter set)
+        in parallel, each starting from the current cash and positions. The trader's
+        own state is left unchanged and no trades are logged.
+        Returns:
+            List[float]: Final cash of each stream.
+        """
+        signals = [signal for batch in signal_batches for signal in batch]
+        offsets = np.zeros(len(signal_batches) + 1, dtype=np.int64)
+        np.cumsum([len(batch) for batch in signal_batches], out=offsets[1:])
+        ids = np.fromiter((self._intern(s.symbol) for s in signals), dtype=np.int64, count=len(signals))
+        prices = np.fromiter((s.price for s in signals), dtype=np.float64, count=len(signals))
+        codes = np.fromiter((SIGNAL_CODES.get(s.signal_type, 0) for s in signals), dtype=np.int8, count=len(signals))
+
+        final_cash, _, _ = simulate_batches(
+            prices, codes, ids, offsets, float(self.cash), self._sizes, self._entry_prices,
+            self.commission, self.slippage, self.risk_per_trade
+        )
+        return final_cash.tolist()
     def print_status(self):
         """Prints the current status of the paper trading portfolio to the console."""
         print(f"\n--- Portfolio Status ---")
         print(f"Cash: ${self.cash:,.2f}") # Format cash to 2 decimal places with commas
         
-        total_position_value = 0.0
-        if not self.portfolio:
+        n = len(self._symbols)
+        sizes, entry_prices = self._sizes[:n], self._entry_prices[:n]
+        # For status, just use the entry price to estimate market value,
+        # In a real-time system, this would fetch current market prices.
+        total_position_value = float(np.dot(sizes, entry_prices))
+        open_positions = np.flatnonzero(sizes > 0).tolist()
+        if not open_positions:
             print("Positions: None")
         else:
             print("Positions:")
-            for symbol, pos in self.portfolio.items():
-                # For status, just use the entry price to estimate market value,
-                # In a real-time system, this would fetch current market prices.
-                market_value = pos['size'] * pos['entry_price'] 
-                total_position_value += market_value
-                print(f"  - {symbol}: Size={pos['size']:.4f}, Entry=${pos['entry_price']:.2f}, Market Value=${market_value:,.2f}")
+            for i in open_positions:
+                market_value = sizes[i] * entry_prices[i]
+                print(f"  - {self._symbols[i]}: Size={sizes[i]:.4f}, Entry=${entry_prices[i]:.2f}, Market Value=${market_value:,.2f}")
         
         total_equity = self.cash + total_position_value
         print(f"Total Equity: ${total_equity:,.2f}")
@@ -159,7 +169,8 @@ if __name__ == "__main__":
         initial_capital=100_000.0, # Start with 100,000 virtual dollars
         commission=1.0,            # $1 commission per trade
         slippage=0.001,            # 0.1% slippage on price
-        risk_per_trade=0.05        # Risk 5% of cash per BUY trade
+        risk_per_trade=0.05,       # Risk 5% of cash per BUY trade
+        verbose=True               # Show the portfolio after each trade
     )
     paper_trader.print_status() # Show initial empty portfolio
     # 2. Create a stream of mock signals to simulate
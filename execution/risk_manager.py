@@ -1,10 +1,13 @@
 import sys
 from pathlib import Path
 
-# Add project root to Python path for relative imports
-sys.path.append(str(Path(__file__).resolve().parent.parent))
+# Add project root to Python path for relative imports when run as a script;
+# imported as part of the package, the root is already importable
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 
+import numpy as np
 from typing import Dict, Optional
 from utils.logger_setup import get_logger # Import our logging utility
 class RiskManager:
@@ -115,6 +118,53 @@ class RiskManager:
             return True # Halt trading
             
         return False # No circuit breakers tripped
+    def check_circuit_breakers_series(self, portfolio_values: np.ndarray, day_starts: Optional[np.ndarray] = None) -> int:
+        """
+        Batch form of check_circuit_breakers for an equity curve, e.g. in a backtest.
+        Equivalent to calling check_circuit_breakers on each value in turn (with
+        reset_daily_limits before each day start) and stopping at the first halt.
+        Args:
+            portfolio_values (np.ndarray): The portfolio equity at each bar.
+            day_starts (Optional[np.ndarray]): Sorted indices of the bars that open a new trading day.
+        Returns:
+            int: Index of the first bar that trips a circuit breaker, or -1 if none does.
+        """
+        values = np.asarray(portfolio_values, dtype=np.float64)
+        n = len(values)
+        if n == 0:
+            return -1
+
+        # All-time high-water mark at each bar, carried on from earlier checks
+        overall_high = np.maximum.accumulate(values)
+        if self.overall_high_value is not None:
+            np.maximum(overall_high, self.overall_high_value, out=overall_high)
+
+        # Daily high-water mark, restarted at each day start
+        bounds = [0] + [int(i) for i in (day_starts if day_starts is not None else []) if 0 < i < n] + [n]
+        daily_high = np.empty_like(values)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            np.maximum.accumulate(values[start:end], out=daily_high[start:end])
+        if self.daily_high_value is not None and (day_starts is None or 0 not in day_starts):
+            np.maximum(daily_high[:bounds[1]], self.daily_high_value, out=daily_high[:bounds[1]])
+
+        daily_drawdown = (daily_high - values) / daily_high
+        overall_drawdown = (overall_high - values) / overall_high
+        daily_tripped = daily_drawdown > self.daily_drawdown_limit
+        tripped = daily_tripped | (overall_drawdown > self.overall_drawdown_limit)
+        first = int(np.argmax(tripped))
+        if not tripped[first]:
+            first = -1
+
+        # Leave the high-water marks where the bar-by-bar checks would have left them
+        last = first if first >= 0 else n - 1
+        self.daily_high_value = float(daily_high[last])
+        self.overall_high_value = float(overall_high[last])
+
+        if first >= 0 and daily_tripped[first]:
+            self.logger.critical(f"CIRCUIT BREAKER TRIPPED (DAILY): Portfolio drawdown of {daily_drawdown[first]:.2%} (from daily high ${self.daily_high_value:,.2f}) exceeded limit of {self.daily_drawdown_limit:.2%}. Halting trading.")
+        elif first >= 0:
+            self.logger.critical(f"CIRCUIT BREAKER TRIPPED (OVERALL): Portfolio drawdown of {overall_drawdown[first]:.2%} (from all-time high ${self.overall_high_value:,.2f}) exceeded limit of {self.overall_drawdown_limit:.2%}. Halting trading.")
+        return first
     def reset_daily_limits(self):
         """
         Resets the daily tracking variables (daily_high_value) to None.
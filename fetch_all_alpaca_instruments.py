@@ -1,5 +1,6 @@
 import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from alpaca_trade_api.rest import REST
 from dotenv import load_dotenv
 from pathlib import Path
@@ -20,24 +21,31 @@ DATA_DIR.mkdir(exist_ok=True)
 
 def save_to_csv(data, filename):
     path = DATA_DIR / filename
-    pd.DataFrame(data).to_csv(path, index=False)
+    df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+    df.to_csv(path, index=False)
     print(f"[✔] Saved {len(data)} records to '{path}'")
 
 def fetch_equities():
     print("[+] Fetching all active equities...")
     assets = api.list_assets(status="active")
-    equities = [a._raw for a in assets if a.tradable]
+    # Build the frame once; the subsets below are boolean masks over it
+    equities = pd.DataFrame([a._raw for a in assets if a.tradable])
 
     # Save all tradable equities
     save_to_csv(equities, "alpaca_equities_all.csv")
 
-    # Filter ETFs
-    etfs = [a for a in equities if "ETF" in a['name'].upper()]
-    save_to_csv(etfs, "alpaca_etfs.csv")
+    # An empty listing has no columns to filter on; write the subsets empty too
+    if equities.empty:
+        save_to_csv(equities, "alpaca_etfs.csv")
+        save_to_csv(equities, "alpaca_fractionals.csv")
+        return
+
+    # Filter ETFs (plain substring match, not a regex)
+    etf_mask = equities['name'].str.contains("ETF", case=False, regex=False, na=False)
+    save_to_csv(equities[etf_mask], "alpaca_etfs.csv")
 
     # Fractional shares
-    fractional = [a for a in equities if a.get('fractionable')]
-    save_to_csv(fractional, "alpaca_fractionals.csv")
+    save_to_csv(equities[equities['fractionable'].eq(True)], "alpaca_fractionals.csv")
 
 def fetch_crypto():
     print("[+] Fetching all crypto assets...")
@@ -49,5 +57,7 @@ def fetch_crypto():
         print(f"[!] Failed to fetch crypto assets: {e}")
 
 if __name__ == "__main__":
-    fetch_equities()
-    fetch_crypto()
+    # The two listings are independent blocking requests; run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for future in [executor.submit(fetch_equities), executor.submit(fetch_crypto)]:
+            future.result()
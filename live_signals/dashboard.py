@@ -1,24 +1,33 @@
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
+import orjson
 import os
 import io
+import re
+from collections import deque
 import warnings
 warnings.simplefilter(action='ignore', category=FutureWarning)
 # Adjust sys.path to allow imports from the project root
 import sys
 project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
 # Import core components
 from utils.config_loader import config
 from utils.logger_setup import get_logger # For internal dashboard logging if needed
-from execution.live_integration import AlpacaAdapter # For live portfolio data
-from data.data_storage import DataStorage # For loading processed data
-from ai_models.model_registry import ModelRegistry # For AI model insights
-from backtest.analytics import Analytics # To calculate metrics/plots for backtest reports
+# The heavier components (Alpaca SDK, model registry, Analytics with matplotlib) are imported
+# inside the functions that use them, so a rerun only loads what the open tabs need
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from execution.live_integration import AlpacaAdapter
+    from ai_models.model_registry import ModelRegistry
 # Global logger for dashboard itself (optional, mostly for debugging dashboard issues)
 dashboard_logger = get_logger("error")
 # --- Streamlit Page Configuration ---
@@ -27,18 +36,20 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
+# Numeric fields of an Alpaca position shown in the Open Positions table
+POSITION_NUMERIC_COLUMNS = ['qty', 'market_value', 'unrealized_pl', 'unrealized_plpc']
+# Model metadata lists/dicts longer than this are summarized until the full view is expanded
+METADATA_SUMMARY_MAX_ITEMS = 50
+# Number of model features listed before the rest are counted
+FEATURES_SHOWN = 100
 # --- Session State Initialization ---
 # This ensures data persists across reruns and allows for updates
-if "last_refresh_time" not in st.session_state:
-    st.session_state.last_refresh_time = datetime.now()
-if "portfolio_data" not in st.session_state:
-    st.session_state.portfolio_data = {}
-if "log_lines" not in st.session_state:
-    st.session_state.log_lines = {}
-for log_type in ['signals', 'trades', 'errors']:
-    if log_type not in st.session_state.log_lines:
-        st.session_state.log_lines[log_type] = []
 # --- Utility Functions ---
+@st.cache_resource # One adapter per key pair for the life of the dashboard process
+def get_alpaca_adapter(api_key: str, api_secret: str) -> "AlpacaAdapter":
+    """Connects to Alpaca once; its REST client's HTTP session keeps connections alive across refreshes."""
+    from execution.live_integration import AlpacaAdapter # For live portfolio data
+    return AlpacaAdapter(api_key=api_key, api_secret=api_secret, paper=True)
 @st.cache_data(ttl=15) # Cache live data for 15 seconds
 def get_live_portfolio_data():
     """Fetches live portfolio data from Alpaca."""
@@ -50,24 +61,24 @@ def get_live_portfolio_data():
         if not api_key or api_key == "YOUR_ALPACCA_API_KEY_ID_HERE":
             st.warning("Alpaca API keys are not configured. Live data cannot be fetched.")
             return {}
-        adapter = AlpacaAdapter(api_key=api_key, api_secret=api_secret, paper=True)
-        account_info = adapter.get_account_balance()
-        positions = adapter.get_open_positions()
-        # Format positions for display
-        formatted_positions = []
-        for pos in positions:
-            formatted_positions.append({
-                'symbol': pos.get('symbol'),
-                'qty': float(pos.get('qty')),
-                'market_value': float(pos.get('market_value')),
-                'unrealized_pl': float(pos.get('unrealized_pl')),
-                'unrealized_plpc': float(pos.get('unrealized_plpc')) * 100 # Convert to percentage
-            })
+        adapter = get_alpaca_adapter(api_key, api_secret)
+        # The two requests are independent; wait for the slower one instead of both in turn
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            account_future = executor.submit(adapter.get_account_balance)
+            positions_future = executor.submit(adapter.get_open_positions)
+            account_info = account_future.result()
+            positions = positions_future.result()
+        # Format positions for display as an Arrow table (st.dataframe sends it as is),
+        # the numeric fields parsed from Alpaca's strings column by column
+        columns = {'symbol': pa.array([pos.get('symbol') for pos in positions], type=pa.string())}
+        for col in POSITION_NUMERIC_COLUMNS:
+            columns[col] = pc.cast(pa.array([pos.get(col) for pos in positions]), pa.float64())
+        columns['unrealized_plpc'] = pc.multiply(columns['unrealized_plpc'], 100) # Convert to percentage
         return {
             'equity': float(account_info.get('equity', 0)),
             'cash': float(account_info.get('cash', 0)),
             'buying_power': float(account_info.get('buying_power', 0)),
-            'positions': formatted_positions,
+            'positions': pa.table(columns),
             'last_fetched': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
     except Exception as e:
@@ -75,60 +86,188 @@ def get_live_portfolio_data():
         st.error(f"Failed to fetch live data: {e}")
         return {}
 def tail_log_file(log_file_path: Path, n_lines: int = 50):
-    """Reads the last n_lines from a log file."""
-    if not log_file_path.exists():
+    """
+    Reads the last n_lines from a log file. The tail is kept in session state with the
+    byte offset read up to, so later calls only read what was appended since.
+    """
+    try:
+        stat = os.stat(log_file_path)
+    except FileNotFoundError:
+        return []
+    if n_lines <= 0:
         return []
-    with open(log_file_path, 'r') as f:
-        return f.readlines()[-n_lines:]
-@st.cache_data # Cache backtest results (they are static after a run)
-def get_backtest_reports():
-    """Reads all backtest result CSVs and their metadata."""
+    log_tails = st.session_state.setdefault('log_tails', {})
+    key = (str(log_file_path), n_lines)
+    tail = log_tails.get(key)
+    if tail is not None and tail['stamp'] == (stat.st_ino, stat.st_mtime_ns, stat.st_size):
+        return (list(tail['lines']) + tail['partial'])[-n_lines:]
+
+    with open(log_file_path, 'rb') as f:
+        data = None
+        if tail is not None and tail['inode'] == stat.st_ino and stat.st_size >= tail['offset']:
+            # The bytes before the offset must still match, or the file was rewritten in place
+            f.seek(tail['offset'] - len(tail['anchor']))
+            data = f.read()
+            if data.startswith(tail['anchor']):
+                data = data[len(tail['anchor']):]
+            else:
+                data = None
+        if data is None:
+            # First read, or the log was rotated or truncated: start from its last lines
+            tail = {'lines': deque(maxlen=n_lines), 'partial': [], 'inode': stat.st_ino, 'anchor': b'',
+                    'offset': _tail_start_offset(f, n_lines)}
+            log_tails[key] = tail
+            f.seek(tail['offset'])
+            data = f.read()
+    # Consume complete lines only; a trailing partial line is re-read once it is finished
+    end = data.rfind(b'\n') + 1
+    tail['lines'].extend(_decode_lines(data[:end]))
+    tail['partial'] = _decode_lines(data[end:])
+    if end:
+        tail['anchor'] = data[max(0, end - 64):end]
+    tail['offset'] += end
+    tail['stamp'] = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    return (list(tail['lines']) + tail['partial'])[-n_lines:]
+def _tail_start_offset(f, n_lines: int) -> int:
+    """Returns the byte offset of the n_lines-th last line of a binary file, reading backwards in blocks."""
+    block_size = 8192
+    data = b''
+    position = f.seek(0, os.SEEK_END)
+    # One newline more than needed guarantees the first kept line is complete
+    while position > 0 and data.count(b'\n') <= n_lines:
+        step = min(block_size, position)
+        position -= step
+        f.seek(position)
+        data = f.read(step) + data
+    if position == 0:
+        return 0
+    # Skip the partial first line (a block may also start inside a multi-byte character)
+    return position + data.index(b'\n') + 1
+def _decode_lines(data: bytes) -> list:
+    """Decodes and splits bytes like a text-mode readlines() (locale encoding, universal newlines)."""
+    return io.TextIOWrapper(io.BytesIO(data), newline=None).readlines()
+def _dir_sig(path: Path) -> int:
+    """
+    Latest modification time (ns) of a directory and its entries, 0 if it does not exist.
+    Adding, removing or rewriting a file changes it, so it keys the directory caches below.
+    """
+    try:
+        with os.scandir(path) as entries:
+            # The directory's own mtime covers removed and renamed files
+            return max(os.stat(path).st_mtime_ns, max((entry.stat().st_mtime_ns for entry in entries), default=0))
+    except FileNotFoundError:
+        return 0
+# Kept as is (no pickling per call) until the results directory changes; only the
+# current signature is kept, so the tables of a stale directory are released
+@st.cache_resource(max_entries=1)
+def get_backtest_reports(dir_sig: int):
+    """
+    Reads all backtest result files (Parquet, or CSV from older runs) and their metadata.
+    Args:
+        dir_sig (int): `_dir_sig` of the results directory; a new value re-scans it.
+    """
     results_path = project_root / "backtest" / "results"
     reports = {}
     if not results_path.exists():
         return reports
     
-    csv_files = list(results_path.glob('*.csv'))
-    for file in csv_files:
+    # One directory scan; parquet results come last so they replace a legacy CSV of the same report
+    with os.scandir(results_path) as entries:
+        result_files = sorted((entry.name for entry in entries
+                               if entry.name.endswith(('.csv', '.parquet')) and entry.is_file()),
+                              key=lambda name: name.endswith('.parquet'))
+    for file_name in result_files:
         try:
-            # We assume the naming convention: {strategy_name}_{symbol}_{interval}.csv
-            parts = file.stem.split('_')
+            # We assume the naming convention: {strategy_name}_{symbol}_{interval}.parquet
+            parts = os.path.splitext(file_name)[0].split('_')
             if len(parts) >= 3:
                 strategy_name = "_".join(parts[:-2]) # Handle strategy names with underscores
                 symbol = parts[-2]
                 interval = parts[-1]
                 report_key = f"{strategy_name} - {symbol} ({interval})"
-                reports[report_key] = file
+                reports[report_key] = results_path / file_name
         except Exception as e:
-            dashboard_logger.warning(f"Could not parse backtest report filename {file.name}: {e}")
+            dashboard_logger.warning(f"Could not parse backtest report filename {file_name}: {e}")
             continue
     return reports
-@st.cache_data # Cache model insights (static after training)
-def get_model_insights():
-    """Reads metadata for all trained models from the registry."""
-    registry = ModelRegistry()
-    saved_models_path = registry.registry_path # This is ai_models/saved_models
+@st.cache_data # Keyed on the file's mtime, so a re-run backtest is recomputed
+def get_report_metrics(report_path: str, mtime_ns: int) -> dict:
+    """
+    Returns the Analytics metrics of a backtest result file, from its `{stem}_metrics.json`
+    sidecar when that is newer than the results, otherwise computing and saving them.
+    """
+    results_file = Path(report_path)
+    sidecar = results_file.with_name(f"{results_file.stem}_metrics.json")
+    try:
+        if sidecar.stat().st_mtime_ns >= mtime_ns:
+            return json.loads(sidecar.read_text())
+    except (OSError, ValueError):
+        pass # Missing or unreadable sidecar: recompute
+    from backtest.analytics import Analytics # To calculate metrics for backtest reports
+    metrics = Analytics(results_file).calculate_all_metrics()
+    try:
+        sidecar.write_text(json.dumps(metrics))
+    except OSError as e:
+        dashboard_logger.warning(f"Could not write metrics sidecar {sidecar.name}: {e}")
+    return metrics
+@st.cache_resource # The registry object only locates the saved models directory
+def get_model_registry() -> "ModelRegistry":
+    from ai_models.model_registry import ModelRegistry # For AI model insights
+    return ModelRegistry()
+def load_model_metadata(metadata_path: str) -> dict:
+    with open(metadata_path, 'rb') as f:
+        return orjson.loads(f.read())
+# Kept as is (no pickling per call) until the saved models directory changes; only the
+# current signature is kept, so the tables of a stale directory are released
+@st.cache_resource(max_entries=1)
+def get_model_insights(dir_sig: int):
+    """
+    Reads metadata for all trained models from the registry.
+    Args:
+        dir_sig (int): `_dir_sig` of the saved models directory; a new value re-reads it.
+    """
+    saved_models_path = get_model_registry().registry_path # This is ai_models/saved_models
     
     insights = {}
     if not saved_models_path.exists():
         return insights
     
-    metadata_files = list(saved_models_path.glob('*_metadata.json'))
-    for file in metadata_files:
-        try:
-            with open(file, 'r') as f:
-                metadata = json.load(f)
-                model_name = metadata.get('model_name', file.stem)
+    from ai_models.model_registry import _parse_file_stem, METADATA_SUFFIX
+    def saved_at(file_name: str) -> int:
+        parsed = _parse_file_stem(file_name[:-len(METADATA_SUFFIX)])
+        return parsed[1] if parsed else -1
+    
+    with os.scandir(saved_models_path) as entries:
+        metadata_files = sorted(((entry.name, entry.path) for entry in entries
+                                 if entry.name.endswith(METADATA_SUFFIX) and entry.is_file()),
+                                key=lambda item: (saved_at(item[0]), item[0]))
+    # The files are read and parsed concurrently, then collected oldest first,
+    # so each model's latest version is the one kept
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(load_model_metadata, file_path) for _, file_path in metadata_files]
+        for (file_name, _), future in zip(metadata_files, futures):
+            try:
+                metadata = future.result()
+                model_name = metadata.get('model_name', os.path.splitext(file_name)[0])
                 insights[model_name] = metadata
-        except Exception as e:
-            dashboard_logger.warning(f"Could not load model metadata from {file.name}: {e}")
-            continue
+            except Exception as e:
+                dashboard_logger.warning(f"Could not load model metadata from {file_name}: {e}")
+                continue
     return insights
+@st.cache_resource # The config is loaded once per process, so the masked keys never change
+def get_masked_api_keys() -> dict:
+    """API keys from the config reduced to their first and last 4 characters."""
+    return {
+        key: f"{val[:4]}****{val[-4:]}" if val and len(val) > 8 else "****"
+        for key, val in config.get('api_keys', {}).items()
+    }
 # --- Dashboard Sections ---
+# Run by main_dashboard as a fragment re-running every refresh interval;
+# other widgets' reruns leave it alone
 def render_portfolio_overview():
     st.header("📈 Portfolio Overview")
     
-    portfolio = st.session_state.portfolio_data
+    portfolio = get_live_portfolio_data()
     if not portfolio:
         st.info("Loading live portfolio data...")
         return
@@ -138,16 +277,17 @@ def render_portfolio_overview():
     col2.metric("Cash", f"${portfolio.get('cash', 0):,.2f}")
     col3.metric("Buying Power", f"${portfolio.get('buying_power', 0):,.2f}")
     
-    # Calculate Unrealized P&L
-    total_unrealized_pl = sum(pos['unrealized_pl'] for pos in portfolio.get('positions', []))
+    positions = portfolio['positions']
+    # Calculate Unrealized P&L (the sum of no positions is null)
+    total_unrealized_pl = pc.sum(positions['unrealized_pl']).as_py() or 0.0
     col4.metric("Unrealized P&L", f"${total_unrealized_pl:,.2f}", 
                 delta=f"{total_unrealized_pl / portfolio.get('equity', 1) * 100:.2f}%" if portfolio.get('equity', 1) > 0 else "0.00%")
     st.subheader("Open Positions")
-    positions_df = pd.DataFrame(portfolio.get('positions', []))
-    if not positions_df.empty:
-        st.dataframe(positions_df.set_index('symbol'), use_container_width=True)
+    if positions.num_rows:
+        st.dataframe(positions, use_container_width=True, hide_index=True)
     else:
         st.info("No open positions.")
+# Run by main_dashboard as a fragment re-running every refresh interval
 def render_live_signals_activity():
     st.header("🚦 Live Signals & Activity")
     
@@ -159,16 +299,18 @@ def render_live_signals_activity():
         key='log_type_filter'
     )
     
-    log_lines = st.session_state.log_lines.get(log_type_filter, [])
+    # Only the selected log is read (tail_log_file reuses it while the file is unchanged)
+    log_lines = tail_log_file(project_root / "logs" / f"{log_type_filter}.log", n_lines=50)
     
     if log_lines:
         st.json(log_lines)
     else:
         st.info(f"No recent {log_type_filter} logs to display.")
+@st.fragment
 def render_strategy_performance():
     st.header("📊 Strategy Performance (Backtest Reports)")
     
-    reports = get_backtest_reports()
+    reports = get_backtest_reports(_dir_sig(project_root / "backtest" / "results"))
     report_selection = st.selectbox(
         "Select Backtest Report", 
         options=list(reports.keys()), 
@@ -181,23 +323,23 @@ def render_strategy_performance():
         st.subheader(f"Report for: {report_selection}")
         
         try:
-            # We can re-run analytics for fresh metric calculation or plot generation
-            # Or just load the already saved plots
-            analytics_engine = Analytics(report_file_path)
-            metrics = analytics_engine.calculate_all_metrics()
+            # Metrics are computed once per results file and reused from its sidecar;
+            # the plots are the ones already saved by the Analytics module
+            metrics = get_report_metrics(str(report_file_path), report_file_path.stat().st_mtime_ns)
             
             # Display metrics
             metrics_df = pd.DataFrame.from_dict(metrics, orient='index', columns=['Value'])
             metrics_df.index = metrics_df.index.str.replace('_', ' ').str.title()
             
-            # Format percentages and currencies
-            for idx, row in metrics_df.iterrows():
-                if any(kw in idx.lower() for kw in ['return', 'drawdown', 'win rate', 'volatility']):
-                    metrics_df.loc[idx, 'Value'] = f"{row['Value']:.2%}"
-                elif any(kw in idx.lower() for kw in ['capital', 'commission']): # Example, adjust as needed
-                    metrics_df.loc[idx, 'Value'] = f"${row['Value']:,.2f}"
-                else:
-                    metrics_df.loc[idx, 'Value'] = f"{row['Value']:.2f}"
+            # Format percentages and currencies, selecting the rows by name with masks
+            metric_names = metrics_df.index.str.lower()
+            values = metrics_df['Value'].astype(float)
+            pct_mask = metric_names.str.contains('return|drawdown|win rate|volatility')
+            cur_mask = metric_names.str.contains('capital|commission') & ~pct_mask # Example, adjust as needed
+            formatted = values.map('{:.2f}'.format)
+            formatted[pct_mask] = values[pct_mask].map('{:.2%}'.format)
+            formatted[cur_mask] = values[cur_mask].map('${:,.2f}'.format)
+            metrics_df['Value'] = formatted
             
             st.dataframe(metrics_df, use_container_width=True)
             
@@ -216,10 +358,11 @@ def render_strategy_performance():
                 st.warning("Drawdown curve plot not found. Run `backtest/engine.py` to generate.")
         except Exception as e:
             st.error(f"Error loading report for {report_selection}: {e}")
+@st.fragment
 def render_ai_model_insights():
     st.header("🧠 AI/Model Insights")
     
-    model_insights = get_model_insights()
+    model_insights = get_model_insights(_dir_sig(get_model_registry().registry_path))
     model_selection = st.selectbox(
         "Select Model", 
         options=list(model_insights.keys()), 
@@ -231,7 +374,13 @@ def render_ai_model_insights():
         metadata = model_insights[model_selection]
         st.subheader(f"Details for: {model_selection}")
         
-        st.json(metadata) # Display raw metadata for full detail
+        # Large lists (e.g. thousands of features) are collapsed to their length; the full tree sits in a closed expander
+        summary = {key: (f"<{type(value).__name__}, len={len(value)}>"
+                         if isinstance(value, (list, dict)) and len(value) > METADATA_SUMMARY_MAX_ITEMS else value)
+                   for key, value in metadata.items()}
+        st.json(summary)
+        with st.expander("Full metadata"):
+            st.json(metadata) # Display raw metadata for full detail
         
         st.markdown("**Core Metrics:**")
         metrics = metadata.get('metrics', {})
@@ -241,9 +390,13 @@ def render_ai_model_insights():
         col3.metric("Recall", f"{metrics.get('recall', 0):.2%}")
         st.markdown("**Features Used:**")
         features_used = metrics.get('features_used', [])
-        st.code(json.dumps(features_used, indent=2))
+        features_text = orjson.dumps(features_used[:FEATURES_SHOWN], option=orjson.OPT_INDENT_2).decode()
+        if len(features_used) > FEATURES_SHOWN:
+            features_text += f"\n... (+{len(features_used) - FEATURES_SHOWN} more)"
+        st.code(features_text)
     else:
         st.info("No trained models found in the registry.")
+@st.fragment
 def render_system_logs():
     st.header("📋 System Logs")
     
@@ -264,15 +417,18 @@ def render_system_logs():
         if log_level_filter == 'All' or log_type == log_level_filter:
             log_path = project_root / "logs" / f"{log_type}.log"
             all_logs_combined.extend(tail_log_file(log_path, 200)) # Get more lines for search
-    filtered_logs = []
-    for line in reversed(all_logs_combined): # Display newest first
-        if search_term.lower() in line.lower():
-            filtered_logs.append(line.strip())
+    # Display newest first; an empty search matches everything, so skip the scan
+    if search_term:
+        pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+        filtered_logs = [line.strip() for line in reversed(all_logs_combined) if pattern.search(line)]
+    else:
+        filtered_logs = [line.strip() for line in reversed(all_logs_combined)]
             
     if filtered_logs:
         st.text_area("Recent Log Entries", "\n".join(filtered_logs), height=400)
     else:
         st.info("No matching log entries found.")
+@st.fragment
 def render_settings_config():
     st.header("⚙️ Settings & Configuration")
     
@@ -283,11 +439,7 @@ def render_settings_config():
     st.subheader("Strategy Configurations")
     st.json(config.get('strategies', {}))
     st.subheader("API Key Placeholders (not actual keys)")
-    api_keys_masked = {
-        key: f"{val[:4]}****{val[-4:]}" if val and len(val) > 8 else "****"
-        for key, val in config.get('api_keys', {}).items()
-    }
-    st.json(api_keys_masked)
+    st.json(get_masked_api_keys())
     #st.json(config.get('api_keys', {}))
     
     st.subheader("Risk Management Settings")
@@ -298,15 +450,11 @@ def main_dashboard():
     with st.sidebar:
         st.title("Admin Controls")
         
+        # The live tabs re-run themselves at this interval, even while the user is idle
         refresh_rate_sec = st.slider("Auto-Refresh Interval (seconds)", 5, 60, 15)
-        st.session_state.refresh_rate = refresh_rate_sec
-        if st.button("Manual Refresh"):
-            st.session_state.last_refresh_time = datetime.now()
-            #st.experimental_rerun()
-            st.rerun()
-
+        st.button("Manual Refresh") # Clicking any widget already reruns the script
         
-        st.write(f"Last auto-refresh: {st.session_state.last_refresh_time.strftime('%H:%M:%S')}")
+        st.write(f"Last refresh: {datetime.now().strftime('%H:%M:%S')}")
         
         st.markdown("---")
         st.markdown("### Navigation")
@@ -320,16 +468,13 @@ def main_dashboard():
         "📋 System Logs", 
         "⚙️ Configuration"
     ])
-    # --- Update Live Data ---
-    # This block will run on every refresh/rerun
-    st.session_state.portfolio_data = get_live_portfolio_data()
-    st.session_state.log_lines['signals'] = tail_log_file(project_root / "logs" / "signals.log", n_lines=50)
-    st.session_state.log_lines['trades'] = tail_log_file(project_root / "logs" / "trades.log", n_lines=50)
-    st.session_state.log_lines['errors'] = tail_log_file(project_root / "logs" / "errors.log", n_lines=50)
+    # Each tab is a fragment: interacting with one reruns only that tab,
+    # and the live tabs refresh themselves (portfolio data is fetched by its own tab).
+    # Their run_every follows the slider, so they are wrapped here rather than decorated
     with tab1:
-        render_portfolio_overview()
+        st.fragment(render_portfolio_overview, run_every=refresh_rate_sec)()
     with tab2:
-        render_live_signals_activity()
+        st.fragment(render_live_signals_activity, run_every=refresh_rate_sec)()
     with tab3:
         render_strategy_performance()
     with tab4:
@@ -338,12 +483,6 @@ def main_dashboard():
         render_system_logs()
     with tab6:
         render_settings_config()
-    # --- Auto-refresh logic ---
-    time_since_last_refresh = (datetime.now() - st.session_state.last_refresh_time).total_seconds()
-    if time_since_last_refresh >= st.session_state.refresh_rate:
-        st.session_state.last_refresh_time = datetime.now()
-        #st.experimental_rerun()
-        st.rerun()
 # --- Entry point for Streamlit ---
 if __name__ == "__main__":
     main_dashboard()
\ No newline at end of file
@@ -4,6 +4,7 @@ error_logger = get_logger("error")
 error_logger.info("Application starting up.", extra={"extra_data": {"version": "0.1.0"}})
 
 import argparse
+import importlib.util
 import json
 import subprocess
 from pathlib import Path
@@ -41,6 +42,7 @@ class MainApp:
         """
         Runs the full model retraining pipeline for a specified symbol and interval.
         This fetches new data, re-engineers features, and trains/saves new models.
+        `symbol` may list several comma-separated symbols, whose data is fetched concurrently.
         """
         print(f"\n--- Initiating Model Retraining for {symbol} ({interval}) via CLI ---")
         # Parameters for the retrainer come from a sensible default or config
@@ -48,7 +50,11 @@ class MainApp:
             retrain_schedule_days=self.config.get('autotrain', {}).get('retrain_schedule_days', 30),
             performance_threshold=self.config.get('autotrain', {}).get('performance_threshold', 0.10)
         )
-        retrainer.run_retraining_pipeline(symbol, interval)
+        symbols = [s.strip() for s in symbol.split(',') if s.strip()]
+        if len(symbols) > 1:
+            retrainer.run_retraining_pipelines(symbols, interval)
+        else:
+            retrainer.run_retraining_pipeline(symbols[0] if symbols else symbol, interval)
         print(f"\n--- Retraining complete for {symbol} ({interval}) ---")
     def run_backtest(self, strategy_name: str, symbol: str, interval: str):
         """
@@ -82,7 +88,7 @@ class MainApp:
             
             # Optionally generate analytics report immediately after backtest
             from backtest.analytics import Analytics
-            results_file = Path("backtest") / "results" / f"{strategy_name}_{symbol}_{interval}.csv"
+            results_file = Path("backtest") / "results" / f"{strategy_name}_{symbol}_{interval}.parquet"
             if results_file.exists():
                 analytics_engine = Analytics(results_file)
                 analytics_engine.generate_report()
@@ -162,14 +168,17 @@ class MainApp:
             print("Please ensure 'live_signals/dashboard.py' exists.")
             return
         
-        try:
-            # Use subprocess to run streamlit, as it runs its own server
-            print(f"Running command: streamlit run {dashboard_script_path}")
-            subprocess.run(["streamlit", "run", str(dashboard_script_path)], check=True)
-        except FileNotFoundError:
-            print("\nError: 'streamlit' command not found.")
+        if importlib.util.find_spec("streamlit") is None:
+            print("\nError: Streamlit is not installed in this Python environment.")
             print("Please make sure Streamlit is installed: 'pip install streamlit'")
-            print("And that 'streamlit' is in your system's PATH.")
+            return
+        
+        try:
+            # Use subprocess to run streamlit, as it runs its own server; running it as a module of
+            # this interpreter skips the PATH lookup and uses the environment the bot runs in
+            cmd = [sys.executable, "-m", "streamlit", "run", str(dashboard_script_path)]
+            print(f"Running command: {' '.join(cmd)}")
+            subprocess.run(cmd, check=True)
         except subprocess.CalledProcessError as e:
             print(f"\nError running Streamlit dashboard: {e}")
             print("Check Streamlit output above for more details.")
@@ -207,7 +216,8 @@ if __name__ == "__main__":
         '--symbol', 
         type=str, 
         default='AAPL', # Default symbol for convenience
-        help="The trading symbol to operate on (e.g., 'AAPL', 'BTC/USDT'). Default: AAPL"
+        help="The trading symbol to operate on (e.g., 'AAPL', 'BTC/USDT'). Default: AAPL\n"
+             "For 'retrain', several comma-separated symbols (e.g., 'AAPL,MSFT') are retrained together."
     )
     parser.add_argument(
         '--interval', 
@@ -1,12 +1,15 @@
-from typing import Dict, Type
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Mapping, Type
 
-# Forward declaration to avoid circular import
-class BaseStrategy:
-    pass
+if TYPE_CHECKING:
+    # Type hints only; importing it at runtime would be circular
+    from strategies.base_strategy import BaseStrategy
 
-STRATEGY_REGISTRY: Dict[str, Type[BaseStrategy]] = {}
+STRATEGY_REGISTRY: Dict[str, Type["BaseStrategy"]] = {}
+# Read-only view of the registry for lookups; it reflects strategies registered later
+STRATEGY_REGISTRY_FROZEN: Mapping[str, Type["BaseStrategy"]] = MappingProxyType(STRATEGY_REGISTRY)
 
-def register_strategy(strategy_class: Type[BaseStrategy]):
+def register_strategy(strategy_class: Type["BaseStrategy"]):
     """
     A class decorator to register a strategy in the central registry.
     
@@ -21,10 +24,11 @@ def register_strategy(strategy_class: Type[BaseStrategy]):
     STRATEGY_REGISTRY[strategy_class.name] = strategy_class
     return strategy_class
 
-def get_strategy_class(name: str) -> Type[BaseStrategy]:
+def get_strategy_class(name: str) -> Type["BaseStrategy"]:
     """
     Retrieves a strategy class by its unique name from the registry.
     """
-    if name not in STRATEGY_REGISTRY:
+    strategy_class = STRATEGY_REGISTRY_FROZEN.get(name) # One lookup on the hit path
+    if strategy_class is None:
         raise ValueError(f"Strategy '{name}' not found in registry. Available: {list(STRATEGY_REGISTRY.keys())}")
-    return STRATEGY_REGISTRY[name]
\ No newline at end of file
+    return strategy_class
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""
+Ahead-of-time build of the strategy kernels.
+
+Compiles the indicator and crossing kernels used by the classical strategies
+(RSI, Bollinger Bands, EMA from ai_models/_ta_kernels.py and the Z-score scan
+from strategies/_kernels.py) into the native extension strategies/_aot_kernels.
+The strategies import it in preference to the JIT versions, so a fresh process
+(a short backtest, a test run) skips Numba compilation. Re-run this script
+after changing a kernel; without the extension the @njit(cache=True) kernels
+are used as before.
+
+Usage:
+    python strategies/_aot_build.py
+"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path for relative imports when run as a script;
+# imported as part of the package, the root is already importable
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from numba.pycc import CC
+
+from ai_models._ta_kernels import rsi_wilder, bbands, ema
+from strategies._kernels import zscore_crossings
+
+cc = CC('_aot_kernels')
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+# (close, length)
+cc.export('rsi_wilder', 'f8[:](f8[:], i8)')(rsi_wilder.py_func)
+cc.export('ema', 'f8[:](f8[:], i8)')(ema.py_func)
+# (close, length, std) -> lower, mid, upper, bandwidth, percent
+cc.export('bbands', 'UniTuple(f8[:], 5)(f8[:], i8, f8)')(bbands.py_func)
+# (close, window, threshold)
+cc.export('zscore_crossings', 'i1[:](f8[:], i8, f8)')(zscore_crossings.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built {cc.name} in {cc.output_dir}")
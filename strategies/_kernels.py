@@ -0,0 +1,78 @@
+"""
+Numba kernels for the strategies.
+
+Indicator scans that carry state from bar to bar (running window statistics,
+threshold crossings) are compiled into one pass over the close prices.
+Where Numba is not installed the same functions run as plain Python loops.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def zscore_crossings(close, window, threshold):
+    """
+    Flags the bars where the rolling Z-score of the close crosses a threshold.
+
+    The Z-score is (close - mean) / std over the last `window` closes, with the
+    sample standard deviation, as `close.rolling(window).mean()` / `.std()`:
+    it is NaN until a full window without NaNs is available, and NaN (0 / 0)
+    over a window of identical closes. The running mean and variance are
+    updated as closes enter and leave the window (Welford).
+
+    Args:
+        close: float64 close prices.
+        window: Rolling window length in bars.
+        threshold: Z-score level; crossings of -threshold and +threshold count.
+
+    Returns:
+        signal_code: int8 per bar; 1 where the Z-score falls to -threshold or
+            below (BUY), -1 where it rises to +threshold or above (SELL), else 0.
+    """
+    n = close.shape[0]
+    signal_code = np.zeros(n, dtype=np.int8)
+    count = 0
+    mean = 0.0
+    m2 = 0.0 # Sum of squared deviations from the mean
+    same_run = 0 # Number of consecutive closes equal to the current one
+    prev_z = np.nan
+    for i in range(n):
+        x = close[i]
+        same_run = same_run + 1 if i > 0 and x == close[i - 1] else 1
+        if not np.isnan(x):
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+        if i >= window:
+            old = close[i - window]
+            if not np.isnan(old):
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / count
+                    m2 -= delta * (old - mean)
+
+        z = np.nan
+        if count >= window and count > 1 and same_run < window:
+            var = m2 / (count - 1)
+            z = (x - mean) / np.sqrt(var if var > 0.0 else 0.0)
+
+        if i > 0:
+            if prev_z > -threshold and z <= -threshold:
+                signal_code[i] = 1
+            elif prev_z < threshold and z >= threshold:
+                signal_code[i] = -1
+        prev_z = z
+    return signal_code
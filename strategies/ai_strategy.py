@@ -1,10 +1,16 @@
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import Iterator, Dict, Any, Tuple
 from strategies.base_strategy import BaseStrategy, StrategyConfig
 from utils.data_structures import Signal
 from strategies import register_strategy
 from ai_models.model_registry import ModelRegistry
 from ai_models.feature_engineering import FeatureEngineer
+
+# Rows per predict_proba call; keeps each batch's features and tree traversal cache-resident
+PREDICT_BATCH_ROWS = 8192
+
 @register_strategy
 class AIStrategy(BaseStrategy):
     """
@@ -16,6 +22,20 @@ class AIStrategy(BaseStrategy):
         "model_name": (str, "default_model_name", None),
         "confidence_threshold": (float, 0.5, 1.0),
     }
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _load_model(model_name: str) -> Tuple[Any, Dict]:
+        """
+        Loads the latest version of a model from the registry once per process; every
+        AIStrategy using the same model (e.g. across symbols or folds) shares the estimator
+        and metadata, which are treated as read-only. Call `AIStrategy._load_model.cache_clear()`
+        to pick up a model retrained in the same process.
+        """
+        model, metadata = ModelRegistry().load_latest_model(model_name)
+        if model is None:
+            # Raised rather than returned, so a missing model is not cached
+            raise FileNotFoundError(f"Could not load model '{model_name}' from registry.")
+        return model, metadata
     def __init__(self, config: StrategyConfig, symbol: str):
         """
         Initializes the AI-driven strategy by loading the specified ML model.
@@ -25,50 +45,73 @@ class AIStrategy(BaseStrategy):
         if not self.model_name:
             raise ValueError("AI strategy config must include a 'model_name' parameter.")
         
-        # Load the specified model from the registry
-        registry = ModelRegistry()
-        self.model, self.metadata = registry.load_latest_model(self.model_name)
-        if self.model is None:
-            raise FileNotFoundError(f"Could not load model '{self.model_name}' from registry.")
+        # Load the specified model from the registry (shared with other instances of the same model)
+        self.model, self.metadata = self._load_model(self.model_name)
+        
+        # The feature list the model was trained on, checked once here instead of on every call
+        model_features = self.metadata.get('metrics', {}).get('features_used', [])
+        if not model_features:
+            raise ValueError("Model metadata does not contain the list of features used for training.")
+        self._model_features = pd.Index(model_features)
+        self._feature_engineer = FeatureEngineer()
+        self._confidence_threshold = float(self.config.params.get("confidence_threshold", 0.5))
+        self._feature_dtype = self._prediction_dtype()
+        # Class label of each predict_proba column; a model without sklearn's classes_
+        # attribute is taken to predict classes 0..n-1 in column order
+        classes = getattr(self.model, 'classes_', None)
+        if classes is None:
+            probe = np.zeros((1, len(self._model_features)), dtype=self._feature_dtype)
+            classes = np.arange(self.model.predict_proba(probe).shape[1])
+        self._classes = np.asarray(classes)
         
         training_date = self.metadata.get('metrics', {}).get('training_date', 'N/A')
         print(f"AI Strategy '{self.name}' initialized with model trained on {training_date}")
-    def generate_signals(self, data: pd.DataFrame) -> List[Signal]:
+    def _prediction_dtype(self) -> type:
         """
-        Generates signals using the loaded machine learning model.
+        The dtype the feature matrix is passed to the model in: float32 (half the bytes
+        per prediction; the tree models compare features in float32 anyway) if the model
+        accepts a float32 array, checked once on a one-row batch, otherwise float64.
+        """
+        try:
+            self.model.predict_proba(np.zeros((1, len(self._model_features)), dtype=np.float32))
+        except Exception:
+            return np.float64
+        return np.float32
+    def stream_signals(self, data: pd.DataFrame) -> Iterator[Signal]:
+        """
+        Yields signals using the loaded machine learning model.
         """
         # 1. Engineer features for the input data, just like during training
-        feature_engineer = FeatureEngineer()
-        feature_df = feature_engineer.generate_features(data.copy())
+        # (generate_features builds a new frame and never modifies its input, so no copy is needed)
+        feature_df = self._feature_engineer.generate_features(data)
         
         # Ensure the data has the exact same columns the model was trained on
-        model_features = self.metadata.get('metrics', {}).get('features_used', [])
-        if not model_features:
-            raise ValueError("Model metadata does not contain the list of features used for training.")
-        
         # Align columns, filling missing ones with 0 (if any)
-        X = feature_df.reindex(columns=model_features, fill_value=0)
+        X = feature_df.reindex(columns=self._model_features, fill_value=0)
         
-        # 2. Get model predictions and probabilities
-        predictions = self.model.predict(X)
-        probabilities = self.model.predict_proba(X) # Shape: (n_samples, n_classes)
+        # 2. Get model probabilities; the prediction is the most probable class,
+        # as model.predict would return, without a second pass through the model
+        features = X.to_numpy(dtype=self._feature_dtype)
+        probabilities = np.empty((len(features), len(self._classes))) # Shape: (n_samples, n_classes)
+        for start in range(0, len(features), PREDICT_BATCH_ROWS):
+            stop = start + PREDICT_BATCH_ROWS
+            probabilities[start:stop] = self.model.predict_proba(features[start:stop])
+        predicted_col = probabilities.argmax(axis=1)
+        predictions = self._classes[predicted_col]
         # 3. Create signals based on predictions and confidence
-        signals = []
-        confidence_threshold = self.config.params.get("confidence_threshold", 0.5)
-        for i in range(len(X)):
-            prediction = predictions[i]
-            # Confidence is the probability of the predicted class
-            confidence = probabilities[i][prediction] 
-            if confidence >= confidence_threshold:
-                # A prediction of 1 means 'UP', so we BUY.
-                # A prediction of 0 means 'NOT UP', so we SELL (or exit a long position).
-                signal_type = 'BUY' if prediction == 1 else 'SELL'
-                
-                signals.append(self._create_signal(
-                    timestamp=X.index[i],
-                    signal_type=signal_type,
-                    price=data.loc[X.index[i], 'close'],
-                    confidence=float(confidence) # Ensure it's a standard float
-                ))
-                
-        return signals
\ No newline at end of file
+        # Confidence is the probability of the predicted class, gathered for all rows at once;
+        # only the rows at or above the threshold become signals
+        confidences = probabilities[np.arange(len(X)), predicted_col]
+        mask = confidences >= self._confidence_threshold
+        timestamps = X.index[mask]
+        prices = data['close'].reindex(timestamps).to_numpy()
+        # A prediction of 1 means 'UP', so we BUY.
+        # A prediction of 0 means 'NOT UP', so we SELL (or exit a long position).
+        for timestamp, prediction, price, confidence in zip(
+                timestamps, predictions[mask].tolist(), prices, confidences[mask].tolist()):
+            yield self._create_signal(
+                timestamp=timestamp,
+                signal_type='BUY' if prediction == 1 else 'SELL',
+                price=price,
+                confidence=confidence # A standard float, from tolist()
+            )
\ No newline at end of file
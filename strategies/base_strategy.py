@@ -1,7 +1,9 @@
+import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict, field
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import pandas as pd
 from utils.data_structures import Signal
 from utils.logger_setup import get_logger
@@ -9,6 +11,12 @@ from utils.logger_setup import get_logger
 # Use the dedicated signal logger we created in Phase 1
 signal_logger = get_logger("signal")
 
+# Number of validated parameter sets remembered, least recently used evicted first
+VALIDATED_PARAMS_CACHE_SIZE = 1024
+
+# (strategy class, params) combinations that already passed _validate_parameters
+_validated_params: "OrderedDict[tuple, None]" = OrderedDict()
+
 @dataclass
 class StrategyConfig:
     """
@@ -26,7 +34,7 @@ class BaseStrategy(ABC):
     1. Inherit from this class.
     2. Be decorated with @register_strategy.
     3. Define `name`, `description`, and `param_definitions`.
-    4. Implement the `generate_signals` method.
+    4. Implement the `stream_signals` method.
     """
     name: str = "base_strategy"
     description: str = "Abstract base strategy (override in subclasses)"
@@ -45,23 +53,42 @@ class BaseStrategy(ABC):
 
     def _validate_parameters(self):
         """Validates that all provided parameters match the strategy's definitions."""
+        # Parameter sweeps construct many instances with the same parameters; check each set once.
+        # Types are part of the key, since 2 == 2.0 but only one of them may be valid.
+        try:
+            key = (type(self), tuple(sorted((name, type(value), value) for name, value in self.config.params.items())))
+            if key in _validated_params:
+                _validated_params.move_to_end(key)
+                return
+        except TypeError:
+            key = None # Unhashable or unsortable parameter values: validate without caching
         for param_name, (expected_type, _, _) in self.param_definitions.items():
             if param_name not in self.config.params:
                 raise ValueError(f"Missing required parameter '{param_name}' for strategy {self.name}.")
             
             param_value = self.config.params[param_name]
-            if not isinstance(param_value, expected_type):
+            # Exact type match first (the usual case for int/float/str); isinstance only for subclasses
+            if type(param_value) is not expected_type and not isinstance(param_value, expected_type):
                 raise TypeError(f"Parameter '{param_name}' for strategy {self.name} must be "
                                 f"of type {expected_type.__name__}, but got {type(param_value).__name__}.")
+        if key is not None:
+            _validated_params[key] = None
+            if len(_validated_params) > VALIDATED_PARAMS_CACHE_SIZE:
+                _validated_params.popitem(last=False)
 
     @abstractmethod
-    def generate_signals(self, data: pd.DataFrame) -> List[Signal]:
+    def stream_signals(self, data: pd.DataFrame) -> Iterator[Signal]:
         """
-        Generates trading signals based on the provided market data.
-        This is the core logic of the strategy.
+        Yields trading signals, in time order, based on the provided market data.
+        This is the core logic of the strategy; consumers that handle one signal
+        at a time never hold the full list.
         """
         pass
 
+    def generate_signals(self, data: pd.DataFrame) -> List[Signal]:
+        """Generates all trading signals for the provided market data as a list."""
+        return list(self.stream_signals(data))
+
     def _create_signal(self, 
                        timestamp: datetime, 
                        signal_type: str, 
@@ -70,7 +97,6 @@ class BaseStrategy(ABC):
         """
         Helper method to create and log a standardized Signal object.
         """
-        print(f"Logging signal at {timestamp}")
         signal = Signal(
             timestamp=timestamp,
             symbol=self.symbol,
@@ -79,8 +105,17 @@ class BaseStrategy(ABC):
             price=price,
             confidence=confidence
         )
-        # Log the signal to our dedicated, structured signal log file
-        #signal_logger.info("Signal generated", extra={"extra_data": signal.__dict__})
-        signal_logger.info("Signal generated", extra={"extra_data": asdict(signal)})
+        # Log the signal to our dedicated, structured signal log file.
+        # Signal is a slotted dataclass (no __dict__), and asdict() deep-copies every field,
+        # so the flat record is built from the fields directly, and only if it will be logged.
+        if signal_logger.isEnabledFor(logging.INFO):
+            signal_logger.info("Signal generated", extra={"extra_data": {
+                "timestamp": timestamp,
+                "symbol": signal.symbol,
+                "strategy": signal.strategy,
+                "signal_type": signal_type,
+                "price": price,
+                "confidence": confidence,
+            }})
 
         return signal
\ No newline at end of file
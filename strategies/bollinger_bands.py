@@ -1,9 +1,14 @@
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
-from typing import List
-from strategies.base_strategy import BaseStrategy
+from typing import Iterator
+from strategies.base_strategy import BaseStrategy, StrategyConfig
 from utils.data_structures import Signal
 from strategies import register_strategy
+try:
+    # Native build from strategies/_aot_build.py: no JIT compilation on first use
+    from strategies._aot_kernels import bbands
+except ImportError:
+    from ai_models._ta_kernels import bbands
 
 @register_strategy
 class BollingerBands(BaseStrategy):
@@ -19,26 +24,25 @@ class BollingerBands(BaseStrategy):
         "bb_std_dev": (float, 2.0, None),
     }
 
-    def generate_signals(self, data: pd.DataFrame) -> List[Signal]:
-        # Calculate Bollinger Bands
-        data.ta.bbands(length=self.config.params['bb_period'], std=self.config.params['bb_std_dev'], append=True)
-        lower_band_col = f"BBL_{self.config.params['bb_period']}_{self.config.params['bb_std_dev']}"
-        upper_band_col = f"BBU_{self.config.params['bb_period']}_{self.config.params['bb_std_dev']}"
+    def __init__(self, config: StrategyConfig, symbol: str):
+        super().__init__(config, symbol)
+        # Validated parameters bound to attributes once, instead of dict lookups per call
+        self._period = config.params['bb_period']
+        self._std_dev = float(config.params['bb_std_dev'])
 
-        signals = []
-        for i in range(1, len(data)):
-            # BUY signal: Price crosses below the lower band
-            if data['close'].iloc[i-1] > data[lower_band_col].iloc[i-1] and data['close'].iloc[i] <= data[lower_band_col].iloc[i]:
-                signals.append(self._create_signal(
-                    timestamp=data.index[i],
-                    signal_type="BUY",
-                    price=data['close'].iloc[i]
-                ))
-            # SELL signal: Price crosses above the upper band
-            elif data['close'].iloc[i-1] < data[upper_band_col].iloc[i-1] and data['close'].iloc[i] >= data[upper_band_col].iloc[i]:
-                signals.append(self._create_signal(
-                    timestamp=data.index[i],
-                    signal_type="SELL",
-                    price=data['close'].iloc[i]
-                ))
-        return signals
\ No newline at end of file
+    def stream_signals(self, data: pd.DataFrame) -> Iterator[Signal]:
+        # Calculate Bollinger Bands with the compiled kernel FeatureEngineer uses (pandas_ta's band values)
+        close = data['close'].to_numpy(dtype=np.float64)
+        lower, _, upper, _, _ = bbands(close, self._period, self._std_dev)
+        # Crossings between consecutive bars, flagged for all bars at once (entry k is bar k + 1)
+        # BUY signal: Price crosses below the lower band
+        buy = (close[:-1] > lower[:-1]) & (close[1:] <= lower[1:])
+        # SELL signal: Price crosses above the upper band (a bar that is a BUY is not also a SELL)
+        sell = (close[:-1] < upper[:-1]) & (close[1:] >= upper[1:]) & ~buy
+
+        for i in (np.flatnonzero(buy | sell) + 1).tolist():
+            yield self._create_signal(
+                timestamp=data.index[i],
+                signal_type="BUY" if buy[i - 1] else "SELL",
+                price=close[i]
+            )
\ No newline at end of file
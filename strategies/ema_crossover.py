@@ -1,9 +1,14 @@
-from typing import List
+from typing import Iterator
+import numpy as np
 import pandas as pd
-import pandas_ta as ta # Using pandas_ta for convenience
 from strategies.base_strategy import BaseStrategy, StrategyConfig
 from utils.data_structures import Signal
 from strategies import register_strategy
+try:
+    # Native build from strategies/_aot_build.py: no JIT compilation on first use
+    from strategies._aot_kernels import ema
+except ImportError:
+    from ai_models._ta_kernels import ema
 
 @register_strategy
 class EMACrossover(BaseStrategy):
@@ -19,47 +24,38 @@ class EMACrossover(BaseStrategy):
         "long_window": (int, 50, None),
     }
 
-    def generate_signals(self, data: pd.DataFrame) -> List[Signal]:
+    def __init__(self, config: StrategyConfig, symbol: str):
+        super().__init__(config, symbol)
+        # Validated parameters bound to attributes once, instead of dict lookups per call
+        self._short_window = config.params['short_window']
+        self._long_window = config.params['long_window']
+
+    def stream_signals(self, data: pd.DataFrame) -> Iterator[Signal]:
         """
-        Calculates EMAs and generates signals based on their crossover points.
+        Calculates EMAs and yields signals at their crossover points.
         """
-        # Ensure data is sorted by timestamp
-        data = data.sort_index()
-
-        # Get parameters from config
-        short_window = self.config.params['short_window']
-        long_window = self.config.params['long_window']
+        # Ensure data is sorted by timestamp (time series usually arrive sorted, so skip the sort then)
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
 
-        # Use pandas_ta to calculate EMAs
-        data.ta.ema(length=short_window, append=True)
-        data.ta.ema(length=long_window, append=True)
+        # Calculate EMAs with the compiled kernel (SMA-seeded, as pandas_ta computes them)
+        close = data['close'].to_numpy(dtype=np.float64)
         
         # Find crossover points
         # A positive value indicates short EMA is above long EMA (uptrend)
         # A negative value indicates short EMA is below long EMA (downtrend)
-        ema_diff = data[f'EMA_{short_window}'] - data[f'EMA_{long_window}']
+        ema_diff = ema(close, self._short_window) - ema(close, self._long_window)
         
         # A crossover occurs when the sign of the difference changes
-        # `np.sign` returns -1, 0, or 1. `diff()` calculates the change from the previous row.
-        # A change from -1 to 1 is a BUY signal (diff = 2).
-        # A change from 1 to -1 is a SELL signal (diff = -2).
-        crossover = ema_diff.apply(lambda x: 1 if x > 0 else -1).diff()
+        # The sign is taken as 1 (above) or -1 (not above, including NaN warm-up bars) in an int8 array,
+        # and its change from the previous row is 2 (-1 to 1, a BUY) or -2 (1 to -1, a SELL).
+        sign = np.where(ema_diff > 0, np.int8(1), np.int8(-1))
+        crossover = np.zeros_like(sign)
+        crossover[1:] = sign[1:] - sign[:-1]
 
-        signals = []
-        for i in range(len(crossover)):
-            if crossover.iloc[i] == 2: # BUY signal
-                signal = self._create_signal(
-                    timestamp=crossover.index[i],
-                    signal_type="BUY",
-                    price=data['close'].iloc[i]
-                )
-                signals.append(signal)
-            elif crossover.iloc[i] == -2: # SELL signal
-                signal = self._create_signal(
-                    timestamp=crossover.index[i],
-                    signal_type="SELL",
-                    price=data['close'].iloc[i]
-                )
-                signals.append(signal)
-                
-        return signals
\ No newline at end of file
+        for i in np.flatnonzero(crossover).tolist():
+            yield self._create_signal(
+                timestamp=data.index[i],
+                signal_type="BUY" if crossover[i] == 2 else "SELL",
+                price=close[i]
+            )
\ No newline at end of file
@@ -1,9 +1,14 @@
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
-from typing import List
-from strategies.base_strategy import BaseStrategy
+from typing import Iterator
+from strategies.base_strategy import BaseStrategy, StrategyConfig
 from utils.data_structures import Signal
 from strategies import register_strategy
+try:
+    # Native build from strategies/_aot_build.py: no JIT compilation on first use
+    from strategies._aot_kernels import zscore_crossings
+except ImportError:
+    from strategies._kernels import zscore_crossings
 
 @register_strategy
 class MeanReversion(BaseStrategy):
@@ -19,31 +24,21 @@ class MeanReversion(BaseStrategy):
         "z_score_threshold": (float, 2.0, None),
     }
 
-    def generate_signals(self, data: pd.DataFrame) -> List[Signal]:
-        # Calculate rolling mean and standard deviation
-        rolling_mean = data['close'].rolling(window=self.config.params['window']).mean()
-        rolling_std = data['close'].rolling(window=self.config.params['window']).std()
+    def __init__(self, config: StrategyConfig, symbol: str):
+        super().__init__(config, symbol)
+        # Validated parameters bound to attributes once, instead of dict lookups per call
+        self._window = config.params['window']
+        self._z_score_threshold = float(config.params['z_score_threshold'])
 
-        # Calculate Z-score
-        z_score = (data['close'] - rolling_mean) / rolling_std
+    def stream_signals(self, data: pd.DataFrame) -> Iterator[Signal]:
+        # Rolling Z-score and its threshold crossings in one compiled pass over the closes:
+        # BUY when it crosses below the negative threshold, SELL when it crosses above the positive one
+        close = data['close'].to_numpy(dtype=np.float64)
+        signal_code = zscore_crossings(close, self._window, self._z_score_threshold)
 
-        signals = []
-        for i in range(1, len(data)):
-            prev_z = z_score.iloc[i-1]
-            curr_z = z_score.iloc[i]
-
-            # BUY signal: Z-score crosses below the negative threshold
-            if prev_z > -self.config.params['z_score_threshold'] and curr_z <= -self.config.params['z_score_threshold']:
-                signals.append(self._create_signal(
-                    timestamp=data.index[i],
-                    signal_type="BUY",
-                    price=data['close'].iloc[i]
-                ))
-            # SELL signal: Z-score crosses above the positive threshold
-            elif prev_z < self.config.params['z_score_threshold'] and curr_z >= self.config.params['z_score_threshold']:
-                signals.append(self._create_signal(
-                    timestamp=data.index[i],
-                    signal_type="SELL",
-                    price=data['close'].iloc[i]
-                ))
-        return signals
\ No newline at end of file
+        for i in np.flatnonzero(signal_code).tolist():
+            yield self._create_signal(
+                timestamp=data.index[i],
+                signal_type="BUY" if signal_code[i] == 1 else "SELL",
+                price=close[i]
+            )
\ No newline at end of file
@@ -1,9 +1,14 @@
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
-from typing import List
-from strategies.base_strategy import BaseStrategy
+from typing import Iterator
+from strategies.base_strategy import BaseStrategy, StrategyConfig
 from utils.data_structures import Signal
 from strategies import register_strategy
+try:
+    # Native build from strategies/_aot_build.py: no JIT compilation on first use
+    from strategies._aot_kernels import rsi_wilder
+except ImportError:
+    from ai_models._ta_kernels import rsi_wilder
 
 @register_strategy
 class RSIStrategy(BaseStrategy):
@@ -20,28 +25,28 @@ class RSIStrategy(BaseStrategy):
         "overbought_threshold": (int, 70, 100),
     }
 
-    def generate_signals(self, data: pd.DataFrame) -> List[Signal]:
-        # Calculate RSI
-        data.ta.rsi(length=self.config.params['rsi_period'], append=True)
-        rsi_col = f"RSI_{self.config.params['rsi_period']}"
+    def __init__(self, config: StrategyConfig, symbol: str):
+        super().__init__(config, symbol)
+        # Validated parameters bound to attributes once, instead of dict lookups per call
+        self._period = config.params['rsi_period']
+        self._oversold = config.params['oversold_threshold']
+        self._overbought = config.params['overbought_threshold']
 
-        signals = []
-        for i in range(1, len(data)):
-            prev_rsi = data[rsi_col].iloc[i-1]
-            curr_rsi = data[rsi_col].iloc[i]
+    def stream_signals(self, data: pd.DataFrame) -> Iterator[Signal]:
+        oversold, overbought = self._oversold, self._overbought
+        # Calculate RSI with the compiled Wilder kernel FeatureEngineer uses (pandas_ta's RSI values)
+        close = data['close'].to_numpy(dtype=np.float64)
+        rsi = rsi_wilder(close, self._period)
+        # Crossings between consecutive bars, flagged for all bars at once (entry k is bar k + 1)
+        prev_rsi, curr_rsi = rsi[:-1], rsi[1:]
+        # BUY signal: RSI crosses above oversold threshold
+        buy = (prev_rsi <= oversold) & (curr_rsi > oversold)
+        # SELL signal: RSI crosses below overbought threshold (a bar that is a BUY is not also a SELL)
+        sell = (prev_rsi >= overbought) & (curr_rsi < overbought) & ~buy
 
-            # BUY signal: RSI crosses above oversold threshold
-            if prev_rsi <= self.config.params['oversold_threshold'] and curr_rsi > self.config.params['oversold_threshold']:
-                signals.append(self._create_signal(
-                    timestamp=data.index[i],
-                    signal_type="BUY",
-                    price=data['close'].iloc[i]
-                ))
-            # SELL signal: RSI crosses below overbought threshold
-            elif prev_rsi >= self.config.params['overbought_threshold'] and curr_rsi < self.config.params['overbought_threshold']:
-                signals.append(self._create_signal(
-                    timestamp=data.index[i],
-                    signal_type="SELL",
-                    price=data['close'].iloc[i]
-                ))
-        return signals
\ No newline at end of file
+        for i in (np.flatnonzero(buy | sell) + 1).tolist():
+            yield self._create_signal(
+                timestamp=data.index[i],
+                signal_type="BUY" if buy[i - 1] else "SELL",
+                price=close[i]
+            )
\ No newline at end of file
@@ -12,7 +12,55 @@ from datetime import datetime
 from pathlib import Path
 # Import the new strategy to ensure it's registered
 import strategies.ai_strategy
+
+def test_ai_strategy_with_saved_lightgbm_model():
+    """Builds the AI strategy from a LightGBM model saved to and reloaded from a registry."""
+    import tempfile
+    import numpy as np
+    import pandas as pd
+    from lightgbm import LGBMClassifier
+    from ai_models.feature_engineering import FeatureEngineer
+    from ai_models.model_registry import ModelRegistry
+    from strategies.ai_strategy import AIStrategy
+    from strategies.base_strategy import StrategyConfig
+
+    print("--- Testing AI Strategy with a freshly saved LightGBM model ---")
+    # 1. Synthetic daily bars and their features
+    rng = np.random.default_rng(0)
+    n = 300
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    data = pd.DataFrame({
+        'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close,
+        'volume': rng.uniform(1e5, 1e6, n),
+    }, index=pd.date_range('2022-01-01', periods=n, freq='D', tz='UTC', name='timestamp'))
+    feature_df = FeatureEngineer().generate_features(data).dropna()
+    feature_cols = feature_df.columns.drop('target')
+
+    # 2. Train, save to a scratch registry and load back (the native-format wrapper)
+    model = LGBMClassifier(n_estimators=20, verbose=-1).fit(feature_df[feature_cols], feature_df['target'])
+    with tempfile.TemporaryDirectory() as registry_dir:
+        registry = ModelRegistry(registry_path=registry_dir)
+        registry.save_model(model, "TEST_1d_lgbm", metrics={"features_used": list(feature_cols)})
+        loaded = registry.load_latest_model("TEST_1d_lgbm")
+
+    # 3. Serve the reloaded model to the strategy instead of the default registry
+    original_load_model = AIStrategy.__dict__['_load_model']
+    AIStrategy._load_model = staticmethod(lambda model_name: loaded)
+    try:
+        config = StrategyConfig(name="ai_strategy", params={"model_name": "TEST_1d_lgbm", "confidence_threshold": 0.5})
+        strategy = AIStrategy(config, symbol='TEST')
+        signals = strategy.generate_signals(data)
+    finally:
+        AIStrategy._load_model = original_load_model
+
+    assert list(strategy._classes) == [0, 1], "Strategy did not pick up the model's classes."
+    assert len(signals) > 0, "No signals were generated."
+    assert {s.signal_type for s in signals} <= {'BUY', 'SELL'}, "Unexpected signal type."
+    print(f"✅ Generated {len(signals)} signals from the reloaded LightGBM model.")
+
 if __name__ == "__main__":
+    test_ai_strategy_with_saved_lightgbm_model()
+
     print("--- Backtesting AI-Driven Strategy ---")
     
     # 1. Initialize the backtester
@@ -47,7 +95,7 @@ if __name__ == "__main__":
             print(f"  Sharpe Ratio: {metrics['sharpe_ratio']:.2f}")
             
             # 3. Generate analytics report
-            results_path = Path(__file__).parent / "backtest" / "results" / f"{strategy_name}_{symbol}_{interval}.csv"
+            results_path = Path(__file__).parent / "backtest" / "results" / f"{strategy_name}_{symbol}_{interval}.parquet"
             if results_path.exists():
                 analytics_engine = Analytics(results_path)
                 analytics_engine.generate_report()
@@ -1,11 +1,10 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime
 from data.data_processor import DataProcessor
 
 def create_test_data() -> pd.DataFrame:
     """Creates a DataFrame with various data quality issues."""
-    dates = pd.to_datetime([datetime(2023, 1, i) for i in range(1, 11)], utc=True)
+    dates = pd.date_range('2023-01-01', periods=10, freq='D', tz='UTC', name='timestamp')
     data = {
         'open':   [150, 151, 152, np.nan, 154, 155, 156, 157, 158, 159],
         'high':   [152, 153, 154, 155, 153, 157, 158, 159, 160, 161],  # 2023-01-05 has high < low
@@ -14,7 +13,6 @@ def create_test_data() -> pd.DataFrame:
         'volume': [1000, 1200, 800, 900, 1000, 50000, -50, 1300, 1400, 1500]  # Volume outlier and negative
     }
     df = pd.DataFrame(data, index=dates)
-    df.index.name = 'timestamp'
     return df
 
 if __name__ == "__main__":
@@ -0,0 +1,71 @@
+import threading
+import numpy as np
+from datetime import datetime
+
+from utils.data_structures import Signal
+from execution.risk_manager import RiskManager
+from execution.live_integration import BaseLiveAdapter, LiveTrader
+
+class MockAdapter(BaseLiveAdapter):
+    """Broker stand-in with a fixed account that records the orders placed."""
+    def __init__(self, equity: float, cash: float):
+        super().__init__("Mock")
+        self.account = {'equity': equity, 'cash': cash}
+        self.orders = []
+        self.account_requests = 0
+        self._lock = threading.Lock() # Orders are placed from worker threads
+
+    def place_order(self, symbol, order_type, quantity, side):
+        with self._lock:
+            self.orders.append((symbol, order_type, quantity, side))
+        return {'status': 'accepted', 'symbol': symbol, 'qty': quantity, 'side': side}
+
+    def get_open_positions(self):
+        return []
+
+    def get_account_balance(self):
+        self.account_requests += 1
+        return self.account
+
+    def get_latest_price(self, symbol):
+        return 0.0
+
+def make_signal(symbol, signal_type, price):
+    return Signal(timestamp=datetime(2024, 1, 2, 15, 30), symbol=symbol, strategy='test_strategy',
+                  signal_type=signal_type, price=price)
+
+def test_process_signals_sizes_serially_and_places_all_orders():
+    print("--- Testing LiveTrader.process_signals with a mock adapter ---")
+    adapter = MockAdapter(equity=100_000.0, cash=30_000.0)
+    risk_manager = RiskManager(max_portfolio_risk_per_trade=0.01, max_position_exposure=0.10,
+                               daily_drawdown_limit=0.05, overall_drawdown_limit=0.15)
+    trader = LiveTrader(adapter, risk_manager)
+    signals = [make_signal(symbol, 'BUY', 100.0) for symbol in ['AAPL', 'MSFT', 'GOOG', 'TSLA']]
+
+    confirmations = trader.process_signals(signals)
+
+    # One account request for the whole batch
+    assert adapter.account_requests == 1, "The account was fetched more than once."
+    # Each buy is capped at 10% exposure ($10,000 = 100 shares) and spends the cash left by
+    # the ones before it: $30,000 -> $20,000 -> $10,000 (99 shares, 1% buffer) -> $100 (too small)
+    assert [c['symbol'] for c in confirmations] == ['AAPL', 'MSFT', 'GOOG'], "Wrong orders placed."
+    assert np.allclose([c['qty'] for c in confirmations], [100.0, 100.0, 99.0]), "Orders sized wrongly."
+    assert sorted(order[0] for order in adapter.orders) == ['AAPL', 'GOOG', 'MSFT'], "Not every order reached the adapter."
+    assert all(order[1] == 'market' and order[3] == 'buy' for order in adapter.orders), "Wrong order type or side."
+    print("✅ process_signals sized and placed every order!")
+
+def test_process_signals_halted_by_circuit_breaker():
+    print("--- Testing LiveTrader.process_signals under a tripped circuit breaker ---")
+    adapter = MockAdapter(equity=80_000.0, cash=30_000.0)
+    risk_manager = RiskManager(max_portfolio_risk_per_trade=0.01, max_position_exposure=0.10,
+                               daily_drawdown_limit=0.05, overall_drawdown_limit=0.15)
+    risk_manager.check_circuit_breakers(100_000.0) # Earlier high-water mark: now down 20%
+    trader = LiveTrader(adapter, risk_manager)
+
+    assert trader.process_signals([make_signal('AAPL', 'BUY', 100.0)]) == [], "Orders placed while halted."
+    assert adapter.orders == [], "The adapter received orders while halted."
+    print("✅ process_signals placed nothing while halted!")
+
+if __name__ == "__main__":
+    test_process_signals_sizes_serially_and_places_all_orders()
+    test_process_signals_halted_by_circuit_breaker()
@@ -0,0 +1,34 @@
+import tempfile
+import numpy as np
+import pandas as pd
+from lightgbm import LGBMClassifier
+from sklearn.datasets import make_classification
+
+from ai_models.model_registry import ModelRegistry, LightGBMBoosterModel
+
+def test_lightgbm_round_trip():
+    print("--- Testing LightGBM save/load round trip ---")
+
+    # 1. Train a small binary classifier on named features, as the trainer does
+    X, y = make_classification(n_samples=200, n_features=6, random_state=42)
+    X = pd.DataFrame(X, columns=[f"feature_{i}" for i in range(X.shape[1])])
+    model = LGBMClassifier(n_estimators=20, verbose=-1).fit(X, y)
+
+    with tempfile.TemporaryDirectory() as registry_dir:
+        # 2. Save it to a scratch registry and load it back
+        registry = ModelRegistry(registry_path=registry_dir)
+        registry.save_model(model, "TEST_1d_lgbm", metrics={"accuracy": 1.0})
+        loaded_model, metadata = registry.load_latest_model("TEST_1d_lgbm")
+
+        # 3. The native-format wrapper must stand in for the classifier
+        assert isinstance(loaded_model, LightGBMBoosterModel), "LightGBM model was not stored in native format."
+        assert metadata['serializer'] == 'lightgbm_txt', "Metadata has the wrong serializer."
+        assert np.array_equal(loaded_model.classes_, model.classes_), "classes_ mismatch after reload."
+        assert loaded_model.n_features_in_ == model.n_features_in_, "n_features_in_ mismatch after reload."
+        probabilities = loaded_model.predict_proba(X)
+        assert probabilities.shape == (len(X), 2), "predict_proba has the wrong shape."
+        assert np.allclose(probabilities, model.predict_proba(X)), "Predictions changed after reload."
+    print("✅ LightGBM round trip passed!")
+
+if __name__ == "__main__":
+    test_lightgbm_round_trip()
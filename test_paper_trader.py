@@ -0,0 +1,44 @@
+import numpy as np
+from datetime import datetime, timedelta
+
+from utils.data_structures import Signal
+from execution.paper_trader import PaperTrader
+
+TRADER_PARAMS = dict(initial_capital=100_000.0, commission=1.0, slippage=0.001, risk_per_trade=0.1)
+
+def random_signals(rng, count):
+    """Random BUY/SELL/HOLD signals over a few symbols, including sells of unopened positions."""
+    start = datetime(2024, 1, 1)
+    return [
+        Signal(timestamp=start + timedelta(minutes=i), symbol=str(rng.choice(['AAPL', 'MSFT', 'GOOG', 'TSLA'])),
+               strategy='test_strategy', signal_type=str(rng.choice(['BUY', 'SELL', 'HOLD'], p=[0.5, 0.3, 0.2])),
+               price=float(rng.uniform(50, 500)))
+        for i in range(count)
+    ]
+
+def test_run_multi_matches_sequential_runs():
+    print("--- Testing PaperTrader.run_multi against sequential runs ---")
+    rng = np.random.default_rng(7)
+    # Open some positions first, so the streams start from a non-empty portfolio
+    prelude = random_signals(rng, 20)
+    signal_batches = [random_signals(rng, int(rng.integers(0, 60))) for _ in range(8)]
+
+    trader = PaperTrader(**TRADER_PARAMS)
+    trader.run(prelude)
+    cash_before, portfolio_before = trader.cash, trader.portfolio
+    final_cash = trader.run_multi(signal_batches)
+
+    # Each stream must end where a separate trader in the same starting state ends
+    for batch, cash in zip(signal_batches, final_cash):
+        reference = PaperTrader(**TRADER_PARAMS)
+        reference.run(prelude)
+        reference.run(batch)
+        assert np.isclose(cash, reference.cash), f"Final cash {cash} != sequential {reference.cash}."
+
+    # The trader itself is left untouched
+    assert trader.cash == cash_before, "run_multi changed the trader's cash."
+    assert trader.portfolio == portfolio_before, "run_multi changed the trader's positions."
+    print("✅ run_multi matches sequential runs!")
+
+if __name__ == "__main__":
+    test_run_multi_matches_sequential_runs()
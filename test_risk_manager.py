@@ -0,0 +1,47 @@
+import numpy as np
+
+from execution.risk_manager import RiskManager
+
+def make_risk_manager():
+    return RiskManager(max_portfolio_risk_per_trade=0.02, max_position_exposure=0.10,
+                       daily_drawdown_limit=0.05, overall_drawdown_limit=0.15)
+
+def check_sequentially(risk_manager, values, day_starts):
+    """The bar-by-bar checks check_circuit_breakers_series stands in for."""
+    day_starts = set(day_starts.tolist())
+    for i, value in enumerate(values):
+        if i in day_starts:
+            risk_manager.reset_daily_limits()
+        if risk_manager.check_circuit_breakers(float(value)):
+            return i
+    return -1
+
+def test_circuit_breakers_series_matches_sequential_checks():
+    print("--- Testing check_circuit_breakers_series against sequential checks ---")
+    rng = np.random.default_rng(11)
+    halted = 0
+    for _ in range(200):
+        # A random walk equity curve with random day boundaries (sometimes at bar 0)
+        n = int(rng.integers(1, 120))
+        values = 100_000.0 * np.cumprod(1 + rng.normal(0, 0.015, n))
+        day_starts = np.sort(rng.choice(n, size=int(rng.integers(0, max(1, n // 10) + 1)), replace=False))
+        # Half the runs carry high-water marks over from earlier checks
+        warmup = 100_000.0 * (1 + rng.uniform(-0.05, 0.1, int(rng.integers(0, 2) * 5)))
+
+        batch, sequential = make_risk_manager(), make_risk_manager()
+        for value in warmup:
+            batch.check_circuit_breakers(float(value))
+            sequential.check_circuit_breakers(float(value))
+
+        first = batch.check_circuit_breakers_series(values, day_starts)
+        expected = check_sequentially(sequential, values, day_starts)
+        assert first == expected, f"First halt at {first}, sequential checks halt at {expected}."
+        assert np.isclose(batch.daily_high_value, sequential.daily_high_value), "Daily high-water mark differs."
+        assert np.isclose(batch.overall_high_value, sequential.overall_high_value), "Overall high-water mark differs."
+        halted += first >= 0
+    # Both outcomes must have been exercised
+    assert 0 < halted < 200, f"{halted} of 200 random curves halted; the comparison is one-sided."
+    print("✅ check_circuit_breakers_series matches sequential checks!")
+
+if __name__ == "__main__":
+    test_circuit_breakers_series_matches_sequential_checks()
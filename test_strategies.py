@@ -3,6 +3,7 @@ from strategies.base_strategy import StrategyConfig
 from data.data_storage import DataStorage
 from utils.config_loader import config as global_config
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 
 # Import all new strategy modules to ensure they are registered
 import strategies.ema_crossover
@@ -32,7 +33,7 @@ def run_strategy_test(strategy_name: str, data: pd.DataFrame):
     strategy = StrategyClass(config, symbol='AAPL')
     
     # 4. Generate signals
-    signals = strategy.generate_signals(data.copy()) # Pass a copy to avoid modifying original data
+    signals = strategy.generate_signals(data) # Strategies only read the data, so no copy is needed
     print(f"Generated {len(signals)} signals for {strategy_name}.")
     
     # 5. Validate
@@ -56,5 +57,7 @@ if __name__ == "__main__":
         "mean_reversion"
     ]
     
-    for strategy_name in strategies_to_test:
-        run_strategy_test(strategy_name, aapl_data)
\ No newline at end of file
+    # The strategies are independent and only read the data, so they run concurrently;
+    # list() re-raises the first failed test
+    with ThreadPoolExecutor(max_workers=len(strategies_to_test)) as executor:
+        list(executor.map(lambda name: run_strategy_test(name, aapl_data), strategies_to_test))
\ No newline at end of file
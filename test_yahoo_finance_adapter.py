@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from unittest.mock import patch
+
+from data.api_adapters import yahoo_finance_adapter
+from data.api_adapters.yahoo_finance_adapter import YahooFinanceAdapter
+
+FIELDS = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+
+def grouped_download(symbols, index):
+    """A multi-symbol `yf.download(..., group_by='ticker')` result with (ticker, field) columns."""
+    columns = pd.MultiIndex.from_product([symbols, FIELDS], names=['Ticker', 'Price'])
+    values = np.arange(len(index) * len(columns), dtype=np.float64).reshape(len(index), len(columns))
+    return pd.DataFrame(values, index=index, columns=columns)
+
+def test_fetch_historical_data_batch():
+    print("--- Testing YahooFinanceAdapter.fetch_historical_data_batch with a stubbed download ---")
+    index = pd.DatetimeIndex(pd.date_range('2024-01-02', periods=5, freq='B'), name='Date')
+    download = grouped_download(['AAPL', 'MSFT', 'TSLA'], index)
+    download['MSFT'] = np.nan # A ticker yfinance failed to fetch comes back all-NaN
+    download.loc[index[0], 'TSLA'] = np.nan # A single missing bar is dropped, not the symbol
+
+    adapter = YahooFinanceAdapter()
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 9)
+    with patch.object(yahoo_finance_adapter.yf, 'download', return_value=download) as mock_download:
+        results = adapter.fetch_historical_data_batch(['AAPL', 'MSFT', 'TSLA', 'NOPE'], start, end)
+
+    # One request for every symbol
+    mock_download.assert_called_once()
+    assert mock_download.call_args.args[0] == "AAPL MSFT TSLA NOPE", "Symbols not requested together."
+    assert set(results) == {'AAPL', 'MSFT', 'TSLA', 'NOPE'}, "A symbol is missing from the results."
+
+    # Each symbol's frame matches what the single-symbol path would standardize
+    expected = adapter._standardize_dataframe(download['AAPL'].copy())
+    pd.testing.assert_frame_equal(results['AAPL'], expected)
+    assert list(results['AAPL'].columns) == ['open', 'high', 'low', 'close', 'volume'], "Columns not standardized."
+    assert str(results['AAPL'].index.tz) == 'UTC', "Index not converted to UTC."
+    assert len(results['TSLA']) == len(index) - 1, "Rows of a partly missing symbol were not kept."
+    assert results['MSFT'].empty and results['NOPE'].empty, "Symbols without data should be empty."
+
+    # A failed request leaves every symbol empty
+    with patch.object(yahoo_finance_adapter.yf, 'download', side_effect=RuntimeError("rate limited")):
+        results = adapter.fetch_historical_data_batch(['AAPL', 'MSFT'], start, end)
+    assert all(df.empty for df in results.values()), "A failed download should return empty frames."
+    print("✅ fetch_historical_data_batch passed!")
+
+if __name__ == "__main__":
+    test_fetch_historical_data_batch()
@@ -8,26 +8,31 @@ from dotenv import load_dotenv
 # This pattern will look for ${VAR_NAME} or $VAR_NAME
 ENV_VAR_PATTERN = re.compile(r'\$\{(\w+)\}|\$(\w+)')
 
+def _replace_env_var(match):
+    """Returns the value of the environment variable named by a ${VAR} or $VAR match."""
+    # Handles both ${VAR} and $VAR formats
+    var_name = match.group(1) or match.group(2)
+    env_var = os.getenv(var_name)
+    if env_var is None:
+        raise ValueError(
+            f"Configuration Error: Environment variable '{var_name}' "
+            "is referenced in config.yaml but not set."
+        )
+    return env_var
+
 def substitute_env_vars(config):
     """
-    Recursively substitutes environment variables in the config dictionary.
+    Substitutes environment variables in the config dictionary and all nested
+    dictionaries, in place. Nested dictionaries are walked with an explicit stack.
     """
-    for key, value in config.items():
-        if isinstance(value, dict):
-            substitute_env_vars(value)
-        elif isinstance(value, str):
-            def replace_match(match):
-                # Handles both ${VAR} and $VAR formats
-                var_name = match.group(1) or match.group(2)
-                env_var = os.getenv(var_name)
-                if env_var is None:
-                    raise ValueError(
-                        f"Configuration Error: Environment variable '{var_name}' "
-                        "is referenced in config.yaml but not set."
-                    )
-                return env_var
-            
-            config[key] = ENV_VAR_PATTERN.sub(replace_match, value)
+    stack = [config]
+    while stack:
+        node = stack.pop()
+        for key, value in list(node.items()):
+            if isinstance(value, dict):
+                stack.append(value)
+            elif isinstance(value, str) and '$' in value: # Strings without a '$' have nothing to substitute
+                node[key] = ENV_VAR_PATTERN.sub(_replace_env_var, value)
     return config
 
 @lru_cache(maxsize=None)
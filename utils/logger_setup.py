@@ -1,18 +1,148 @@
+"""
+Structured JSON logging for the signal, trade and error logs.
+
+Performance guidance:
+    A call below the logger's level returns early, but its arguments, including
+    the `extra` dict, are still built. On hot paths, guard calls that build
+    extras with the level check so nothing is constructed when the record would
+    be dropped:
+
+        if trade_logger.isEnabledFor(logging.INFO):
+            trade_logger.info("Paper trade executed", extra={"extra_data": {...}})
+
+    Pass a constant message with the data in extra_data (or use %-style args,
+    not f-strings): a message without args is written as is, skipping the
+    `msg % args` formatting.
+"""
+import atexit
 import logging
 import logging.handlers
-import json
+import queue
+import threading
+import time
+import orjson
+from functools import lru_cache
+from json.encoder import encode_basestring
 from pathlib import Path
 from typing import Dict
-from datetime import datetime
-import pandas as pd
 
 # Import the global config object from our config loader
 from utils.config_loader import config
 
+# Log directory and rotation settings, resolved once from the central configuration
+_LOG_DIR = Path(__file__).resolve().parent.parent / "logs"
+_log_config = config.get("logging", {
+    "max_bytes": 20 * 1024 * 1024,  # Default 20MB
+    "backup_count": 5
+})
+_MAX_BYTES = int(_log_config["max_bytes"])
+_BACKUP_COUNT = int(_log_config["backup_count"])
+
+# Size of each log file's write buffer; records below WARNING are written when it fills
+LOG_BUFFER_BYTES = 1 << 16
+# Interval at which buffered records are flushed to the log files regardless
+LOG_FLUSH_INTERVAL_SEC = 0.5
+
+def _json_default(obj):
+    """
+    orjson hook for the types it does not encode itself; it is only called for those,
+    so extras are passed to orjson as they are instead of being copied and converted.
+    """
+    # Duck-typed, so the logger does not import pandas/numpy: isoformat() covers
+    # pd.Timestamp and date/time subclasses, item() numpy scalars orjson passes on
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if hasattr(obj, 'dtype') and hasattr(obj, 'item'):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _message(record: logging.LogRecord) -> str:
+    """record.getMessage(), without the `msg % args` step for a str message with no args."""
+    if not record.args and isinstance(record.msg, str):
+        return record.msg
+    return record.getMessage()
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener's handlers. The queue never
+    leaves the process, so only the message is merged with its args (which may be
+    mutated after the call); exc_info is kept for the structured formatter.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = _message(record)
+        record.args = None
+        return record
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that writes through a LOG_BUFFER_BYTES buffer instead of
+    flushing every record: records are written as UTF-8 to a buffered binary file,
+    WARNING and above are flushed immediately and the rest are left to the buffer
+    (setup_logging flushes the handlers every LOG_FLUSH_INTERVAL_SEC).
+    """
+    def _open(self):
+        stream = open(self.baseFilename, self.mode + 'b', buffering=LOG_BUFFER_BYTES)
+        # Size of the file, tracked from here on as records are written (also after a rollover,
+        # which reopens the file), so the rollover check needs no tell() per record
+        self._bytes_written = stream.tell()
+        return stream
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            # Formatted once, for both the size check and the write; the structured
+            # formatter returns the encoded line itself
+            format_line = getattr(self.formatter, 'format_line', None)
+            if format_line is not None:
+                msg = format_line(record)
+            else:
+                msg = (self.format(record) + self.terminator).encode('utf-8')
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._bytes_written + len(msg) >= self.maxBytes:
+                self.doRollover()
+            self.stream.write(msg)
+            self._bytes_written += len(msg)
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+class _AppLogger(logging.Logger):
+    """
+    Logger class of the signal, trade and error loggers. The JSON records never
+    include the caller, so findCaller skips the stack walk on every call.
+    """
+    def findCaller(self, stack_info=False, stacklevel=1):
+        return "(unknown file)", 0, "(unknown function)", None
+
+def _get_app_logger(name: str) -> logging.Logger:
+    """logging.getLogger(name), creating the logger as an _AppLogger without changing the class of any other logger."""
+    logger_class = logging.getLoggerClass()
+    logging.setLoggerClass(_AppLogger)
+    try:
+        return logging.getLogger(name)
+    finally:
+        logging.setLoggerClass(logger_class)
+
+def _flush_periodically(handlers: list, interval: float):
+    """Flushes the handlers every `interval` seconds, in a daemon thread, for the life of the process."""
+    def run():
+        while True:
+            time.sleep(interval)
+            for handler in handlers:
+                handler.flush()
+    threading.Thread(target=run, name="log-flush", daemon=True).start()
+
 def setup_logging() -> Dict[str, logging.Logger]:
     """
     Configures and returns structured loggers for the application.
 
+    The loggers only put records on a queue; one background QueueListener thread
+    formats them and writes the log files, so callers never wait on file I/O or
+    rotation. The listener is stopped, flushing the queue, at interpreter exit.
+    Log files are written through a buffer and flushed every LOG_FLUSH_INTERVAL_SEC
+    (at once for WARNING and above).
+
     Returns:
         Dict[str, logging.Logger]: A dictionary of configured loggers:
             - 'signal_logger': For trading signals
@@ -20,74 +150,119 @@ def setup_logging() -> Dict[str, logging.Logger]:
             - 'error_logger': For errors and warnings
     """
     # Ensure logs directory exists
-    log_dir = Path(__file__).parent.parent / "logs"
-    log_dir.mkdir(exist_ok=True)
-
-    # Load logging config from our central configuration
-    log_config = config.get("logging", {
-        "max_bytes": 20 * 1024 * 1024,  # Default 20MB
-        "backup_count": 5
-    })
+    _LOG_DIR.mkdir(exist_ok=True)
 
     # Custom formatter that outputs JSON
     class StructuredMessageFormatter(logging.Formatter):
-        def format(self, record: logging.LogRecord) -> str:
+        # (whole second, formatted time) of the last record; the time format has no
+        # sub-second fields, so records within the same second share the string
+        _time_cache = (None, '')
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._prefixes = {}
+
+        def formatTime(self, record: logging.LogRecord, datefmt=None) -> str:
+            second = int(record.created)
+            cached_second, formatted = self._time_cache
+            if second != cached_second:
+                formatted = super().formatTime(record, datefmt)
+                self._time_cache = (second, formatted)
+            return formatted
+
+        def _fields_prefix(self, record: logging.LogRecord) -> str:
+            """The JSON between the timestamp and the message value, built once per logger and level."""
+            key = (record.name, record.levelname)
+            prefix = self._prefixes.get(key)
+            if prefix is None:
+                prefix = self._prefixes[key] = (
+                    f'","module":{encode_basestring(record.name)},"level":{encode_basestring(record.levelname)},"message":'
+                )
+            return prefix
+
+        def format_line(self, record: logging.LogRecord) -> bytes:
+            """
+            The record as a UTF-8 JSON line, newline included; BufferedRotatingFileHandler
+            writes it as is, with no str concatenation or re-encoding.
+            """
+            if not hasattr(record, 'extra_data') and not record.exc_info:
+                # Plain message: the line is the precomputed fields plus the escaped
+                # message, without building a dict for the encoder
+                return ('{"timestamp":"' + self.formatTime(record, self.datefmt) + self._fields_prefix(record)
+                        + encode_basestring(_message(record)) + '}\n').encode('utf-8')
+
             log_data = {
                 "timestamp": self.formatTime(record, self.datefmt),
                 "module": record.name,
                 "level": record.levelname,
-                "message": record.getMessage(),
+                "message": _message(record),
             }
 
             if hasattr(record, 'extra_data'):
-                def serialize(obj):
-                    if isinstance(obj, (datetime, pd.Timestamp)):
-                        return obj.isoformat()
-                    if isinstance(obj, dict):
-                        return {k: serialize(v) for k, v in obj.items()}
-                    if isinstance(obj, list):
-                        return [serialize(i) for i in obj]
-                    return obj
-
-                log_data["extra_data"] = serialize(record.extra_data)
+                log_data["extra_data"] = record.extra_data
 
             if record.exc_info:
                 log_data['exc_info'] = self.formatException(record.exc_info)
 
-            return json.dumps(log_data)
+            # orjson encodes datetimes and numpy scalars natively; pd.Timestamp goes through _json_default
+            return orjson.dumps(log_data, default=_json_default,
+                                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+
+        def format(self, record: logging.LogRecord) -> str:
+            return self.format_line(record)[:-1].decode('utf-8')
 
     # Configure log handlers
     def make_handler(log_name: str) -> logging.Handler:
-        handler = logging.handlers.RotatingFileHandler(
-            filename=log_dir / f"{log_name}.log",
-            maxBytes=log_config["max_bytes"],
-            backupCount=log_config["backup_count"]
+        handler = BufferedRotatingFileHandler(
+            filename=_LOG_DIR / f"{log_name}.log",
+            maxBytes=_MAX_BYTES,
+            backupCount=_BACKUP_COUNT
         )
         handler.setFormatter(StructuredMessageFormatter(datefmt='%Y-%m-%dT%H:%M:%S%z'))
         return handler
 
     # Create and configure loggers
     loggers = {
-        "signal_logger": logging.getLogger("signals"),
-        "trade_logger": logging.getLogger("trades"),
-        "error_logger": logging.getLogger("errors")
+        "signal_logger": _get_app_logger("signals"),
+        "trade_logger": _get_app_logger("trades"),
+        "error_logger": _get_app_logger("errors")
     }
 
+    log_queue = queue.SimpleQueue()
+    file_handlers = []
     for name, logger in loggers.items():
         if not logger.handlers:
             logger.setLevel(logging.INFO)
             handler_name = name.replace('_logger', '')
-            logger.addHandler(make_handler(handler_name))
+            file_handler = make_handler(handler_name)
+            # All loggers share the queue; each file only takes its own logger's records
+            file_handler.addFilter(logging.Filter(logger.name))
+            file_handlers.append(file_handler)
+            logger.addHandler(_RecordQueueHandler(log_queue))
             logger.propagate = False
 
+    if file_handlers:
+        listener = logging.handlers.QueueListener(log_queue, *file_handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        _flush_periodically(file_handlers, LOG_FLUSH_INTERVAL_SEC)
+
     return loggers
 
 # Initialize loggers once when this module is imported
 _loggers = setup_logging()
 
+# The loggers for direct import, e.g. `from utils.logger_setup import signal_logger`
+signal_logger = _loggers['signal_logger']
+trade_logger = _loggers['trade_logger']
+error_logger = _loggers['error_logger']
+
+@lru_cache(maxsize=4)
 def get_logger(log_type: str) -> logging.Logger:
     """
-    Public interface to get a pre-configured logger.
+    Public interface to get a pre-configured logger. Each valid log type is
+    resolved once; signal_logger, trade_logger and error_logger can also be
+    imported directly.
 
     Args:
         log_type (str): One of 'signal', 'trade', or 'error'